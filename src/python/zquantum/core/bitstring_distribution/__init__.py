@@ -5,6 +5,7 @@ from ._bitstring_distribution import (
     are_keys_binary_strings,
     create_bitstring_distribution_from_probability_distribution,
     evaluate_distribution_distance,
+    evaluate_distribution_distances,
     is_bitstring_distribution,
     is_key_length_fixed,
     is_non_negative,
@@ -17,7 +18,12 @@ from ._bitstring_distribution import (
 )
 from .distance_measures import (
     compute_clipped_negative_log_likelihood,
+    compute_clipped_negative_log_likelihood_batch,
+    compute_jensen_shannon_divergence,
+    compute_jensen_shannon_divergence_batch,
     compute_mmd,
+    compute_mmd_batch,
     compute_multi_rbf_kernel,
     compute_rbf_kernel,
+    estimate_mmd_with_random_features,
 )
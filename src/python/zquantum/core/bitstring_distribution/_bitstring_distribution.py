@@ -3,18 +3,46 @@ import math
 import sys
 import warnings
 from collections import Counter
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, cast
 
 import numpy as np
 
 from ..typing import AnyPath
 from ..utils import SCHEMA_VERSION
+from .distance_measures import (
+    compute_clipped_negative_log_likelihood,
+    compute_clipped_negative_log_likelihood_batch,
+    compute_jensen_shannon_divergence,
+    compute_jensen_shannon_divergence_batch,
+    compute_mmd,
+    compute_mmd_batch,
+)
+
+# Largest number of qubits for which bitstrings can be indexed with int64.
+_MAX_N_QUBITS_FOR_INDICES = 63
+
+# Distance measures which can score a whole batch of measured distributions at once.
+_BATCHED_DISTANCE_MEASURES: Dict[Callable, Callable] = {
+    compute_clipped_negative_log_likelihood: (
+        compute_clipped_negative_log_likelihood_batch
+    ),
+    compute_jensen_shannon_divergence: compute_jensen_shannon_divergence_batch,
+    compute_mmd: compute_mmd_batch,
+}
 
 
 class BitstringDistribution:
     """A probability distribution defined on discrete bitstrings. Normalization is
     performed by default, unless otherwise specified.
 
+    Besides a dictionary, the distribution can be created from NumPy arrays with
+    from_probability_vector (dense, one probability per basis state) or
+    from_sparse_arrays (sorted indices of basis states with their probabilities).
+    Array-backed distributions are validated without looking at individual keys,
+    and their dictionary is only built when distribution_dict is accessed. Index i
+    corresponds to the bitstring whose k-th character is the k-th least significant
+    bit of i, as in create_bitstring_distribution_from_probability_distribution.
+
     Args:
         input_dict:  dictionary representing the probability distribution where
             the keys are bitstrings represented as strings and the values are
@@ -27,6 +55,13 @@ class BitstringDistribution:
             values are non-negative floats.
     """
 
+    # Distributions created from arrays keep them until distribution_dict is
+    # accessed, and _distribution_dict is None until then.
+    _distribution_dict: Optional[Dict]
+    _indices: Optional[np.ndarray]
+    _probabilities: Optional[np.ndarray]
+    _n_qubits: Optional[int]
+
     def __init__(self, input_dict: Dict, normalize: bool = True):
         if is_bitstring_distribution(
             input_dict
@@ -48,6 +83,131 @@ class BitstringDistribution:
                 " (same-length binary strings) and values (non-negative floats)."
             )
 
+    @classmethod
+    def from_probability_vector(
+        cls, probabilities: np.ndarray, normalize: bool = True
+    ) -> "BitstringDistribution":
+        """Create a distribution from the probabilities of all basis states.
+
+        Args:
+            probabilities: array of length 2^n, where entry i is the probability of
+                the bitstring corresponding to index i.
+            normalize: whether the probabilities get normalized or not.
+        """
+        probabilities = np.asarray(probabilities, dtype=float).ravel()
+        size = len(probabilities)
+        if size == 0 or size & (size - 1) != 0:
+            raise RuntimeError(
+                "Initialization of BitstringDistribution object FAILED: the number of"
+                " probabilities is not a power of two."
+            )
+        return cls._from_arrays(None, probabilities, size.bit_length() - 1, normalize)
+
+    @classmethod
+    def from_sparse_arrays(
+        cls,
+        indices: np.ndarray,
+        probabilities: np.ndarray,
+        n_qubits: int,
+        normalize: bool = True,
+    ) -> "BitstringDistribution":
+        """Create a distribution from the probabilities of some of the basis states.
+
+        Args:
+            indices: strictly increasing indices of basis states.
+            probabilities: probabilities of the basis states with given indices.
+            n_qubits: length of the bitstrings, at most 63.
+            normalize: whether the probabilities get normalized or not.
+        """
+        indices = np.asarray(indices, dtype=np.int64).ravel()
+        probabilities = np.asarray(probabilities, dtype=float).ravel()
+        if not 0 <= n_qubits <= _MAX_N_QUBITS_FOR_INDICES:
+            raise ValueError(
+                f"Bitstrings indexed by integers can have at most "
+                f"{_MAX_N_QUBITS_FOR_INDICES} bits, got {n_qubits}."
+            )
+        if (
+            len(indices) == 0
+            or len(indices) != len(probabilities)
+            or indices[0] < 0
+            or indices[-1] >= 2 ** n_qubits
+            or np.any(np.diff(indices) <= 0)
+        ):
+            raise RuntimeError(
+                "Initialization of BitstringDistribution object FAILED: indices have"
+                " to be non-empty, strictly increasing, match the probabilities and"
+                " fit in the given number of qubits."
+            )
+        return cls._from_arrays(indices, probabilities, n_qubits, normalize)
+
+    @classmethod
+    def _from_arrays(
+        cls,
+        indices: Optional[np.ndarray],
+        probabilities: np.ndarray,
+        n_qubits: int,
+        normalize: bool,
+    ) -> "BitstringDistribution":
+        if np.any(probabilities < 0):
+            raise RuntimeError(
+                "Initialization of BitstringDistribution object FAILED: probabilities"
+                " have to be non-negative."
+            )
+        if not math.isclose(probabilities.sum(), 1):
+            if normalize:
+                probabilities = _normalize_probabilities(probabilities)
+            else:
+                warnings.warn("BitstringDistribution object is not normalized.")
+
+        distribution = cls.__new__(cls)
+        distribution._distribution_dict = None
+        distribution._indices = indices
+        distribution._probabilities = probabilities
+        distribution._n_qubits = n_qubits
+        return distribution
+
+    @property
+    def distribution_dict(self) -> Dict:
+        if self._distribution_dict is None:
+            indices, probabilities = self.get_sparse_arrays()
+            self._distribution_dict = dict(
+                zip(
+                    _indices_to_bitstrings(indices, cast(int, self._n_qubits)),
+                    probabilities.tolist(),
+                )
+            )
+            # From now on the (possibly modified) dictionary is the only source of
+            # truth, as it is in distributions created from dictionaries.
+            self._indices = self._probabilities = None
+        return self._distribution_dict
+
+    @distribution_dict.setter
+    def distribution_dict(self, distribution_dict: Dict):
+        self._distribution_dict = distribution_dict
+        self._indices = self._probabilities = None
+        self._n_qubits = None
+
+    def get_sparse_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the distribution as arrays of indices and probabilities.
+
+        Returns:
+            Tuple (indices, probabilities), where indices is a strictly increasing
+                int64 array of indices of basis states and probabilities holds their
+                probabilities.
+        """
+        if self._distribution_dict is not None:
+            bitstrings = list(self._distribution_dict.keys())
+            indices = _bitstrings_to_indices(bitstrings)
+            probabilities = np.fromiter(
+                self._distribution_dict.values(), dtype=float, count=len(bitstrings)
+            )
+            order = np.argsort(indices, kind="stable")
+            return indices[order], probabilities[order]
+        probabilities = cast(np.ndarray, self._probabilities)
+        if self._indices is None:
+            return np.arange(len(probabilities), dtype=np.int64), probabilities
+        return self._indices, probabilities
+
     def __repr__(self) -> str:
         output = f"BitstringDistribution(input={self.distribution_dict})"
         return output
@@ -58,11 +218,71 @@ class BitstringDistribution:
         Returns:
             float: number of qubits in a bitstring (i.e. bitstring length).
         """
+        if self._distribution_dict is None:
+            return cast(int, self._n_qubits)
         return len(
             list(self.distribution_dict.keys())[0]
         )  # already checked in __init__ that all keys have the same length
 
 
+def _bitstrings_to_indices(bitstrings: List[str]) -> np.ndarray:
+    """Convert same-length bitstrings into indices of basis states, where the k-th
+    character of a bitstring is the k-th least significant bit of its index."""
+    n_qubits = len(bitstrings[0])
+    characters = np.frombuffer("".join(bitstrings).encode("ascii"), dtype=np.uint8)
+    return _bit_matrix_to_indices(
+        (characters - ord("0")).reshape(len(bitstrings), n_qubits)
+    )
+
+
+def _bit_matrix_to_indices(bits: np.ndarray) -> np.ndarray:
+    """Convert rows of a 2D array of bits into indices of basis states, where the
+    k-th column holds the k-th least significant bit of an index."""
+    n_qubits = bits.shape[1]
+    if n_qubits > _MAX_N_QUBITS_FOR_INDICES:
+        raise ValueError(
+            f"Bitstrings indexed by integers can have at most "
+            f"{_MAX_N_QUBITS_FOR_INDICES} bits, got {n_qubits}."
+        )
+    return bits.astype(np.int64) @ (np.int64(1) << np.arange(n_qubits, dtype=np.int64))
+
+
+def _indices_to_bitstrings(indices: np.ndarray, n_qubits: int) -> List[str]:
+    """Inverse of _bitstrings_to_indices."""
+    if n_qubits == 0:
+        return [""] * len(indices)
+    bits = (indices[:, np.newaxis] >> np.arange(n_qubits, dtype=np.int64)) & 1
+    characters = (bits + ord("0")).astype(np.uint8).tobytes().decode("ascii")
+    return [
+        characters[start : start + n_qubits]
+        for start in range(0, len(indices) * n_qubits, n_qubits)
+    ]
+
+
+def _is_distribution_normalized(distribution: BitstringDistribution) -> bool:
+    if distribution._distribution_dict is not None:
+        return is_normalized(distribution._distribution_dict)
+    return math.isclose(distribution.get_sparse_arrays()[1].sum(), 1)
+
+
+def _get_norm(probabilities: np.ndarray) -> float:
+    norm = probabilities.sum()
+    if norm == 0:
+        raise ValueError(
+            "Normalization of BitstringDistribution FAILED:"
+            " input dict is empty (all zero values)."
+        )
+    elif 0 < norm < sys.float_info.min:
+        raise ValueError(
+            "Normalization of BitstringDistribution FAILED: too small values."
+        )
+    return norm
+
+
+def _normalize_probabilities(probabilities: np.ndarray) -> np.ndarray:
+    return probabilities / _get_norm(probabilities)
+
+
 def is_non_negative(input_dict: Dict) -> bool:
     """Check if the input dictionary values are non negative.
 
@@ -84,8 +304,8 @@ def is_key_length_fixed(input_dict: Dict) -> bool:
     Returns:
         bool: boolean variable indicating whether dict keys are same-length or not.
     """
-    key_length = len(list(input_dict.keys())[0])
-    return all(len(key) == key_length for key in input_dict.keys())
+    key_length = len(next(iter(input_dict)))
+    return all(length == key_length for length in map(len, input_dict))
 
 
 def are_keys_binary_strings(input_dict: Dict) -> bool:
@@ -97,7 +317,7 @@ def are_keys_binary_strings(input_dict: Dict) -> bool:
     Returns:
         bool: boolean variable indicating whether dict keys are binary strings or not.
     """
-    return all(not any(char not in "10" for char in key) for key in input_dict.keys())
+    return set("".join(input_dict)) <= {"0", "1"}
 
 
 def is_bitstring_distribution(input_dict: Dict) -> bool:
@@ -148,22 +368,15 @@ def normalize_bitstring_distribution(bitstring_distribution: Dict) -> Dict:
         Dictionary representing the normalized probability distribution where the keys
             are bitstrings represented as strings and the values are floats.
     """
-    norm = sum(bitstring_distribution.values())
-    if norm == 0:
-        raise ValueError(
-            "Normalization of BitstringDistribution FAILED:"
-            " input dict is empty (all zero values)."
-        )
-    elif 0 < norm < sys.float_info.min:
-        raise ValueError(
-            "Normalization of BitstringDistribution FAILED: too small values."
+    probabilities = np.fromiter(
+        bitstring_distribution.values(), dtype=float, count=len(bitstring_distribution)
+    )
+    norm = _get_norm(probabilities)
+    if norm != 1:
+        bitstring_distribution.update(
+            zip(bitstring_distribution, (probabilities / norm).tolist())
         )
-    elif norm == 1:
-        return bitstring_distribution
-    else:
-        for key in bitstring_distribution:
-            bitstring_distribution[key] *= 1.0 / norm
-        return bitstring_distribution
+    return bitstring_distribution
 
 
 def save_bitstring_distribution(
@@ -260,20 +473,7 @@ def create_bitstring_distribution_from_probability_distribution(
         The BitstringDistribution object corresponding to the input measurements.
     """
 
-    # Create dictionary of bitstring tuples as keys with probability as value
-    prob_dict = {}
-    for state in range(len(prob_distribution)):
-        # Convert state to bitstring
-        bitstring = format(state, "b")
-        while len(bitstring) < np.log2(len(prob_distribution)):
-            bitstring = "0" + bitstring
-        # Reverse bitstring
-        bitstring = bitstring[::-1]
-
-        # Add to dict
-        prob_dict[bitstring] = prob_distribution[state]
-
-    return BitstringDistribution(prob_dict)
+    return BitstringDistribution.from_probability_vector(prob_distribution)
 
 
 def evaluate_distribution_distance(
@@ -298,6 +498,62 @@ def evaluate_distribution_distance(
     Returns:
          The value of the distance measure.
     """
+    _check_distributions_are_comparable(target_distribution, measured_distribution)
+
+    return distance_measure_function(
+        target_distribution, measured_distribution, **kwargs
+    )
+
+
+def evaluate_distribution_distances(
+    target_distribution: BitstringDistribution,
+    measured_distributions: Sequence[BitstringDistribution],
+    distance_measure_function: Callable,
+    **kwargs,
+) -> np.ndarray:
+    """Evaluate the distances between the target distribution and each of the
+    distributions predicted (measured) by your model, based on the given distance
+    measure.
+
+    For the distance measures implemented in this package the distributions are
+    aligned once and all distances are computed together. Other distance measures
+    are evaluated for each measured distribution separately.
+
+    Args:
+         target_distribution: The target bitstring probability distribution
+         measured_distributions: The measured bitstring probability distributions
+         distance_measure_function: function used to calculate the distance measure
+
+         Additional distance measure parameters can be passed as key word arguments.
+
+    Returns:
+         Array with the value of the distance measure for every measured
+            distribution.
+    """
+    for measured_distribution in measured_distributions:
+        _check_distributions_are_comparable(target_distribution, measured_distribution)
+
+    batched_distance_measure_function = _BATCHED_DISTANCE_MEASURES.get(
+        distance_measure_function
+    )
+    if batched_distance_measure_function is not None:
+        return batched_distance_measure_function(
+            target_distribution, measured_distributions, **kwargs
+        )
+    return np.array(
+        [
+            distance_measure_function(
+                target_distribution, measured_distribution, **kwargs
+            )
+            for measured_distribution in measured_distributions
+        ]
+    )
+
+
+def _check_distributions_are_comparable(
+    target_distribution: BitstringDistribution,
+    measured_distribution: BitstringDistribution,
+):
     # Check inputs are BitstringDistribution objects
     if not isinstance(target_distribution, BitstringDistribution) or not isinstance(
         measured_distribution, BitstringDistribution
@@ -317,14 +573,10 @@ def evaluate_distribution_distance(
         )
 
     # Check inputs are both normalized (or not normalized)
-    if is_normalized(target_distribution.distribution_dict) != is_normalized(
-        measured_distribution.distribution_dict
+    if _is_distribution_normalized(target_distribution) != _is_distribution_normalized(
+        measured_distribution
     ):
         raise RuntimeError(
             "Bitstring Distribution Distance Evaluation FAILED: one among target and"
             " measured distribution is normalized, whereas the other is not."
         )
-
-    return distance_measure_function(
-        target_distribution, measured_distribution, **kwargs
-    )
@@ -1,2 +1,15 @@
-from .clipped_negative_log_likelihood import compute_clipped_negative_log_likelihood
-from .mmd import compute_mmd, compute_multi_rbf_kernel, compute_rbf_kernel
+from .clipped_negative_log_likelihood import (
+    compute_clipped_negative_log_likelihood,
+    compute_clipped_negative_log_likelihood_batch,
+)
+from .jensen_shannon_divergence import (
+    compute_jensen_shannon_divergence,
+    compute_jensen_shannon_divergence_batch,
+)
+from .mmd import (
+    compute_mmd,
+    compute_mmd_batch,
+    compute_multi_rbf_kernel,
+    compute_rbf_kernel,
+    estimate_mmd_with_random_features,
+)
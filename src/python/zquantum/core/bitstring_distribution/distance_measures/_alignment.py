@@ -0,0 +1,91 @@
+from functools import reduce
+from typing import TYPE_CHECKING, Sequence, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from zquantum.core.bitstring_distribution import BitstringDistribution
+
+
+def align_distributions(
+    target_distribution: "BitstringDistribution",
+    measured_distributions: Sequence["BitstringDistribution"],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Map a target distribution and a batch of measured distributions onto one
+    common, sorted support.
+
+    Bitstrings are merged through their integer codes, so every distribution is
+    scanned once and no per-bitstring dictionary lookups are needed.
+
+    Args:
+        target_distribution: The target bitstring probability distribution.
+        measured_distributions: The measured bitstring probability distributions.
+
+    Returns:
+        A tuple (basis, target_values, measured_values), where basis holds the
+        integer value of every bitstring of the common support (as returned by
+        `int(bitstring, 2)`), target_values is a vector of target probabilities
+        over this support and measured_values is a matrix whose rows hold the
+        probabilities of consecutive measured distributions. Bitstrings missing
+        from a distribution have probability 0.
+    """
+    try:
+        target_indices, target_probabilities = target_distribution.get_sparse_arrays()
+        measured_arrays = [
+            distribution.get_sparse_arrays() for distribution in measured_distributions
+        ]
+    except ValueError:
+        # Integer codes do not fit into int64, merge bitstrings directly.
+        return _align_distributions_by_keys(target_distribution, measured_distributions)
+
+    support = reduce(
+        np.union1d,
+        [indices for indices, _ in measured_arrays],
+        np.asarray(target_indices, dtype=np.int64),
+    )
+    target_values = _scatter_onto_support(support, target_indices, target_probabilities)
+    measured_values = np.zeros((len(measured_arrays), len(support)))
+    for row, (indices, probabilities) in enumerate(measured_arrays):
+        measured_values[row] = _scatter_onto_support(support, indices, probabilities)
+
+    n_qubits = max(
+        [target_distribution.get_qubits_number()]
+        + [distribution.get_qubits_number() for distribution in measured_distributions]
+    )
+    return _reverse_bits(support, n_qubits), target_values, measured_values
+
+
+def _scatter_onto_support(
+    support: np.ndarray, indices: np.ndarray, probabilities: np.ndarray
+) -> np.ndarray:
+    values = np.zeros(len(support))
+    values[np.searchsorted(support, indices)] = probabilities
+    return values
+
+
+def _reverse_bits(indices: np.ndarray, n_qubits: int) -> np.ndarray:
+    """Convert little-endian distribution indices into `int(bitstring, 2)` values."""
+    basis = np.zeros(len(indices), dtype=np.int64)
+    for position in range(n_qubits):
+        basis |= ((indices >> position) & 1) << (n_qubits - 1 - position)
+    return basis
+
+
+def _align_distributions_by_keys(
+    target_distribution: "BitstringDistribution",
+    measured_distributions: Sequence["BitstringDistribution"],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    distributions = [target_distribution, *measured_distributions]
+    keys = [
+        np.array(list(distribution.distribution_dict), dtype=str)
+        for distribution in distributions
+    ]
+    support = reduce(np.union1d, keys[1:], keys[0])
+    values = np.zeros((len(distributions), len(support)))
+    for row, (distribution, distribution_keys) in enumerate(zip(distributions, keys)):
+        values[row, np.searchsorted(support, distribution_keys)] = list(
+            distribution.distribution_dict.values()
+        )
+
+    basis = np.array([int(key, 2) for key in support], dtype=object)
+    return basis, values[0], values[1:]
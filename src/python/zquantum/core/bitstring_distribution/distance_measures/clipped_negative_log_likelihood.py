@@ -1,5 +1,8 @@
-import math
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, Sequence
+
+import numpy as np
+
+from ._alignment import align_distributions
 
 if TYPE_CHECKING:
     from zquantum.core.bitstring_distribution import BitstringDistribution
@@ -24,21 +27,42 @@ def compute_clipped_negative_log_likelihood(
     Returns:
         The value of the clipped negative log likelihood
     """
+    return float(
+        compute_clipped_negative_log_likelihood_batch(
+            target_distribution, [measured_distribution], distance_measure_parameters
+        )[0]
+    )
 
+
+def compute_clipped_negative_log_likelihood_batch(
+    target_distribution: "BitstringDistribution",
+    measured_distributions: Sequence["BitstringDistribution"],
+    distance_measure_parameters: Dict,
+) -> np.ndarray:
+    """Compute the clipped negative log likelihood between a target bitstring
+    distribution and each of the measured bitstring distributions.
+
+    Args:
+        target_distribution: The target bitstring probability distribution.
+        measured_distributions: The measured bitstring probability distributions.
+        distance_measure_parameters: See `compute_clipped_negative_log_likelihood`.
+
+    Returns:
+        Array with the value of the clipped negative log likelihood for every
+            measured distribution.
+    """
     epsilon = distance_measure_parameters.get("epsilon", 1e-9)
-    value = 0.0
-    target_keys = target_distribution.distribution_dict.keys()
-    measured_keys = measured_distribution.distribution_dict.keys()
-    all_keys = set(target_keys).union(measured_keys)
-
-    for bitstring in all_keys:
-        target_bitstring_value = target_distribution.distribution_dict.get(bitstring, 0)
-        measured_bitstring_value = measured_distribution.distribution_dict.get(
-            bitstring, 0
-        )
-
-        value += target_bitstring_value * math.log(
-            max(epsilon, measured_bitstring_value)
-        )
-
-    return -value
+    _, target_values, measured_values = align_distributions(
+        target_distribution, measured_distributions
+    )
+    return _compute_clipped_negative_log_likelihood(
+        target_values, measured_values, epsilon
+    )
+
+
+def _compute_clipped_negative_log_likelihood(
+    target_values: np.ndarray, measured_values: np.ndarray, epsilon: float
+) -> np.ndarray:
+    """Clipped negative log likelihood of aligned probability vectors. Leading axes
+    of measured_values enumerate distributions, the last one enumerates bitstrings."""
+    return -(np.log(np.maximum(epsilon, measured_values)) @ target_values)
@@ -1,6 +1,9 @@
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, Sequence
 
-from .clipped_negative_log_likelihood import compute_clipped_negative_log_likelihood
+import numpy as np
+
+from ._alignment import align_distributions
+from .clipped_negative_log_likelihood import _compute_clipped_negative_log_likelihood
 
 if TYPE_CHECKING:
     from zquantum.core.bitstring_distribution import BitstringDistribution
@@ -26,16 +29,36 @@ def compute_jensen_shannon_divergence(
     Returns:
         float: The value of the symmetrized version
     """
-
-    value = (
-        compute_clipped_negative_log_likelihood(
-            target_distribution, measured_distribution, distance_measure_parameters
-        )
-        / 2
-        + compute_clipped_negative_log_likelihood(
-            measured_distribution, target_distribution, distance_measure_parameters
-        )
-        / 2
+    return float(
+        compute_jensen_shannon_divergence_batch(
+            target_distribution, [measured_distribution], distance_measure_parameters
+        )[0]
     )
 
-    return value
+
+def compute_jensen_shannon_divergence_batch(
+    target_distribution: "BitstringDistribution",
+    measured_distributions: Sequence["BitstringDistribution"],
+    distance_measure_parameters: Dict,
+) -> np.ndarray:
+    """Computes the symmetrized version of the clipped negative log likelihood between
+    a target bitstring distribution and each of the measured bitstring distributions.
+
+    Args:
+        target_distribution: The target bitstring probability distribution.
+        measured_distributions: The measured bitstring probability distributions.
+        distance_measure_parameters: See `compute_jensen_shannon_divergence`.
+
+    Returns:
+        Array with the value of the symmetrized version for every measured
+            distribution.
+    """
+    epsilon = distance_measure_parameters.get("epsilon", 1e-9)
+    _, target_values, measured_values = align_distributions(
+        target_distribution, measured_distributions
+    )
+    target_to_measured = _compute_clipped_negative_log_likelihood(
+        target_values, measured_values, epsilon
+    )
+    measured_to_target = -(measured_values @ np.log(np.maximum(epsilon, target_values)))
+    return target_to_measured / 2 + measured_to_target / 2
@@ -23,13 +23,21 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import TYPE_CHECKING, Dict, List, Sequence, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Union, cast
 
 import numpy as np
 
+from ._alignment import align_distributions
+
 if TYPE_CHECKING:
     from zquantum.core.bitstring_distribution import BitstringDistribution
 
+# Number of bitstrings per block of the kernel matrix evaluated at once.
+_KERNEL_BLOCK_SIZE = 1024
+
+# Kernel matrix entries smaller than this value are neglected.
+_NEGLIGIBLE_KERNEL_VALUE = 1e-20
+
 
 def compute_rbf_kernel(x_i: np.ndarray, y_j: np.ndarray, sigma: float) -> np.ndarray:
     """Compute the gaussian (RBF) kernel matrix K, with K_ij = exp(-gamma |x_i - y_j|^2)
@@ -43,14 +51,7 @@ def compute_rbf_kernel(x_i: np.ndarray, y_j: np.ndarray, sigma: float) -> np.nda
     Returns:
         np.ndarray: The gaussian kernel matrix.
     """
-    exponent = np.abs(x_i[:, None] - y_j[None, :]) ** 2
-    try:
-        gamma = 1.0 / (2 * sigma)
-    except ZeroDivisionError as error:
-        print("Handling run-time error:", error)
-        raise
-    kernel_matrix = np.exp(-gamma * exponent)
-    return kernel_matrix
+    return compute_multi_rbf_kernel(x_i, y_j, [sigma])
 
 
 def compute_multi_rbf_kernel(
@@ -70,16 +71,10 @@ def compute_multi_rbf_kernel(
     Returns:
         np.ndarray: The gaussian kernel matrix.
     """
-    exponent = np.abs(x_i[:, None] - y_j[None, :]) ** 2
-    kernel_matrix = np.zeros(exponent.shape)
-    for sigma in sigmas:
-        try:
-            gamma = 1.0 / (2 * sigma)
-        except ZeroDivisionError as error:
-            print("Handling run-time error:", error)
-            raise
-        kernel_matrix += np.exp(-gamma * exponent)
-    return kernel_matrix / len(sigmas)
+    gammas = _get_gammas(sigmas)
+    return _compute_kernel_from_squared_distances(
+        _get_squared_distances(np.asarray(x_i), np.asarray(y_j)), gammas
+    )
 
 
 def compute_mmd(
@@ -91,6 +86,10 @@ def compute_mmd(
     between a target bitstring distribution and a measured bitstring distribution.
     Reference: arXiv.1804.04168.
 
+    The kernel matrix is never stored as a whole. It is evaluated in blocks, and
+    blocks of bitstrings whose integer values are too far apart for the kernel to
+    matter are skipped.
+
         Args:
             target_distribution: The target bitstring probability distribution.
             measured_distribution: The measured bitstring probability distribution.
@@ -98,30 +97,209 @@ def compute_mmd(
             distance_measure_parameters:
                 sigma (float/np.array): the bandwidth parameter used to compute the
                     single/multi gaussian kernel. The default value is 1.0.
+                n_random_features (int): if given, the MMD is approximated with
+                    this number of random Fourier features per bandwidth, see
+                    `estimate_mmd_with_random_features`.
+                seed (int): seed for the random Fourier features.
 
         Returns:
             The value of the maximum mean discrepancy.
     """
+    return float(
+        compute_mmd_batch(
+            target_distribution, [measured_distribution], distance_measure_parameters
+        )[0]
+    )
+
 
-    sigma = distance_measure_parameters.get("sigma", 1.0)
-    target_keys = target_distribution.distribution_dict.keys()
-    measured_keys = measured_distribution.distribution_dict.keys()
-    all_keys = set(target_keys).union(measured_keys)
-
-    target_values = []
-    measured_values = []
-    for bitstring in all_keys:
-        # Add 0 to the values list whenever a bistrings isn't found among the keys.
-        target_values.append(target_distribution.distribution_dict.get(bitstring, 0))
-        measured_values.append(
-            measured_distribution.distribution_dict.get(bitstring, 0)
+def compute_mmd_batch(
+    target_distribution: "BitstringDistribution",
+    measured_distributions: Sequence["BitstringDistribution"],
+    distance_measure_parameters: Dict,
+) -> np.ndarray:
+    """Compute the squared Maximum Mean Discrepancy (MMD) between a target bitstring
+    distribution and each of the measured bitstring distributions. The kernel matrix
+    is evaluated once for the whole batch.
+
+        Args:
+            target_distribution: The target bitstring probability distribution.
+            measured_distributions: The measured bitstring probability distributions.
+            distance_measure_parameters: See `compute_mmd`.
+
+        Returns:
+            Array with the value of the maximum mean discrepancy for every measured
+                distribution.
+    """
+    gammas = _get_gammas(distance_measure_parameters.get("sigma", 1.0))
+    basis, target_values, measured_values = align_distributions(
+        target_distribution, measured_distributions
+    )
+    diff = target_values - measured_values
+
+    n_random_features = distance_measure_parameters.get("n_random_features")
+    if n_random_features is not None:
+        return _estimate_kernel_quadratic_forms(
+            basis,
+            diff,
+            gammas,
+            n_random_features,
+            distance_measure_parameters.get("seed"),
         )
+    return _compute_kernel_quadratic_forms(basis, diff, gammas)
+
 
-    basis = np.asarray([int(item, 2) for item in all_keys])  # bitstring to int
-    if not hasattr(sigma, "__len__"):
-        kernel_matrix = compute_rbf_kernel(basis, basis, sigma)
+def estimate_mmd_with_random_features(
+    target_distribution: "BitstringDistribution",
+    measured_distribution: "BitstringDistribution",
+    sigma: Union[float, Sequence[float]] = 1.0,
+    n_random_features: int = 1000,
+    failure_probability: float = 0.05,
+    seed: Optional[int] = None,
+) -> Tuple[float, float]:
+    """Estimate the squared MMD with random Fourier features (arXiv:0710.3742).
+
+    Every gaussian kernel is replaced with an average over n_random_features random
+    cosine features, so the cost is linear in the number of bitstrings. The estimate
+    is unbiased and, by Hoeffding's inequality, it differs from the exact value by
+    at most the returned error bound with probability at least
+    1 - failure_probability.
+
+    Args:
+        target_distribution: The target bitstring probability distribution.
+        measured_distribution: The measured bitstring probability distribution.
+        sigma: the bandwidth parameter used to compute the single/multi gaussian
+            kernel.
+        n_random_features: number of random features drawn per bandwidth.
+        failure_probability: probability with which the error bound may not hold.
+        seed: seed for drawing the random features.
+
+    Returns:
+        Tuple (estimate, error_bound).
+    """
+    if not 0 < failure_probability < 1:
+        raise ValueError(
+            f"failure_probability has to be in (0, 1), got {failure_probability}."
+        )
+    gammas = _get_gammas(sigma)
+    basis, target_values, measured_values = align_distributions(
+        target_distribution, [measured_distribution]
+    )
+    diff = target_values - measured_values
+    estimate = _estimate_kernel_quadratic_forms(
+        basis, diff, gammas, n_random_features, seed
+    )[0]
+
+    # Every random feature contributes a term in [0, 2 * ||diff||_1 ** 2].
+    term_range = 2 * np.abs(diff).sum() ** 2
+    error_bound = term_range * np.sqrt(
+        np.log(2 / failure_probability) / (2 * n_random_features * len(gammas))
+    )
+    return float(estimate), float(error_bound)
+
+
+def _get_gammas(sigma: Union[float, Sequence[float]]) -> List[float]:
+    if hasattr(sigma, "__len__"):
+        sigmas = cast(Sequence[float], sigma)
     else:
-        kernel_matrix = compute_multi_rbf_kernel(basis, basis, sigma)
+        sigmas = [cast(float, sigma)]
+    try:
+        return [1.0 / (2 * sigma) for sigma in sigmas]
+    except ZeroDivisionError as error:
+        print("Handling run-time error:", error)
+        raise
+
+
+def _get_squared_distances(x_i: np.ndarray, y_j: np.ndarray) -> np.ndarray:
+    # Differences are converted to floats before squaring so that large integers
+    # (or Python ints for long bitstrings) do not overflow.
+    return (x_i[:, None] - y_j[None, :]).astype(float) ** 2
+
+
+def _compute_kernel_from_squared_distances(
+    squared_distances: np.ndarray, gammas: Sequence[float]
+) -> np.ndarray:
+    kernel_matrix = np.zeros(squared_distances.shape)
+    for gamma in gammas:
+        kernel_matrix += np.exp(-gamma * squared_distances)
+    return kernel_matrix / len(gammas)
+
+
+def _compute_kernel_quadratic_forms(
+    basis: np.ndarray,
+    vectors: np.ndarray,
+    gammas: Sequence[float],
+    block_size: int = _KERNEL_BLOCK_SIZE,
+) -> np.ndarray:
+    """Compute v K v for every row v of vectors, where K is the multi-gaussian
+    kernel matrix over basis, without materializing K.
+
+    After sorting the basis, K is evaluated in square blocks. Since the kernel
+    decays with the distance between integers, for every block row only a window of
+    block columns around the diagonal has to be visited. K is symmetric, so only
+    the blocks on and above the diagonal are evaluated.
+    """
+    order = np.argsort(basis, kind="stable")
+    basis = basis[order]
+    vectors = vectors[:, order]
+    max_squared_distance = np.log(1 / _NEGLIGIBLE_KERNEL_VALUE) / min(gammas)
+
+    quadratic_forms = np.zeros(len(vectors))
+    for row_start in range(0, len(basis), block_size):
+        row_basis = basis[row_start : row_start + block_size]
+        row_vectors = vectors[:, row_start : row_start + block_size]
+        for column_start in range(row_start, len(basis), block_size):
+            column_basis = basis[column_start : column_start + block_size]
+            if (
+                column_start > row_start
+                and float(column_basis[0] - row_basis[-1]) ** 2 > max_squared_distance
+            ):
+                # The basis is sorted, so all further blocks are even farther away.
+                break
+            kernel_block = _compute_kernel_from_squared_distances(
+                _get_squared_distances(row_basis, column_basis), gammas
+            )
+            block_forms = np.einsum(
+                "ij,ij->i",
+                row_vectors @ kernel_block,
+                vectors[:, column_start : column_start + block_size],
+            )
+            if column_start == row_start:
+                quadratic_forms += block_forms
+            else:
+                quadratic_forms += 2 * block_forms
+    return quadratic_forms
+
+
+def _estimate_kernel_quadratic_forms(
+    basis: np.ndarray,
+    vectors: np.ndarray,
+    gammas: Sequence[float],
+    n_random_features: int,
+    seed: Optional[int] = None,
+    block_size: int = _KERNEL_BLOCK_SIZE,
+) -> np.ndarray:
+    """Estimate v K v for every row v of vectors using random Fourier features.
+
+    exp(-gamma (x - y)^2) is the expectation of 2 cos(w x + b) cos(w y + b) over
+    w ~ N(0, 2 gamma) and b ~ U(0, 2 pi), hence v K v is the expectation of
+    2 (sum_i v_i cos(w x_i + b))^2.
+    """
+    if n_random_features <= 0:
+        raise ValueError(
+            f"n_random_features has to be positive, got {n_random_features}."
+        )
+    rng = np.random.default_rng(seed)
+    basis = basis.astype(float)
 
-    diff = np.array(target_values) - np.array(measured_values)
-    return diff.dot(kernel_matrix.dot(diff))
+    estimates = np.zeros(len(vectors))
+    for gamma in gammas:
+        frequencies = rng.normal(scale=np.sqrt(2 * gamma), size=n_random_features)
+        phases = rng.uniform(0, 2 * np.pi, size=n_random_features)
+        projections = np.zeros((len(vectors), n_random_features))
+        for start in range(0, len(basis), block_size):
+            features = np.cos(
+                np.outer(basis[start : start + block_size], frequencies) + phases
+            )
+            projections += vectors[:, start : start + block_size] @ features
+        estimates += 2 * np.mean(projections ** 2, axis=1)
+    return estimates / len(gammas)
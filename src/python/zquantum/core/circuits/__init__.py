@@ -102,7 +102,8 @@ Extending built-in gates requires:
     1- or multi-qubit, parametric/nonparametric gates there to see how it's been done
     for other gates.
 
-- Adding its matrix to `zquantum.core.circuits._matrices`.
+- Adding its matrix to `zquantum.core.circuits._matrices`, and its NumPy counterpart
+    to `zquantum.core.circuits._numeric_matrices`.
 
 - Adding tests for conversion to other frameworks in:
     - `zquantum.core.conversions.cirq_conversions_test`
@@ -149,6 +150,7 @@ from ._gates import (
     Gate,
     GateOperation,
     MatrixFactoryGate,
+    numeric_gate_matrix,
 )
 from ._generators import add_ancilla_register, create_layer_of_gates
 from ._serde import (
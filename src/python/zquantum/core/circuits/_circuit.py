@@ -6,6 +6,7 @@ import numpy as np
 import sympy
 
 from . import _gates
+from ._unitary_tools import _unitary_from_matrices
 
 
 def _circuit_size_by_operations(operations):
@@ -21,10 +22,6 @@ def _circuit_size_by_operations(operations):
     )
 
 
-def _bind_operation(op: _gates.GateOperation, symbols_map) -> _gates.GateOperation:
-    return op.gate.bind(symbols_map)(*op.qubit_indices)
-
-
 def _operation_uses_custom_gate(operation):
     return isinstance(operation.gate, _gates.MatrixFactoryGate) and isinstance(
         operation.gate.matrix_factory, _gates.CustomGateMatrixFactory
@@ -69,7 +66,7 @@ class Circuit:
         seen_symbols = set()
         symbols_sequence = []
         for operation in self._operations:
-            for symbol in operation.gate.free_symbols:
+            for symbol in operation.free_symbols:
                 if symbol not in seen_symbols:
                     seen_symbols.add(symbol)
                     symbols_sequence.append(symbol)
@@ -113,12 +110,21 @@ class Circuit:
         For performance reasons, this method will construct numpy matrix if circuit does
         not have free parameters, and a sympy matrix otherwise.
         """
-        # The `reversed` iterator reflects the fact the matrices are multiplied
-        # when composing linear operations (i.e. first operation is the rightmost).
-        lifted_matrices = [
-            op.lifted_matrix(self.n_qubits) for op in reversed(self.operations)
-        ]
-        return reduce(operator.matmul, lifted_matrices)
+        if self.free_symbols:
+            # The `reversed` iterator reflects the fact the matrices are multiplied
+            # when composing linear operations (i.e. first operation is the rightmost).
+            lifted_matrices = [
+                op.lifted_matrix(self.n_qubits) for op in reversed(self.operations)
+            ]
+            return reduce(operator.matmul, lifted_matrices)
+
+        return _unitary_from_matrices(
+            [
+                (_gates.numeric_gate_matrix(op.gate), op.qubit_indices)
+                for op in self.operations
+            ],
+            self.n_qubits,
+        )
 
     def bind(self, symbols_map: Dict[sympy.Symbol, Any]):
         """Create a copy of the current circuit with the parameters of each gate bound
@@ -128,7 +134,7 @@ class Circuit:
             symbols_map: A map of the symbols/gate parameters to new values
         """
         return type(self)(
-            operations=[_bind_operation(op, symbols_map) for op in self.operations],
+            operations=[op.bind(symbols_map) for op in self.operations],
             n_qubits=self.n_qubits,
         )
 
@@ -3,12 +3,13 @@ import math
 from dataclasses import dataclass, replace
 from functools import singledispatch
 from numbers import Number
-from typing import Callable, Dict, Iterable, Tuple, Union
+from typing import Callable, Dict, Iterable, SupportsFloat, Tuple, Union, cast
 
 import numpy as np
 import sympy
 from typing_extensions import Protocol, runtime_checkable
 
+from ._numeric_matrices import builtin_gate_matrix, get_numeric_matrix_factory
 from ._unitary_tools import _lift_matrix_numpy, _lift_matrix_sympy
 
 Parameter = Union[sympy.Symbol, Number]
@@ -125,6 +126,10 @@ class Operation(Protocol):
     def replace_params(self, new_params: Tuple[Parameter, ...]) -> "Operation":
         raise NotImplementedError()
 
+    @property
+    def free_symbols(self) -> Iterable[sympy.Symbol]:
+        raise NotImplementedError()
+
 
 @dataclass(frozen=True)
 class GateOperation:
@@ -143,11 +148,17 @@ class GateOperation:
     def replace_params(self, new_params: Tuple[Parameter, ...]) -> "GateOperation":
         return GateOperation(self.gate.replace_params(new_params), self.qubit_indices)
 
+    @property
+    def free_symbols(self) -> Iterable[sympy.Symbol]:
+        return self.gate.free_symbols
+
     def lifted_matrix(self, num_qubits):
         return (
             _lift_matrix_sympy(self.gate.matrix, self.qubit_indices, num_qubits)
             if self.gate.free_symbols
-            else _lift_matrix_numpy(self.gate.matrix, self.qubit_indices, num_qubits)
+            else _lift_matrix_numpy(
+                numeric_gate_matrix(self.gate), self.qubit_indices, num_qubits
+            )
         )
 
     def __str__(self):
@@ -478,3 +489,39 @@ def _are_matrices_equal(matrix, another_matrix):
         _are_matrix_elements_equal(element, another_element)
         for element, another_element in zip(matrix, another_matrix)
     )
+
+
+@singledispatch
+def numeric_gate_matrix(gate: Gate) -> np.ndarray:
+    """Matrix of a gate without free symbols as a complex NumPy array.
+
+    Matrices of built-in gates (also controlled and daggered ones) are constructed
+    directly with NumPy and cached, matrices of other gates are converted from
+    their sympy matrices. Returned arrays may be shared and shouldn't be modified.
+    """
+    return np.array(gate.matrix, dtype=complex)
+
+
+@numeric_gate_matrix.register
+def _numeric_matrix_factory_gate_matrix(gate: MatrixFactoryGate) -> np.ndarray:
+    if get_numeric_matrix_factory(gate.name, gate.matrix_factory) is not None:
+        try:
+            params = tuple(float(cast(SupportsFloat, param)) for param in gate.params)
+        except TypeError:
+            pass
+        else:
+            return builtin_gate_matrix(gate.name, params)
+    return np.array(gate.matrix, dtype=complex)
+
+
+@numeric_gate_matrix.register
+def _numeric_controlled_gate_matrix(gate: ControlledGate) -> np.ndarray:
+    wrapped_matrix = numeric_gate_matrix(gate.wrapped_gate)
+    matrix = np.eye(2 ** gate.num_qubits, dtype=complex)
+    matrix[-len(wrapped_matrix) :, -len(wrapped_matrix) :] = wrapped_matrix
+    return matrix
+
+
+@numeric_gate_matrix.register
+def _numeric_dagger_gate_matrix(gate: Dagger) -> np.ndarray:
+    return numeric_gate_matrix(gate.wrapped_gate).conj().T
@@ -0,0 +1,204 @@
+"""NumPy counterparts of built-in gate matrices defined in `_matrices`.
+
+They are used for gates with numeric parameters, so that numeric consumers
+(simulators, `Circuit.to_unitary`) don't need to build and convert sympy matrices.
+"""
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from . import _matrices
+
+# --- non-parametric gates ---
+
+
+def x_matrix():
+    return np.array([[0, 1], [1, 0]])
+
+
+def y_matrix():
+    return np.array([[0, -1j], [1j, 0]])
+
+
+def z_matrix():
+    return np.array([[1, 0], [0, -1]])
+
+
+def h_matrix():
+    return np.array([[1, 1], [1, -1]]) / np.sqrt(2)
+
+
+def i_matrix():
+    return np.eye(2)
+
+
+def s_matrix():
+    return np.diag([1, 1j])
+
+
+def t_matrix():
+    return np.diag([1, np.exp(1j * np.pi / 4)])
+
+
+# --- gates with a single param ---
+
+
+def rx_matrix(angle):
+    cos, sin = np.cos(angle / 2), np.sin(angle / 2)
+    return np.array([[cos, -1j * sin], [-1j * sin, cos]])
+
+
+def ry_matrix(angle):
+    cos, sin = np.cos(angle / 2), np.sin(angle / 2)
+    return np.array([[cos, -sin], [sin, cos]])
+
+
+def rz_matrix(angle):
+    return np.diag([np.exp(-1j * angle / 2), np.exp(1j * angle / 2)])
+
+
+def rh_matrix(angle):
+    cos, sin = np.cos(angle / 2), np.sin(angle / 2)
+    return np.exp(1j * angle / 2) * np.array(
+        [
+            [cos - 1j / np.sqrt(2) * sin, -1j / np.sqrt(2) * sin],
+            [-1j / np.sqrt(2) * sin, cos + 1j / np.sqrt(2) * sin],
+        ]
+    )
+
+
+def phase_matrix(angle):
+    return np.diag([1, np.exp(1j * angle)])
+
+
+def u3_matrix(theta, phi, lambda_):
+    # Angles are reduced in the same way as in _matrices.u3_matrix, which changes
+    # the global phase of the matrix.
+    return (
+        rz_matrix(phi % (2 * np.pi))
+        @ ry_matrix(theta % (2 * np.pi))
+        @ rz_matrix(lambda_ % (2 * np.pi))
+    )
+
+
+# --- non-parametric two qubit gates ---
+
+
+def cnot_matrix():
+    return np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]])
+
+
+def cz_matrix():
+    return np.diag([1, 1, 1, -1])
+
+
+def swap_matrix():
+    return np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]])
+
+
+def iswap_matrix():
+    return np.array([[1, 0, 0, 0], [0, 0, 1j, 0], [0, 1j, 0, 0], [0, 0, 0, 1]])
+
+
+# --- parametric two qubit gates ---
+
+
+def cphase_matrix(angle):
+    return np.diag([1, 1, 1, np.exp(1j * angle)])
+
+
+def xx_matrix(angle):
+    cos, sin = np.cos(angle / 2), np.sin(angle / 2)
+    return np.array(
+        [
+            [cos, 0, 0, -1j * sin],
+            [0, cos, -1j * sin, 0],
+            [0, -1j * sin, cos, 0],
+            [-1j * sin, 0, 0, cos],
+        ]
+    )
+
+
+def yy_matrix(angle):
+    cos, sin = np.cos(angle / 2), np.sin(angle / 2)
+    return np.array(
+        [
+            [cos, 0, 0, 1j * sin],
+            [0, cos, -1j * sin, 0],
+            [0, -1j * sin, cos, 0],
+            [1j * sin, 0, 0, cos],
+        ]
+    )
+
+
+def zz_matrix(angle):
+    return np.diag(
+        [
+            np.exp(-1j * angle / 2),
+            np.exp(1j * angle / 2),
+            np.exp(1j * angle / 2),
+            np.exp(-1j * angle / 2),
+        ]
+    )
+
+
+def xy_matrix(angle):
+    cos, sin = np.cos(angle / 2), np.sin(angle / 2)
+    return np.array(
+        [[1, 0, 0, 0], [0, cos, 1j * sin, 0], [0, 1j * sin, cos, 0], [0, 0, 0, 1]]
+    )
+
+
+# Names of built-in gates mapped to their sympy and numpy matrix factories.
+_BUILTIN_MATRIX_FACTORIES: Dict[str, Tuple[Callable, Callable]] = {
+    "X": (_matrices.x_matrix, x_matrix),
+    "Y": (_matrices.y_matrix, y_matrix),
+    "Z": (_matrices.z_matrix, z_matrix),
+    "H": (_matrices.h_matrix, h_matrix),
+    "I": (_matrices.i_matrix, i_matrix),
+    "S": (_matrices.s_matrix, s_matrix),
+    "T": (_matrices.t_matrix, t_matrix),
+    "RX": (_matrices.rx_matrix, rx_matrix),
+    "RY": (_matrices.ry_matrix, ry_matrix),
+    "RZ": (_matrices.rz_matrix, rz_matrix),
+    "RH": (_matrices.rh_matrix, rh_matrix),
+    "PHASE": (_matrices.phase_matrix, phase_matrix),
+    "U3": (_matrices.u3_matrix, u3_matrix),
+    "CNOT": (_matrices.cnot_matrix, cnot_matrix),
+    "CZ": (_matrices.cz_matrix, cz_matrix),
+    "SWAP": (_matrices.swap_matrix, swap_matrix),
+    "ISWAP": (_matrices.iswap_matrix, iswap_matrix),
+    "CPHASE": (_matrices.cphase_matrix, cphase_matrix),
+    "XX": (_matrices.xx_matrix, xx_matrix),
+    "YY": (_matrices.yy_matrix, yy_matrix),
+    "ZZ": (_matrices.zz_matrix, zz_matrix),
+    "XY": (_matrices.xy_matrix, xy_matrix),
+}
+
+
+def get_numeric_matrix_factory(
+    name: str, matrix_factory: Callable
+) -> Optional[Callable]:
+    """Get NumPy factory of a built-in gate.
+
+    Returns:
+        NumPy counterpart of matrix_factory if it is the factory of the built-in
+            gate with given name, None otherwise.
+    """
+    sympy_factory, numeric_factory = _BUILTIN_MATRIX_FACTORIES.get(name, (None, None))
+    return numeric_factory if matrix_factory is sympy_factory else None
+
+
+@lru_cache(maxsize=4096)
+def builtin_gate_matrix(name: str, params: Tuple[float, ...]) -> np.ndarray:
+    """Numeric matrix of the built-in gate with given name and parameters.
+
+    Matrices are cached, so gates without parameters and gates repeatedly used
+    with the same parameters are constructed only once. Returned arrays are
+    read-only, as they are shared between callers.
+    """
+    _, numeric_factory = _BUILTIN_MATRIX_FACTORIES[name]
+    matrix = np.asarray(numeric_factory(*params), dtype=complex)
+    matrix.flags.writeable = False
+    return matrix
@@ -30,12 +30,6 @@ def _bitstring_to_sympy_dense_vector(state):
     return sympy.kronecker_product(*[basis[bit] for bit in state])
 
 
-def _bitstring_to_numpy_dense_vector(state):
-    """Construct numpy array representation of a state given by a bitstring."""
-    basis = [np.array([1, 0]), np.array([0, 1])]
-    return reduce(np.kron, (basis[bit] for bit in state))
-
-
 def _permutation_matrix(target_indices_order, zeros, bitstring_to_dense_vector):
     """Construct a permutation matrix for N qubit system.
 
@@ -129,22 +123,74 @@ def _lift_matrix(
     )
 
 
+# Maximal number of entries in a block of columns of a unitary computed at once.
+# Small blocks stay in CPU cache while all matrices are applied to them.
+_MAX_BLOCK_SIZE = 2 ** 16
+
+
+def _apply_matrix_to_tensor(tensor, matrix, qubit_indices):
+    """Multiply operator stored as a tensor from the left by a matrix acting on
+    given qubits.
+
+    Args:
+        tensor: array of shape (2, ..., 2, m), whose first N axes correspond to rows
+            of an operator on N-qubit system, with qubit 0 being the most significant
+            one, and whose last axis enumerates columns.
+        matrix: numpy array acting on k qubits, whose first qubit is the most
+            significant one.
+        qubit_indices: indices of qubits that matrix acts on.
+    Returns:
+        Tensor of the same shape as `tensor`. Only axes of the target qubits are
+            contracted, so no matrix acting on the whole system is constructed.
+    """
+    num_targets = len(qubit_indices)
+    gate_tensor = np.reshape(matrix, (2,) * (2 * num_targets))
+    result = np.tensordot(
+        gate_tensor,
+        tensor,
+        axes=(list(range(num_targets, 2 * num_targets)), list(qubit_indices)),
+    )
+    return np.moveaxis(result, list(range(num_targets)), list(qubit_indices))
+
+
+def _unitary_from_matrices(matrices_and_qubits, num_qubits):
+    """Compose numpy matrices acting on subsystems of N-qubit system into a matrix
+    acting on the whole system.
+
+    Args:
+        matrices_and_qubits: pairs (matrix, qubit_indices), in the order in which the
+            matrices are applied.
+        num_qubits: number of qubits in the system.
+    Returns:
+        Numpy array equal to the product of lifted matrices.
+    Notes:
+        Columns are computed in blocks, by applying the matrices to columns of the
+        identity with `_apply_matrix_to_tensor`. Hence, apart from the result, only
+        a single block of columns is stored at a time.
+    """
+    dimension = 2 ** num_qubits
+    block_size = max(1, min(dimension, _MAX_BLOCK_SIZE // dimension))
+    unitary = np.empty((dimension, dimension), dtype=complex)
+    for start in range(0, dimension, block_size):
+        stop = min(start + block_size, dimension)
+        block = np.zeros((dimension, stop - start), dtype=complex)
+        block[np.arange(start, stop), np.arange(stop - start)] = 1
+        block = block.reshape((2,) * num_qubits + (stop - start,))
+        for matrix, qubit_indices in matrices_and_qubits:
+            block = _apply_matrix_to_tensor(block, matrix, qubit_indices)
+        unitary[:, start:stop] = block.reshape(dimension, stop - start)
+    return unitary
+
+
 def _lift_matrix_numpy(matrix, qubits, num_qubits):
     """A version of _lift_matrix working on numpy arrays.
 
-    Notice that the input matrix is typically sympy's matrix, so we have to first
-    convert it.
+    Notice that the input matrix can be sympy's matrix, so we have to first
+    convert it. Instead of permutation matrices, the matrix is applied to the
+    identity by contracting axes of target qubits.
     """
-    matrix = np.array(matrix, dtype=complex)
-    return _lift_matrix(
-        matrix,
-        qubits,
-        num_qubits,
-        np.zeros,
-        np.eye,
-        np.kron,
-        _bitstring_to_numpy_dense_vector,
-    )
+    matrix = np.asarray(matrix, dtype=complex)
+    return _unitary_from_matrices([(matrix, qubits)], num_qubits)
 
 
 def _lift_matrix_sympy(matrix, qubits, num_qubits):
@@ -1,12 +1,12 @@
 from dataclasses import dataclass
 from functools import singledispatch
 from numbers import Complex
-from typing import Sequence, Tuple
+from typing import Iterable, Sequence, Tuple
 
 import numpy as np
 import sympy
 
-from ._gates import Parameter, _sub_symbols
+from ._gates import Parameter, _get_free_symbols, _sub_symbols
 
 
 @singledispatch
@@ -51,6 +51,10 @@ class MultiPhaseOperation:
     ) -> "MultiPhaseOperation":
         return MultiPhaseOperation(new_params)
 
+    @property
+    def free_symbols(self) -> Iterable[sympy.Symbol]:
+        return _get_free_symbols(self.params)
+
     def apply(self, wavefunction: Sequence[Parameter]) -> Sequence[Parameter]:
         if len(wavefunction) != len(self.params):
             raise ValueError(
@@ -1,13 +1,14 @@
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import numpy as np
-import sympy
 from openfermion import SymbolicOperator
+from sympy import Symbol
 
 from .circuits import Circuit
 from .estimation import (
+    EstimationPlan,
     estimate_expectation_values_by_averaging,
-    evaluate_estimation_circuits,
+    estimate_expectation_values_for_batch,
 )
 from .gradients import finite_differences_gradient
 from .interfaces.ansatz import Ansatz
@@ -31,25 +32,6 @@ from .measurement import (
 )
 from .utils import ValueEstimate, create_symbols_map
 
-
-def _get_sorted_set_of_circuit_symbols(
-    estimation_tasks: List[EstimationTask],
-) -> List[sympy.Symbol]:
-
-    return sorted(
-        list(
-            set(
-                [
-                    param
-                    for task in estimation_tasks
-                    for param in task.circuit.free_symbols
-                ]
-            )
-        ),
-        key=str,
-    )
-
-
 _by_averaging = estimate_expectation_values_by_averaging
 
 
@@ -84,10 +66,12 @@ def get_ground_state_cost_function(
             using parameter_precision
         gradient_function: a function which returns a function used to compute the
             gradient of the cost function (see
-            zquantum.core.gradients.finite_differences_gradient for reference)
+            zquantum.core.gradients.finite_differences_gradient and
+            zquantum.core.gradients.parameter_shift_gradient for reference)
 
     Returns:
-        Callable
+        Callable. Its `function` attribute also has an `evaluate_batch` method, which
+        evaluates the cost function for every row of a parameter matrix at once.
     """
     estimation_tasks = [
         EstimationTask(
@@ -103,10 +87,52 @@ def get_ground_state_cost_function(
     for estimation_preprocessor in estimation_preprocessors:
         estimation_tasks = estimation_preprocessor(estimation_tasks)
 
-    circuit_symbols = _get_sorted_set_of_circuit_symbols(estimation_tasks)
+    cost_function = _GroundStateCostFunction(
+        estimation_tasks,
+        backend,
+        estimation_method,
+        fixed_parameters,
+        parameter_precision,
+        parameter_precision_seed,
+    )
+    return function_with_gradient(cost_function, gradient_function(cost_function))
+
+
+class _GroundStateCostFunction:
+    """Cost function created by get_ground_state_cost_function.
+
+    Besides evaluating the cost function, it exposes what gradients need to
+    evaluate it at many points at once or to estimate shifted circuits themselves
+    (see zquantum.core.gradients).
+    """
+
+    def __init__(
+        self,
+        estimation_tasks: List[EstimationTask],
+        backend: QuantumBackend,
+        estimation_method: EstimateExpectationValues,
+        fixed_parameters: Optional[np.ndarray],
+        parameter_precision: Optional[float],
+        parameter_precision_seed: Optional[int],
+    ):
+        self.estimation_tasks = estimation_tasks
+        self.backend = backend
+        self.estimation_method = estimation_method
+        self.fixed_parameters = fixed_parameters
+        self.parameter_precision = parameter_precision
+        self.parameter_precision_seed = parameter_precision_seed
+
+        # Frames and context selection circuits are prepared once, only parameters
+        # are bound on every call.
+        self._estimation_plan = EstimationPlan(estimation_tasks)
+        self.circuit_symbols = self._estimation_plan.circuit_symbols
+        n_fixed_parameters = (
+            len(fixed_parameters) if fixed_parameters is not None else 0
+        )
+        self.parameter_symbols = self.circuit_symbols[n_fixed_parameters:]
 
-    def ground_state_cost_function(
-        parameters: np.ndarray, store_artifact: StoreArtifact = None
+    def __call__(
+        self, parameters: np.ndarray, store_artifact: StoreArtifact = None
     ) -> ValueEstimate:
         """Evaluates the expectation value of the op
 
@@ -116,34 +142,62 @@ def get_ground_state_cost_function(
         Returns:
             value: estimated energy of the target operator with respect to the circuit
         """
-        nonlocal estimation_tasks
+        expectation_values_list = self.estimation_method(
+            self.backend, self._get_estimation_tasks(parameters)
+        )
+        return _sum_expectation_values(expectation_values_list)
+
+    def evaluate_batch(self, parameter_matrix: np.ndarray) -> List[ValueEstimate]:
+        """Evaluates the expectation value of the op for every row of the parameter
+        matrix, estimating expectation values for all rows with a single call of the
+        estimation method.
+
+        Args:
+            parameter_matrix: parameters for the parameterized quantum circuit, one
+                parameter vector per row
+
+        Returns:
+            values: estimated energies of the target operator, one per row
+        """
+        expectation_values_batch = estimate_expectation_values_for_batch(
+            self.backend,
+            [self._get_estimation_tasks(parameters) for parameters in parameter_matrix],
+            self.estimation_method,
+        )
+        return [
+            _sum_expectation_values(expectation_values_list)
+            for expectation_values_list in expectation_values_batch
+        ]
+
+    def get_symbols_map(self, parameters: np.ndarray) -> Dict[Symbol, Any]:
+        """Get the symbols map used to bind circuits for given parameters, including
+        fixed parameters and noise."""
         parameters = parameters.copy()
-        if fixed_parameters is not None:
-            parameters = combine_ansatz_params(fixed_parameters, parameters)
-        if parameter_precision is not None:
-            rng = np.random.default_rng(parameter_precision_seed)
-            noise_array = rng.normal(0.0, parameter_precision, len(parameters))
+        if self.fixed_parameters is not None:
+            parameters = combine_ansatz_params(self.fixed_parameters, parameters)
+        if self.parameter_precision is not None:
+            rng = np.random.default_rng(self.parameter_precision_seed)
+            noise_array = rng.normal(0.0, self.parameter_precision, len(parameters))
             parameters += noise_array
 
-        symbols_map = create_symbols_map(circuit_symbols, parameters)
-        current_estimation_tasks = evaluate_estimation_circuits(
-            estimation_tasks, [symbols_map for _ in estimation_tasks]
-        )
+        return create_symbols_map(self.circuit_symbols, parameters)
 
-        expectation_values_list = estimation_method(backend, current_estimation_tasks)
-        partial_sums: List[Any] = [
-            np.sum(expectation_values.values)
-            for expectation_values in expectation_values_list
-        ]
-        summed_values = np.sum(partial_sums)
-        if isinstance(summed_values, float):
-            return ValueEstimate(summed_values)
-        else:
-            raise ValueError(f"Result {summed_values} is not a float.")
+    def _get_estimation_tasks(self, parameters: np.ndarray) -> List[EstimationTask]:
+        return self._estimation_plan.evaluate(self.get_symbols_map(parameters))
 
-    return function_with_gradient(
-        ground_state_cost_function, gradient_function(ground_state_cost_function)
-    )
+
+def _sum_expectation_values(
+    expectation_values_list: List[ExpectationValues],
+) -> ValueEstimate:
+    partial_sums: List[Any] = [
+        np.sum(expectation_values.values)
+        for expectation_values in expectation_values_list
+    ]
+    summed_values = np.sum(partial_sums)
+    if isinstance(summed_values, float):
+        return ValueEstimate(summed_values)
+    else:
+        raise ValueError(f"Result {summed_values} is not a float.")
 
 
 def sum_expectation_values(expectation_values: ExpectationValues) -> ValueEstimate:
@@ -244,7 +298,8 @@ class AnsatzBasedCostFunction:
         for estimation_preprocessor in estimation_preprocessors:
             self.estimation_tasks = estimation_preprocessor(self.estimation_tasks)
 
-        self.circuit_symbols = _get_sorted_set_of_circuit_symbols(self.estimation_tasks)
+        self._estimation_plan = EstimationPlan(self.estimation_tasks)
+        self.circuit_symbols = self._estimation_plan.circuit_symbols
 
     def __call__(self, parameters: np.ndarray) -> ValueEstimate:
         """Evaluates the value of the cost function for given parameters.
@@ -255,6 +310,48 @@ class AnsatzBasedCostFunction:
         Returns:
             value: cost function value for given parameters.
         """
+        expectation_values_list = self.estimation_method(
+            self.backend, self._get_estimation_tasks(parameters)
+        )
+        return _sum_real_expectation_values(expectation_values_list)
+
+    def evaluate_batch(self, parameter_matrix: np.ndarray) -> List[ValueEstimate]:
+        """Evaluates the value of the cost function for every row of the parameter
+        matrix.
+
+        Expectation values for all rows are estimated with a single call of the
+        estimation method, so e.g. circuits for all parameter vectors are submitted
+        to the backend at once.
+
+        Args:
+            parameter_matrix: parameters for which the evaluation should occur, one
+                parameter vector per row.
+
+        Returns:
+            values: cost function values, one per row of parameter_matrix.
+        """
+        expectation_values_batch = estimate_expectation_values_for_batch(
+            self.backend,
+            [self._get_estimation_tasks(parameters) for parameters in parameter_matrix],
+            self.estimation_method,
+        )
+        return [
+            _sum_real_expectation_values(expectation_values_list)
+            for expectation_values_list in expectation_values_batch
+        ]
+
+    @property
+    def parameter_symbols(self) -> List[Symbol]:
+        """Symbols of circuit parameters which are not fixed, in the order of
+        parameters passed to the cost function."""
+        n_fixed_parameters = (
+            len(self.fixed_parameters) if self.fixed_parameters is not None else 0
+        )
+        return self.circuit_symbols[n_fixed_parameters:]
+
+    def get_symbols_map(self, parameters: np.ndarray) -> Dict[Symbol, Any]:
+        """Get the symbols map used to bind circuits for given parameters, including
+        fixed parameters and noise."""
         full_parameters = parameters.copy()
         if self.fixed_parameters is not None:
             full_parameters = combine_ansatz_params(self.fixed_parameters, parameters)
@@ -265,13 +362,18 @@ class AnsatzBasedCostFunction:
             )
             full_parameters += noise_array
 
-        symbols_map = create_symbols_map(self.circuit_symbols, full_parameters)
-        estimation_tasks = evaluate_estimation_circuits(
-            self.estimation_tasks, [symbols_map for _ in self.estimation_tasks]
-        )
-        expectation_values_list = self.estimation_method(self.backend, estimation_tasks)
-        combined_expectation_values = expectation_values_to_real(
-            concatenate_expectation_values(expectation_values_list)
-        )
+        return create_symbols_map(self.circuit_symbols, full_parameters)
 
-        return sum_expectation_values(combined_expectation_values)
+    def _get_estimation_tasks(self, parameters: np.ndarray) -> List[EstimationTask]:
+        if self._estimation_plan.estimation_tasks is not self.estimation_tasks:
+            self._estimation_plan = EstimationPlan(self.estimation_tasks)
+        return self._estimation_plan.evaluate(self.get_symbols_map(parameters))
+
+
+def _sum_real_expectation_values(
+    expectation_values_list: List[ExpectationValues],
+) -> ValueEstimate:
+    combined_expectation_values = expectation_values_to_real(
+        concatenate_expectation_values(expectation_values_list)
+    )
+    return sum_expectation_values(combined_expectation_values)
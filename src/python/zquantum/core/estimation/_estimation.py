@@ -1,14 +1,23 @@
-from typing import Dict, List, Optional, Tuple, cast
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
 
 import numpy as np
 import sympy
-from openfermion import IsingOperator, QubitOperator
-
-from ..circuits import RX, RY, Circuit
-from ..hamiltonian import estimate_nmeas_for_frames, group_comeasureable_terms_greedy
+from openfermion import IsingOperator, QubitOperator, SymbolicOperator
+
+from ..circuits import CNOT, CZ, RX, RY, Circuit, GateOperation, H, S
+from ..hamiltonian import (
+    estimate_nmeas_for_frames,
+    group_comeasureable_terms_by_coloring,
+    group_comeasureable_terms_greedy,
+    group_commuting_terms_by_coloring,
+)
 from ..interfaces.backend import QuantumBackend, QuantumSimulator
-from ..interfaces.estimation import EstimationTask
-from ..measurement import ExpectationValues, expectation_values_to_real
+from ..interfaces.estimation import EstimateExpectationValues, EstimationTask
+from ..measurement import (
+    ExpectationValues,
+    MeasurementsAccumulator,
+    expectation_values_to_real,
+)
 from ..openfermion import change_operator_type
 from ..utils import scale_and_discretize
 
@@ -46,20 +55,198 @@ def get_context_selection_circuit_for_group(
     return context_selection_circuit, transformed_operator
 
 
+def get_diagonalization_circuit_for_commuting_group(
+    qubit_operator: QubitOperator,
+) -> Tuple[Circuit, IsingOperator]:
+    """Get the Clifford circuit for measuring the expectation value of a group of
+    commuting Pauli terms.
+
+    The circuit is built from the stabilizer tableau of the group (see e.g.
+    arXiv:1907.13623): independent generators of the group are brought to the form
+    in which the X part is an identity matrix with Hadamard, CNOT, CZ and S gates,
+    and then mapped onto Z operators with Hadamard gates. Every term of the group is
+    mapped onto a product of Z operators up to a sign.
+
+    Args:
+        qubit_operator: operator representing group of commuting Pauli terms
+
+    Returns:
+        The diagonalization circuit and the operator it transforms qubit_operator
+            into.
+    """
+    terms = list(qubit_operator.terms)
+    n_qubits = max((qubit for term in terms for qubit, _ in term), default=-1) + 1
+    x, z = _get_symplectic_representation(terms, n_qubits)
+
+    diagonalization_circuit = Circuit(
+        _get_diagonalizing_clifford_operations(x, z), n_qubits=n_qubits
+    )
+    signs = np.zeros(len(terms), dtype=bool)
+    for operation in diagonalization_circuit.operations:
+        _conjugate_by_clifford_operation(x, z, signs, operation)
+    if x.any():
+        raise ValueError("Terms are not commuting")
+
+    transformed_operator = IsingOperator()
+    for term, z_row, sign in zip(terms, z, signs):
+        coefficient = qubit_operator.terms[term]
+        transformed_operator += IsingOperator(
+            tuple((int(qubit), "Z") for qubit in np.flatnonzero(z_row)),
+            -coefficient if sign else coefficient,
+        )
+    return diagonalization_circuit, transformed_operator
+
+
+def _get_symplectic_representation(
+    terms: List[Tuple[Tuple[int, str], ...]], n_qubits: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Get boolean matrices x and z whose rows encode Pauli terms. The term i acts on
+    qubit q with X if x[i, q] is set, with Z if z[i, q] is set and with Y if both are.
+    """
+    x = np.zeros((len(terms), n_qubits), dtype=bool)
+    z = np.zeros((len(terms), n_qubits), dtype=bool)
+    for row, term in enumerate(terms):
+        for qubit, operator in term:
+            x[row, qubit] = operator in ("X", "Y")
+            z[row, qubit] = operator in ("Z", "Y")
+    return x, z
+
+
+def _conjugate_by_clifford_operation(
+    x: np.ndarray, z: np.ndarray, signs: np.ndarray, operation: GateOperation
+):
+    """Replace in place Pauli terms P encoded by (x, z, signs) with U P U^dagger, where
+    U is the operation. Update rules follow arXiv:quant-ph/0406196."""
+    if operation.gate.name == "CZ":
+        control, target = operation.qubit_indices
+        for decomposed_operation in [H(target), CNOT(control, target), H(target)]:
+            _conjugate_by_clifford_operation(x, z, signs, decomposed_operation)
+    elif operation.gate.name == "CNOT":
+        control, target = operation.qubit_indices
+        signs ^= x[:, control] & z[:, target] & ~(x[:, target] ^ z[:, control])
+        x[:, target] ^= x[:, control]
+        z[:, control] ^= z[:, target]
+    else:
+        (qubit,) = operation.qubit_indices
+        signs ^= x[:, qubit] & z[:, qubit]
+        if operation.gate.name == "H":
+            x[:, qubit], z[:, qubit] = z[:, qubit].copy(), x[:, qubit].copy()
+        else:
+            z[:, qubit] ^= x[:, qubit]
+
+
+def _reduce_rows(
+    key: np.ndarray, *companions: np.ndarray
+) -> Tuple[List[int], List[np.ndarray]]:
+    """Bring the boolean matrix key to the reduced row echelon form over GF(2),
+    applying the same row operations to the companion matrices.
+
+    Returns:
+        Pivot columns of consecutive rows and the transformed [key, *companions].
+        Rows without pivots are moved to the end.
+    """
+    matrices = [matrix.copy() for matrix in (key, *companions)]
+    key = matrices[0]
+    pivot_columns: List[int] = []
+    for column in range(key.shape[1]):
+        row = len(pivot_columns)
+        candidates = np.flatnonzero(key[row:, column])
+        if len(candidates) == 0:
+            continue
+        pivot_row = row + candidates[0]
+        for matrix in matrices:
+            matrix[[row, pivot_row]] = matrix[[pivot_row, row]]
+        rows_to_clear = np.flatnonzero(key[:, column])
+        rows_to_clear = rows_to_clear[rows_to_clear != row]
+        for matrix in matrices:
+            matrix[rows_to_clear] ^= matrix[row]
+        pivot_columns.append(column)
+        if len(pivot_columns) == key.shape[0]:
+            break
+    return pivot_columns, matrices
+
+
+def _get_diagonalizing_clifford_operations(
+    x: np.ndarray, z: np.ndarray
+) -> List[GateOperation]:
+    operations: List[GateOperation] = []
+
+    def apply(operation):
+        operations.append(operation)
+        _conjugate_by_clifford_operation(x, z, np.zeros(len(x), dtype=bool), operation)
+
+    # Keep only independent generators of the group.
+    n_qubits = x.shape[1]
+    pivot_columns, (tableau,) = _reduce_rows(np.hstack([x, z]))
+    x = tableau[: len(pivot_columns), :n_qubits]
+    z = tableau[: len(pivot_columns), n_qubits:]
+
+    # Generators without X part have independent Z parts on qubits which are not X
+    # pivots, so Hadamards on these qubits make the X part full rank.
+    x_pivot_columns, (x, z) = _reduce_rows(x, z)
+    free_columns = np.setdiff1d(np.arange(n_qubits), x_pivot_columns)
+    z_pivot_columns, _ = _reduce_rows(z[len(x_pivot_columns) :, free_columns])
+    for column in z_pivot_columns:
+        apply(H(int(free_columns[column])))
+
+    pivot_columns, (x, z) = _reduce_rows(x, z)
+    if len(pivot_columns) != len(x):
+        raise ValueError("Terms are not commuting")
+
+    # Clear X parts outside of pivots, so that generator i is X on pivot i.
+    for row, pivot in enumerate(pivot_columns):
+        for qubit in np.flatnonzero(x[row]):
+            if qubit != pivot:
+                apply(CNOT(pivot, int(qubit)))
+
+    # Clear Z parts. Commutation makes Z parts on pivots symmetric, so a CZ between
+    # two pivots clears both entries.
+    for row, pivot in enumerate(pivot_columns):
+        for qubit in np.flatnonzero(z[row]):
+            if qubit != pivot:
+                apply(CZ(pivot, int(qubit)))
+        if z[row, pivot]:
+            apply(S(pivot))
+
+    for pivot in pivot_columns:
+        apply(H(pivot))
+
+    return operations
+
+
 def perform_context_selection(
     estimation_tasks: List[EstimationTask],
+    diagonalize_commuting_groups: bool = False,
 ) -> List[EstimationTask]:
     """Changes the circuits in estimation tasks to involve context selection.
 
+    Groups of co-measurable terms are measured with single-qubit rotations. If
+    diagonalize_commuting_groups is True, groups of terms which are commuting, but
+    not co-measurable, are measured with a Clifford diagonalization circuit (see
+    `get_diagonalization_circuit_for_commuting_group`).
+
     Args:
         estimation_tasks: list of estimation tasks
+        diagonalize_commuting_groups: whether groups of commuting terms, e.g.
+            produced by `group_by_commutation`, are allowed.
+
+    Raises:
+        ValueError: if terms of a group are not co-measurable, or not commuting
+            if diagonalize_commuting_groups is True.
     """
     output_estimation_tasks = []
     for estimation_task in estimation_tasks:
-        (
-            context_selection_circuit,
-            frame_operator,
-        ) = get_context_selection_circuit_for_group(estimation_task.operator)
+        operator = cast(QubitOperator, estimation_task.operator)
+        if diagonalize_commuting_groups and not _is_comeasureable_group(operator):
+            (
+                context_selection_circuit,
+                frame_operator,
+            ) = get_diagonalization_circuit_for_commuting_group(operator)
+        else:
+            (
+                context_selection_circuit,
+                frame_operator,
+            ) = get_context_selection_circuit_for_group(operator)
         frame_circuit = estimation_task.circuit + context_selection_circuit
         new_estimation_task = EstimationTask(
             frame_operator, frame_circuit, estimation_task.number_of_shots
@@ -68,6 +255,17 @@ def perform_context_selection(
     return output_estimation_tasks
 
 
+def _is_comeasureable_group(qubit_operator: QubitOperator) -> bool:
+    """Check if every qubit is acted on by at most one kind of Pauli operator in
+    terms of the operator, i.e. if its terms are pairwise co-measurable."""
+    context: Dict[int, str] = {}
+    return all(
+        context.setdefault(qubit, pauli) == pauli
+        for term in qubit_operator.terms
+        for qubit, pauli in term
+    )
+
+
 def group_individually(estimation_tasks: List[EstimationTask]) -> List[EstimationTask]:
     """
     Transforms list of estimation tasks by putting each term into a estimation task.
@@ -114,6 +312,60 @@ def group_greedily(
     return output_estimation_tasks
 
 
+def group_by_coloring(
+    estimation_tasks: List[EstimationTask], coloring_strategy: str = "dsatur"
+) -> List[EstimationTask]:
+    """
+    Transforms list of estimation tasks by grouping co-measurable terms with a graph
+    coloring heuristic. It usually produces fewer groups than greedy grouping.
+
+    Args:
+        estimation_tasks: list of estimation tasks
+        coloring_strategy: one of "largest-first", "dsatur" and "rlf", see
+            `zquantum.core.hamiltonian.group_comeasureable_terms_by_coloring`.
+    """
+    output_estimation_tasks = []
+    for estimation_task in estimation_tasks:
+        groups = group_comeasureable_terms_by_coloring(
+            cast(QubitOperator, estimation_task.operator),
+            coloring_strategy=coloring_strategy,
+        )
+        for group in groups:
+            group_estimation_task = EstimationTask(
+                group, estimation_task.circuit, estimation_task.number_of_shots
+            )
+            output_estimation_tasks.append(group_estimation_task)
+    return output_estimation_tasks
+
+
+def group_by_commutation(
+    estimation_tasks: List[EstimationTask], coloring_strategy: str = "dsatur"
+) -> List[EstimationTask]:
+    """
+    Transforms list of estimation tasks by grouping commuting terms with a graph
+    coloring heuristic. Groups need to be measured with Clifford diagonalization
+    circuits, which `perform_context_selection` adds if called with
+    diagonalize_commuting_groups=True.
+
+    Args:
+        estimation_tasks: list of estimation tasks
+        coloring_strategy: one of "largest-first", "dsatur" and "rlf", see
+            `zquantum.core.hamiltonian.group_commuting_terms_by_coloring`.
+    """
+    output_estimation_tasks = []
+    for estimation_task in estimation_tasks:
+        groups = group_commuting_terms_by_coloring(
+            cast(QubitOperator, estimation_task.operator),
+            coloring_strategy=coloring_strategy,
+        )
+        for group in groups:
+            group_estimation_task = EstimationTask(
+                group, estimation_task.circuit, estimation_task.number_of_shots
+            )
+            output_estimation_tasks.append(group_estimation_task)
+    return output_estimation_tasks
+
+
 def allocate_shots_uniformly(
     estimation_tasks: List[EstimationTask], number_of_shots: int
 ) -> List[EstimationTask]:
@@ -200,6 +452,112 @@ def evaluate_estimation_circuits(
     ]
 
 
+class EstimationPlan:
+    """Estimation tasks prepared once for repeated evaluation with different values
+    of circuit parameters, e.g. by a cost function.
+
+    Circuits of tasks created by grouping and context selection usually consist of
+    the same parametrized circuit followed by different circuits without free
+    symbols. The plan splits circuits into these two parts, so that every distinct
+    parametrized part is bound only once per evaluation and the remaining parts are
+    reused as they are.
+
+    Args:
+        estimation_tasks: the estimation tasks, usually already preprocessed.
+
+    Attributes:
+        estimation_tasks: See Args.
+        circuit_symbols: A list of all symbolic parameters used in any estimation task,
+            sorted by name.
+    """
+
+    def __init__(self, estimation_tasks: List[EstimationTask]):
+        self.estimation_tasks = estimation_tasks
+        self.circuit_symbols = sorted(
+            {
+                symbol
+                for estimation_task in estimation_tasks
+                for symbol in estimation_task.circuit.free_symbols
+            },
+            key=str,
+        )
+
+        self._parametrized_circuits: List[Circuit] = []
+        self._fixed_circuits: List[Optional[Circuit]] = []
+        self._parametrized_circuit_indices: List[int] = []
+        hashable_circuit_indices: Dict[Any, int] = {}
+        for estimation_task in estimation_tasks:
+            circuit = estimation_task.circuit
+            n_parametrized_operations = max(
+                (
+                    index + 1
+                    for index, operation in enumerate(circuit.operations)
+                    if operation.free_symbols
+                ),
+                default=0,
+            )
+            if n_parametrized_operations == len(circuit.operations):
+                parametrized_circuit = circuit
+                fixed_circuit = None
+            else:
+                parametrized_circuit = Circuit(
+                    circuit.operations[:n_parametrized_operations], circuit.n_qubits
+                )
+                fixed_circuit = Circuit(
+                    circuit.operations[n_parametrized_operations:], circuit.n_qubits
+                )
+            self._fixed_circuits.append(fixed_circuit)
+
+            key = (tuple(parametrized_circuit.operations), circuit.n_qubits)
+            try:
+                index = hashable_circuit_indices.setdefault(
+                    key, len(self._parametrized_circuits)
+                )
+            except TypeError:
+                # Gates like custom gates with matrices are not hashable.
+                index = next(
+                    (
+                        index
+                        for index, other in enumerate(self._parametrized_circuits)
+                        if other == parametrized_circuit
+                    ),
+                    len(self._parametrized_circuits),
+                )
+            if index == len(self._parametrized_circuits):
+                self._parametrized_circuits.append(parametrized_circuit)
+            self._parametrized_circuit_indices.append(index)
+
+    def evaluate(self, symbols_map: Dict[sympy.Symbol, Any]) -> List[EstimationTask]:
+        """Get the estimation tasks with circuits evaluated using the symbols map.
+
+        The result is the same as the one of `evaluate_estimation_circuits` called
+        with this symbols map for every task.
+
+        Args:
+            symbols_map: a dictionary that maps symbolic parameters used in the
+                circuits to their values
+        """
+        bound_circuits = [
+            circuit.bind(symbols_map) for circuit in self._parametrized_circuits
+        ]
+        return [
+            EstimationTask(
+                operator=estimation_task.operator,
+                circuit=(
+                    bound_circuits[index]
+                    if fixed_circuit is None
+                    else bound_circuits[index] + fixed_circuit
+                ),
+                number_of_shots=estimation_task.number_of_shots,
+            )
+            for estimation_task, index, fixed_circuit in zip(
+                self.estimation_tasks,
+                self._parametrized_circuit_indices,
+                self._fixed_circuits,
+            )
+        ]
+
+
 def split_constant_estimation_tasks(
     estimation_tasks: List[EstimationTask],
 ) -> Tuple[List[EstimationTask], List[EstimationTask], List[int], List[int]]:
@@ -318,9 +676,7 @@ def estimate_expectation_values_by_averaging(
 
     measured_expectation_values_list = [
         expectation_values_to_real(
-            measurements.get_expectation_values(
-                change_operator_type(frame_operator, IsingOperator)
-            )
+            measurements.get_expectation_values(_as_ising_operator(frame_operator))
         )
         for frame_operator, measurements in zip(operators, measurements_list)
     ]
@@ -344,6 +700,185 @@ def estimate_expectation_values_by_averaging(
     return cast(List[ExpectationValues], full_expectation_values)
 
 
+def estimate_expectation_values_adaptively(
+    backend: QuantumBackend,
+    estimation_tasks: List[EstimationTask],
+    target_precision: float,
+    total_n_shots: int,
+    n_pilot_shots: int = 100,
+    max_n_shots_per_round: Optional[int] = None,
+) -> List[ExpectationValues]:
+    """Estimate expectation values, allocating shots in rounds until the sum of all
+    expectation values reaches the target precision or the budget is spent.
+
+    A pilot round measures every task with n_pilot_shots. After every round, the
+    variance of each task's contribution to the sum is read from the estimator
+    covariances of its current expectation values. If the precision of the sum (see
+    `zquantum.core.cost_function.sum_expectation_values`) is not yet reached, the
+    number of shots needed to reach it is estimated and distributed among tasks
+    proportionally to their standard deviations, which minimizes the variance of
+    the sum. Each round is executed with a single `run_circuitset_and_measure`
+    call.
+
+    The number_of_shots of the tasks is ignored. To use this method as an
+    EstimateExpectationValues, bind its parameters with functools.partial.
+
+    Args:
+        backend: backend used for executing circuits
+        estimation_tasks: list of estimation tasks
+        target_precision: requested standard deviation of the sum of all
+            expectation values
+        total_n_shots: maximal number of shots used for all tasks together
+        n_pilot_shots: number of shots of each task in the pilot round
+        max_n_shots_per_round: maximal number of shots used in a single round after
+            the pilot round; unlimited if None
+    """
+    if target_precision <= 0:
+        raise ValueError("target_precision must be positive.")
+    if n_pilot_shots <= 1:
+        raise ValueError("n_pilot_shots must be greater than 1.")
+
+    (
+        estimation_tasks_to_measure,
+        estimation_tasks_for_constants,
+        indices_to_measure,
+        indices_for_constants,
+    ) = split_constant_estimation_tasks(estimation_tasks)
+
+    if total_n_shots < n_pilot_shots * len(estimation_tasks_to_measure):
+        raise ValueError(
+            "total_n_shots is too small to run the pilot round with "
+            f"{n_pilot_shots} shots for each of "
+            f"{len(estimation_tasks_to_measure)} estimation tasks."
+        )
+
+    circuits = [e.circuit for e in estimation_tasks_to_measure]
+    accumulators = [
+        MeasurementsAccumulator(_as_ising_operator(e.operator))
+        for e in estimation_tasks_to_measure
+    ]
+    shots_per_circuit = np.full(len(circuits), n_pilot_shots)
+    n_shots_used = np.zeros(len(circuits), dtype=int)
+
+    while shots_per_circuit.sum() > 0:
+        indices_to_run = np.flatnonzero(shots_per_circuit)
+        measurements_list = backend.run_circuitset_and_measure(
+            [circuits[index] for index in indices_to_run],
+            [int(shots_per_circuit[index]) for index in indices_to_run],
+        )
+        for index, measurements in zip(indices_to_run, measurements_list):
+            accumulators[index].add_measurements(measurements)
+        n_shots_used += shots_per_circuit
+
+        # Variance of a single shot of each task, estimated from the variance of
+        # its current contribution to the sum.
+        shot_variances = n_shots_used * np.array(
+            [
+                _get_estimator_variance(accumulator.get_expectation_values())
+                for accumulator in accumulators
+            ]
+        )
+        n_shots_left = total_n_shots - int(n_shots_used.sum())
+        if (
+            np.sum(shot_variances / n_shots_used) <= target_precision ** 2
+            or n_shots_left <= 0
+        ):
+            break
+
+        shot_deviations = np.sqrt(shot_variances)
+        n_shots_needed = int(
+            np.ceil(np.sum(shot_deviations) ** 2 / target_precision ** 2)
+        ) - int(n_shots_used.sum())
+        n_shots_in_round = min(n_shots_left, max(n_shots_needed, len(circuits)))
+        if max_n_shots_per_round is not None:
+            n_shots_in_round = min(n_shots_in_round, max_n_shots_per_round)
+
+        optimal_shots = (
+            (n_shots_used.sum() + n_shots_in_round)
+            * shot_deviations
+            / np.sum(shot_deviations)
+        )
+        shots_per_circuit = np.array(
+            scale_and_discretize(
+                np.maximum(optimal_shots - n_shots_used, 0), n_shots_in_round
+            )
+        )
+
+    full_expectation_values: List[Optional[ExpectationValues]] = [
+        None
+        for _ in range(
+            len(estimation_tasks_for_constants) + len(estimation_tasks_to_measure)
+        )
+    ]
+    for ex_val, final_index in zip(
+        evaluate_constant_estimation_tasks(estimation_tasks_for_constants),
+        indices_for_constants,
+    ):
+        full_expectation_values[final_index] = ex_val
+    for accumulator, final_index in zip(accumulators, indices_to_measure):
+        full_expectation_values[final_index] = expectation_values_to_real(
+            accumulator.get_expectation_values()
+        )
+
+    return cast(List[ExpectationValues], full_expectation_values)
+
+
+def _get_estimator_variance(expectation_values: ExpectationValues) -> float:
+    """Variance of the estimator of the sum of expectation values of a single task."""
+    estimator_covariances = cast(
+        List[np.ndarray], expectation_values.estimator_covariances
+    )
+    return max(float(np.real(np.sum(estimator_covariances[0]))), 0.0)
+
+
+def estimate_expectation_values_for_batch(
+    backend: QuantumBackend,
+    estimation_tasks_batch: Sequence[List[EstimationTask]],
+    estimation_method: EstimateExpectationValues = (
+        estimate_expectation_values_by_averaging
+    ),
+) -> List[List[ExpectationValues]]:
+    """Estimate expectation values for a batch of lists of estimation tasks at once.
+
+    All tasks are passed to the estimation method in a single call, so that e.g.
+    `estimate_expectation_values_by_averaging` submits circuits of the whole batch
+    to the backend with one `run_circuitset_and_measure` call. This is useful when
+    the same tasks are evaluated for many parameter vectors, e.g. when computing
+    gradients.
+
+    Args:
+        backend: backend used for executing circuits
+        estimation_tasks_batch: lists of estimation tasks, e.g. one list per
+            parameter vector
+        estimation_method: method used to estimate expectation values of all tasks
+
+    Returns:
+        A list with the expectation values of each list of tasks, in the order of
+        estimation_tasks_batch.
+    """
+    estimation_tasks = [
+        estimation_task
+        for estimation_tasks in estimation_tasks_batch
+        for estimation_task in estimation_tasks
+    ]
+    expectation_values_list = estimation_method(backend, estimation_tasks)
+
+    boundaries = np.cumsum(
+        [0] + [len(estimation_tasks) for estimation_tasks in estimation_tasks_batch]
+    )
+    return [
+        expectation_values_list[start:stop]
+        for start, stop in zip(boundaries[:-1], boundaries[1:])
+    ]
+
+
+def _as_ising_operator(operator: SymbolicOperator) -> IsingOperator:
+    # Operators returned by perform_context_selection are already IsingOperators.
+    if isinstance(operator, IsingOperator):
+        return operator
+    return change_operator_type(operator, IsingOperator)
+
+
 def calculate_exact_expectation_values(
     backend: QuantumSimulator,
     estimation_tasks: List[EstimationTask],
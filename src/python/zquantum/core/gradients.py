@@ -1,30 +1,204 @@
 """Module with definitions of gradient."""
+from concurrent.futures import Executor
+from dataclasses import replace
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
+
 import numpy as np
+import sympy
+
+from .circuits import Circuit, MatrixFactoryGate
+
+if TYPE_CHECKING:
+    from .interfaces.estimation import EstimationTask
+
+# Each of these gates is exp(-i angle G / 2) for G with eigenvalues +1 and -1, up to
+# a global phase, hence d<O>/d(angle) = (<O>(angle + pi/2) - <O>(angle - pi/2)) / 2.
+PARAMETER_SHIFT_GATE_NAMES = ("RX", "RY", "RZ", "PHASE", "CPHASE", "XX", "YY", "ZZ")
+_PARAMETER_SHIFT = np.pi / 2
 
 
-def finite_differences_gradient(function, finite_diff_step_size=1e-5):
-    """Create a (central) finite differences gradient for a given function.
+def finite_differences_gradient(
+    function,
+    finite_diff_step_size=1e-5,
+    method: str = "central",
+    executor: Optional[Executor] = None,
+):
+    """Create a finite differences gradient for a given function.
+
+    Central differences evaluate the function 2N times for N parameters, forward
+    differences N + 1 times at the cost of lower accuracy.
+
+    All evaluation points are prepared at once. If an executor is given, they are
+    dispatched to it, e.g. a ThreadPoolExecutor for functions waiting on remote
+    backends or a ProcessPoolExecutor for CPU-bound simulations (then the function
+    has to be picklable). Otherwise, if the function has an `evaluate_batch` method
+    accepting a matrix of parameter vectors (one per row), all points are evaluated
+    with a single call of this method.
 
     Args:
         function: callable accepting 1-D numpy arrays and returning float.
         finite_diff_step_size: finite difference size used to estimate gradient.
+        method: "central" or "forward".
+        executor: executor used to evaluate the function at all points in parallel.
     Returns:
-        A function that returns a gradient estimation using central finite
-        differences method.
+        A function that returns a gradient estimation using finite differences
+        method.
     """
+    if method not in ("central", "forward"):
+        raise ValueError(
+            f"Unknown finite differences method: {method}. "
+            "Supported methods are: central, forward."
+        )
+
+    evaluate_batch = getattr(function, "evaluate_batch", None)
+
+    def _evaluate(points: np.ndarray) -> np.ndarray:
+        if executor is not None:
+            return np.fromiter(
+                executor.map(function, points), dtype=float, count=len(points)
+            )
+        if evaluate_batch is not None:
+            return np.asarray(evaluate_batch(points), dtype=float)
+        values = np.empty(len(points))
+        for index, point in enumerate(points):
+            values[index] = function(point)
+        return values
 
     def _gradient(parameters):
-        gradient = np.array([])
-        for idx in range(len(parameters)):
-            values_plus = parameters.astype(float)
-            values_minus = parameters.astype(float)
-            values_plus[idx] += finite_diff_step_size
-            values_minus[idx] -= finite_diff_step_size
-            gradient = np.append(
-                gradient,
-                (function(values_plus) - function(values_minus))
-                / (2 * finite_diff_step_size),
+        parameters = parameters.astype(float)
+        n_params = len(parameters)
+        shifts = finite_diff_step_size * np.eye(n_params)
+        if method == "central":
+            values = _evaluate(
+                np.concatenate([parameters + shifts, parameters - shifts])
             )
-        return gradient
+            return (values[:n_params] - values[n_params:]) / (2 * finite_diff_step_size)
+        else:
+            values = _evaluate(np.vstack([parameters + shifts, parameters]))
+            return (values[:n_params] - values[n_params]) / finite_diff_step_size
+
+    return _gradient
+
+
+def parameter_shift_gradient(function):
+    """Create a gradient of a circuit-based cost function using the parameter-shift
+    rule.
+
+    The derivative with respect to a parameter is computed exactly (up to the
+    estimation error) by shifting the angle of every gate depending on the parameter
+    by +-pi/2. Symbols used by several gates and gate parameters that are linear
+    expressions of symbols are supported. All shifted circuits of all estimation
+    tasks are estimated with a single call of the estimation method.
+
+    Supported gates are the built-in gates listed in PARAMETER_SHIFT_GATE_NAMES.
+
+    Args:
+        function: cost function created by `get_ground_state_cost_function` or an
+            `AnsatzBasedCostFunction`. It has to provide `backend`,
+            `estimation_method`, `estimation_tasks`, `parameter_symbols` and
+            `get_symbols_map(parameters)`.
+    Returns:
+        A function that returns the gradient computed with the parameter-shift rule.
+
+    Raises:
+        ValueError: if a circuit contains a parametrized gate for which the rule
+            is not supported or a gate parameter is not linear in the symbols.
+    """
+    shifted_estimation_tasks, coefficients = _get_parameter_shift_estimation_tasks(
+        function.estimation_tasks, function.parameter_symbols
+    )
+
+    def _gradient(parameters):
+        if not shifted_estimation_tasks:
+            return np.zeros(len(parameters))
+
+        symbols_map = function.get_symbols_map(parameters)
+        expectation_values_list = function.estimation_method(
+            function.backend,
+            [
+                replace(
+                    estimation_task, circuit=estimation_task.circuit.bind(symbols_map)
+                )
+                for estimation_task in shifted_estimation_tasks
+            ],
+        )
+        values = np.array(
+            [
+                np.sum(np.real(expectation_values.values))
+                for expectation_values in expectation_values_list
+            ]
+        )
+        return coefficients @ (values[0::2] - values[1::2])
 
     return _gradient
+
+
+def _get_parameter_shift_estimation_tasks(
+    estimation_tasks: List["EstimationTask"],
+    parameter_symbols: Sequence[sympy.Symbol],
+) -> Tuple[List["EstimationTask"], np.ndarray]:
+    """Get estimation tasks with shifted gates needed for the parameter-shift rule.
+
+    Returns:
+        A tuple (shifted_estimation_tasks, coefficients). Shifted tasks come in
+        pairs with the gate parameter shifted by +pi/2 and -pi/2. The gradient is
+        coefficients @ (values_plus - values_minus), where values are summed
+        expectation values of consecutive pairs of tasks.
+    """
+    shifted_estimation_tasks = []
+    coefficient_columns = []
+    for estimation_task in estimation_tasks:
+        if all(term == () for term in estimation_task.operator.terms):
+            continue
+        operations = estimation_task.circuit.operations
+        for index, operation in enumerate(operations):
+            derivatives = _get_parameter_derivatives(operation, parameter_symbols)
+            if derivatives is None:
+                continue
+            (parameter,) = operation.params
+            for shift in (_PARAMETER_SHIFT, -_PARAMETER_SHIFT):
+                shifted_operations = list(operations)
+                shifted_operations[index] = operation.replace_params(
+                    (parameter + shift,)
+                )
+                shifted_estimation_tasks.append(
+                    replace(
+                        estimation_task,
+                        circuit=Circuit(
+                            shifted_operations, estimation_task.circuit.n_qubits
+                        ),
+                    )
+                )
+            coefficient_columns.append(derivatives / 2)
+
+    coefficients = (
+        np.stack(coefficient_columns, axis=1)
+        if coefficient_columns
+        else np.zeros((len(parameter_symbols), 0))
+    )
+    return shifted_estimation_tasks, coefficients
+
+
+def _get_parameter_derivatives(operation, parameter_symbols: Sequence[sympy.Symbol]):
+    """Get derivatives of the angle of the gate with respect to the parameters, or
+    None if the operation does not depend on any of them."""
+    if not set(operation.free_symbols).intersection(parameter_symbols):
+        return None
+    gate = getattr(operation, "gate", None)
+    if not (
+        isinstance(gate, MatrixFactoryGate)
+        and gate.name in PARAMETER_SHIFT_GATE_NAMES
+        and len(gate.params) == 1
+    ):
+        raise ValueError(
+            f"Parameter-shift rule is not supported for operation {operation}. "
+            f"Supported gates are: {', '.join(PARAMETER_SHIFT_GATE_NAMES)}."
+        )
+
+    (parameter,) = gate.params
+    derivatives = [sympy.diff(parameter, symbol) for symbol in parameter_symbols]
+    if any(getattr(derivative, "free_symbols", None) for derivative in derivatives):
+        raise ValueError(
+            f"Parameter {parameter} of gate {gate} is not linear in the parameters."
+        )
+    return np.array([float(derivative) for derivative in derivatives])
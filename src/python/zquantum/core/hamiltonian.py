@@ -1,5 +1,5 @@
 import copy
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 from openfermion.ops import InteractionOperator, InteractionRDM, QubitOperator
@@ -20,18 +20,89 @@ def is_comeasureable(
     Returns:
         bool: True if the terms are co-measureable.
     """
+    operators_1 = dict(term_1)
+    return all(
+        operators_1.get(qubit, operator) == operator for qubit, operator in term_2
+    )
+
 
-    for qubit_1, operator_1 in term_1:
-        for qubit_2, operator_2 in term_2:
+def _get_pauli_masks(
+    terms: Sequence[Tuple[Tuple[int, str], ...]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Encode Pauli terms as pairs of bitmasks.
 
-            # Check if the two Pauli operators act on the same qubit
-            if qubit_1 == qubit_2:
+    Bit q of the X (Z) mask of a term is set if the term acts on qubit q with X or Y
+    (Z or Y). Masks of qubit q are stored in word q // 64 of uint64 arrays.
+
+    Args:
+        terms: products of Pauli operators represented in openfermion style.
 
-                # Check if the two Pauli operators are different
-                if operator_1 != operator_2:
-                    return False
+    Returns:
+        Tuple (x_masks, z_masks) of arrays of shape (len(terms), number of words).
+    """
+    factors = [
+        (term_index, qubit, operator)
+        for term_index, term in enumerate(terms)
+        for qubit, operator in term
+    ]
+    term_indices = np.array([factor[0] for factor in factors], dtype=np.int64)
+    qubits = np.array([factor[1] for factor in factors], dtype=np.int64)
+    operators = np.array([factor[2] for factor in factors], dtype="U1")
+
+    n_words = int(qubits.max()) // 64 + 1 if len(factors) else 1
+    words = qubits // 64
+    bits = np.left_shift(np.uint64(1), (qubits % 64).astype(np.uint64))
+
+    masks = []
+    for pauli_operators in [("X", "Y"), ("Z", "Y")]:
+        mask = np.zeros((len(terms), n_words), dtype=np.uint64)
+        selected = np.isin(operators, pauli_operators)
+        np.bitwise_or.at(
+            mask, (term_indices[selected], words[selected]), bits[selected]
+        )
+        masks.append(mask)
+    return masks[0], masks[1]
 
-    return True
+
+def _assign_terms_to_groups_greedily(
+    x_masks: np.ndarray, z_masks: np.ndarray
+) -> np.ndarray:
+    """Assign every term to the first group with which it is co-measureable, opening
+    a new group if there is none.
+
+    Terms in a group are pairwise co-measureable, so every qubit is acted on by at
+    most one kind of Pauli operator in the group. Hence, it is enough to compare a
+    term with the union of masks of all the terms in a group.
+
+    Returns:
+        Array with the index of the group of every term.
+    """
+    n_terms = len(x_masks)
+    group_x_masks = np.zeros_like(x_masks)
+    group_z_masks = np.zeros_like(z_masks)
+    group_indices = np.empty(n_terms, dtype=np.int64)
+    n_groups = 0
+
+    for term_index in range(n_terms):
+        x_mask = x_masks[term_index]
+        z_mask = z_masks[term_index]
+        x_masks_of_groups = group_x_masks[:n_groups]
+        z_masks_of_groups = group_z_masks[:n_groups]
+        shared_qubits = (x_mask | z_mask) & (x_masks_of_groups | z_masks_of_groups)
+        conflicts = (
+            ((x_mask ^ x_masks_of_groups) | (z_mask ^ z_masks_of_groups))
+            & shared_qubits
+        ).any(axis=1)
+
+        group_index = int(np.argmin(conflicts)) if n_groups else 0
+        if n_groups == 0 or conflicts[group_index]:
+            group_index = n_groups
+            n_groups += 1
+        group_x_masks[group_index] |= x_mask
+        group_z_masks[group_index] |= z_mask
+        group_indices[term_index] = group_index
+
+    return group_indices
 
 
 def group_comeasureable_terms_greedy(
@@ -47,12 +118,25 @@ def group_comeasureable_terms_greedy(
         Returns:
         A list of qubit operators.
     """
+    terms, coefficients, constant_term = _split_terms_for_grouping(
+        qubit_operator, sort_terms
+    )
+    group_indices = _assign_terms_to_groups_greedily(*_get_pauli_masks(terms))
+    groups = _build_groups(terms, coefficients, group_indices)
+
+    # Constant term is handled as separate term to make it easier to exclude it
+    # from calculations or execution if that's needed.
+    if constant_term is not None:
+        groups.append(constant_term)
+
+    return groups
 
-    groups: List[
-        QubitOperator
-    ] = []  # List of QubitOperators representing groups of co-measureable terms
-    constant_term = None
 
+def _split_terms_for_grouping(
+    qubit_operator: QubitOperator, sort_terms: bool
+) -> Tuple[List[Tuple[Tuple[int, str], ...]], List[complex], Optional[QubitOperator]]:
+    """Get the non-constant terms of an operator with their coefficients (optionally
+    sorted by the absolute value of the coefficient) and the constant term."""
     if sort_terms:
         terms_iterator = sorted(
             qubit_operator.terms.items(), key=lambda x: abs(x[1]), reverse=True
@@ -60,42 +144,317 @@ def group_comeasureable_terms_greedy(
     else:
         terms_iterator = qubit_operator.terms.items()
 
+    constant_term = None
+    terms = []
+    coefficients = []
     for term, coefficient in terms_iterator:
-        assigned = False  # True if the current term has been assigned to a group
         if term == ():
             constant_term = QubitOperator(term, coefficient)
-            continue
-        for group in groups:
-            if all(
-                is_comeasureable(term, term_to_compare)
-                for term_to_compare in group.terms
-            ):
-                # Add the term to the group
-                group += QubitOperator(term, coefficient)
-                assigned = True
+        else:
+            terms.append(term)
+            coefficients.append(coefficient)
+    return terms, coefficients, constant_term
+
+
+def _build_groups(
+    terms: Sequence[Tuple[Tuple[int, str], ...]],
+    coefficients: Sequence[complex],
+    group_indices: np.ndarray,
+) -> List[QubitOperator]:
+    """Build one QubitOperator per group, keeping the order of terms. Groups are
+    ordered by their indices, which have to be consecutive integers starting at 0."""
+    n_groups = int(group_indices.max()) + 1 if len(group_indices) else 0
+    groups = [QubitOperator() for _ in range(n_groups)]
+    for term, coefficient, group_index in zip(terms, coefficients, group_indices):
+        groups[group_index].terms[term] = coefficient
+    return groups
+
+
+def _group_comeasureable_terms_greedy_sorted(
+    qubit_operator: QubitOperator,
+) -> List[QubitOperator]:
+    return group_comeasureable_terms_greedy(qubit_operator, True)
+
+
+def _get_comeasureability_conflicts(
+    x_masks: np.ndarray, z_masks: np.ndarray, block_size: int = 64
+) -> np.ndarray:
+    """Get the adjacency matrix of the graph whose edges connect terms that are not
+    co-measureable, i.e. the complement of the qubit-wise commutation graph.
+
+    Rows of the matrix are stored as bitsets (see numpy.packbits), so it takes
+    n_terms^2 / 8 bytes of memory, e.g. 1.25 GB for 10^5 terms.
+
+    Args:
+        x_masks, z_masks: Pauli terms encoded with `_get_pauli_masks`.
+        block_size: number of rows of the matrix computed at once.
+    """
+    supports = x_masks | z_masks
+    conflicts = np.zeros((len(x_masks), (len(x_masks) + 7) // 8), dtype=np.uint8)
+    for start in range(0, len(x_masks), block_size):
+        stop = start + block_size
+        mismatches = (
+            (x_masks[start:stop, np.newaxis] ^ x_masks)
+            | (z_masks[start:stop, np.newaxis] ^ z_masks)
+        ) & (supports[start:stop, np.newaxis] & supports)
+        conflicts[start:stop] = np.packbits(mismatches.any(axis=2), axis=1)
+    return conflicts
+
+
+# Number of set bits of every byte.
+_POPCOUNTS = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+
+
+def _get_neighbors(conflicts: np.ndarray, vertices) -> np.ndarray:
+    """Unpack rows of the adjacency matrix stored as bitsets into boolean arrays."""
+    bits = np.unpackbits(conflicts[vertices], axis=-1, count=conflicts.shape[0])
+    return bits.astype(bool)
+
+
+def _count_neighbors(
+    conflicts: np.ndarray, vertices: np.ndarray, block_size: int = 1024
+) -> np.ndarray:
+    """Count neighbors of every vertex among the vertices selected by a boolean
+    array."""
+    packed_vertices = np.packbits(vertices)
+    counts = np.zeros(conflicts.shape[0], dtype=np.int64)
+    for start in range(0, conflicts.shape[0], block_size):
+        counts[start : start + block_size] = _POPCOUNTS[
+            conflicts[start : start + block_size] & packed_vertices
+        ].sum(axis=1, dtype=np.int64)
+    return counts
+
+
+def _get_smallest_missing_color(colors: np.ndarray) -> int:
+    used = np.zeros(len(colors) + 1, dtype=bool)
+    used[colors[(colors >= 0) & (colors < len(used))]] = True
+    return int(np.argmin(used))
+
+
+def _color_largest_first(conflicts: np.ndarray) -> np.ndarray:
+    """Color vertices in the order of decreasing degree, always using the smallest
+    color not used by any neighbor."""
+    n_vertices = len(conflicts)
+    degrees = _count_neighbors(conflicts, np.ones(n_vertices, dtype=bool))
+    colors = np.full(n_vertices, -1, dtype=np.int64)
+    for vertex in np.argsort(-degrees, kind="stable"):
+        colors[vertex] = _get_smallest_missing_color(
+            colors[_get_neighbors(conflicts, vertex)]
+        )
+    return colors
+
+
+def _color_dsatur(conflicts: np.ndarray) -> np.ndarray:
+    """Color the uncolored vertex with the most distinct colors among its neighbors
+    (ties broken by degree) with the smallest color not used by any neighbor.
+    Reference: D. Brelaz, Commun. ACM 22, 251 (1979)."""
+    n_vertices = len(conflicts)
+    degrees = _count_neighbors(conflicts, np.ones(n_vertices, dtype=bool))
+    colors = np.full(n_vertices, -1, dtype=np.int64)
+    saturations = np.zeros(n_vertices, dtype=np.int64)
+    # Entry (v, c) is set if any neighbor of v has color c. Columns are added
+    # as new colors appear.
+    has_neighbor_with_color = np.zeros((n_vertices, 1), dtype=bool)
+
+    for _ in range(n_vertices):
+        priorities = np.where(colors < 0, saturations * (n_vertices + 1) + degrees, -1)
+        vertex = int(np.argmax(priorities))
+        available = ~has_neighbor_with_color[vertex]
+        if available.any():
+            color = int(np.argmax(available))
+        else:
+            color = has_neighbor_with_color.shape[1]
+            has_neighbor_with_color = np.hstack(
+                [has_neighbor_with_color, np.zeros_like(has_neighbor_with_color)]
+            )
+        colors[vertex] = color
+
+        neighbors = _get_neighbors(conflicts, vertex)
+        saturations[neighbors & ~has_neighbor_with_color[:, color]] += 1
+        has_neighbor_with_color[neighbors, color] = True
+
+    return colors
+
+
+def _color_recursive_largest_first(
+    conflicts: np.ndarray, block_size: int = 1024
+) -> np.ndarray:
+    """Build color classes one at a time. Each class starts from the uncolored vertex
+    of largest degree and grows by the candidate with the most neighbors among the
+    vertices excluded from the class (ties broken by the fewest neighbors among the
+    remaining candidates). Reference: F. T. Leighton, J. Res. Natl. Bur. Stand. 84,
+    489 (1979)."""
+    n_vertices = len(conflicts)
+    colors = np.full(n_vertices, -1, dtype=np.int64)
+    uncolored = np.ones(n_vertices, dtype=bool)
+    color = 0
+
+    while uncolored.any():
+        degrees = _count_neighbors(conflicts, uncolored)
+        candidates = uncolored.copy()
+        neighbors_in_excluded = np.zeros(n_vertices, dtype=np.int64)
+        vertex = int(np.argmax(np.where(candidates, degrees, -1)))
+
+        while True:
+            colors[vertex] = color
+            uncolored[vertex] = False
+            candidates[vertex] = False
+            newly_excluded = np.flatnonzero(
+                candidates & _get_neighbors(conflicts, vertex)
+            )
+            candidates[newly_excluded] = False
+            # The graph is undirected, so neighbors of newly excluded vertices
+            # can be counted from their rows.
+            for start in range(0, len(newly_excluded), block_size):
+                neighbors_in_excluded += _get_neighbors(
+                    conflicts, newly_excluded[start : start + block_size]
+                ).sum(axis=0)
+            if not candidates.any():
                 break
+            # A candidate is not adjacent to the class, so its remaining neighbors
+            # are either excluded or candidates.
+            neighbors_in_candidates = degrees - neighbors_in_excluded
+            priorities = neighbors_in_excluded * (n_vertices + 1) + (
+                n_vertices - neighbors_in_candidates
+            )
+            vertex = int(np.argmax(np.where(candidates, priorities, -1)))
 
-        # If term was not co-measureable with any group, it gets to start its own group!
-        if not assigned:
-            groups.append(QubitOperator(term, qubit_operator.terms[term]))
+        color += 1
+
+    return colors
+
+
+COLORING_STRATEGIES: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "largest-first": _color_largest_first,
+    "dsatur": _color_dsatur,
+    "rlf": _color_recursive_largest_first,
+}
+
+
+def _get_anticommutation_conflicts(
+    x_masks: np.ndarray, z_masks: np.ndarray, block_size: int = 64
+) -> np.ndarray:
+    """Get the adjacency matrix of the graph whose edges connect anticommuting terms.
+
+    Two Pauli terms anticommute iff their symplectic product, i.e. the parity of the
+    number of qubits on which x_1 z_2 differs from z_1 x_2, is odd.
+
+    Rows of the matrix are stored as bitsets, as in `_get_comeasureability_conflicts`.
+
+    Args:
+        x_masks, z_masks: Pauli terms encoded with `_get_pauli_masks`.
+        block_size: number of rows of the matrix computed at once.
+    """
+    conflicts = np.zeros((len(x_masks), (len(x_masks) + 7) // 8), dtype=np.uint8)
+    for start in range(0, len(x_masks), block_size):
+        stop = start + block_size
+        symplectic_products = np.bitwise_xor.reduce(
+            (x_masks[start:stop, np.newaxis] & z_masks)
+            ^ (z_masks[start:stop, np.newaxis] & x_masks),
+            axis=2,
+        )
+        for shift in [32, 16, 8, 4, 2, 1]:
+            symplectic_products ^= symplectic_products >> np.uint64(shift)
+        conflicts[start:stop] = np.packbits(
+            (symplectic_products & np.uint64(1)).astype(bool), axis=1
+        )
+    return conflicts
+
+
+def _group_terms_by_coloring(
+    qubit_operator: QubitOperator,
+    coloring_strategy: str,
+    get_conflicts: Callable[[np.ndarray, np.ndarray], np.ndarray],
+) -> List[QubitOperator]:
+    coloring_function = COLORING_STRATEGIES.get(coloring_strategy)
+    if coloring_function is None:
+        raise ValueError(
+            f"Unrecognized coloring strategy {coloring_strategy}."
+            f"Allowed values are {list(COLORING_STRATEGIES.keys())}"
+        )
+
+    terms, coefficients, constant_term = _split_terms_for_grouping(
+        qubit_operator, sort_terms=False
+    )
+    conflicts = get_conflicts(*_get_pauli_masks(terms))
+    groups = _build_groups(terms, coefficients, coloring_function(conflicts))
 
-    # Constant term is handled as separate term to make it easier to exclude it
-    # from calculations or execution if that's needed.
     if constant_term is not None:
         groups.append(constant_term)
 
     return groups
 
 
-def _group_comeasureable_terms_greedy_sorted(
+def group_comeasureable_terms_by_coloring(
+    qubit_operator: QubitOperator, coloring_strategy: str = "dsatur"
+) -> List[QubitOperator]:
+    """Group co-measurable terms in a qubit operator by coloring the graph whose edges
+    connect terms that are not co-measureable. Terms with the same color form a group.
+    Constant term is included as a separate group.
+
+    Args:
+        qubit_operator: the operator whose terms are to be grouped
+        coloring_strategy: the graph coloring heuristic, one of "largest-first",
+            "dsatur" and "rlf" (recursive largest first).
+
+    Returns:
+        A list of qubit operators.
+    """
+    return _group_terms_by_coloring(
+        qubit_operator, coloring_strategy, _get_comeasureability_conflicts
+    )
+
+
+def group_commuting_terms_by_coloring(
+    qubit_operator: QubitOperator, coloring_strategy: str = "dsatur"
+) -> List[QubitOperator]:
+    """Group commuting terms in a qubit operator by coloring the graph whose edges
+    connect anticommuting terms. Terms with the same color form a group. Constant
+    term is included as a separate group.
+
+    Unlike co-measureable terms, commuting terms may act on the same qubit with
+    different Pauli operators, so measuring a group requires an entangling
+    diagonalization circuit (see
+    `zquantum.core.estimation.get_diagonalization_circuit_for_commuting_group`).
+    In exchange, the number of groups is usually several times smaller.
+
+    Args:
+        qubit_operator: the operator whose terms are to be grouped
+        coloring_strategy: the graph coloring heuristic, one of "largest-first",
+            "dsatur" and "rlf" (recursive largest first).
+
+    Returns:
+        A list of qubit operators.
+    """
+    return _group_terms_by_coloring(
+        qubit_operator, coloring_strategy, _get_anticommutation_conflicts
+    )
+
+
+def _group_comeasureable_terms_largest_first(
     qubit_operator: QubitOperator,
 ) -> List[QubitOperator]:
-    return group_comeasureable_terms_greedy(qubit_operator, True)
+    return group_comeasureable_terms_by_coloring(qubit_operator, "largest-first")
+
+
+def _group_comeasureable_terms_dsatur(
+    qubit_operator: QubitOperator,
+) -> List[QubitOperator]:
+    return group_comeasureable_terms_by_coloring(qubit_operator, "dsatur")
+
+
+def _group_comeasureable_terms_rlf(
+    qubit_operator: QubitOperator,
+) -> List[QubitOperator]:
+    return group_comeasureable_terms_by_coloring(qubit_operator, "rlf")
 
 
 DECOMPOSITION_METHODS: Dict[str, Callable[[QubitOperator], List[QubitOperator]]] = {
     "greedy": group_comeasureable_terms_greedy,
     "greedy-sorted": _group_comeasureable_terms_greedy_sorted,
+    "largest-first": _group_comeasureable_terms_largest_first,
+    "dsatur": _group_comeasureable_terms_dsatur,
+    "rlf": _group_comeasureable_terms_rlf,
 }
 
 
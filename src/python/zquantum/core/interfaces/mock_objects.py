@@ -27,7 +27,6 @@ class MockQuantumBackend(QuantumBackend):
         self, circuit: Circuit, n_samples: Optional[int] = None, **kwargs
     ) -> Measurements:
         super(MockQuantumBackend, self).run_circuit_and_measure(circuit)
-        measurements = Measurements()
 
         n_samples_to_measure: int
         if isinstance(n_samples, int):
@@ -39,10 +38,12 @@ class MockQuantumBackend(QuantumBackend):
                 "At least one of n_samples and self.n_samples must be an integer."
             )
 
-        for _ in range(n_samples_to_measure):
-            measurements.bitstrings += [
+        measurements = Measurements(
+            [
                 tuple(random.randint(0, 1) for j in range(circuit.n_qubits))
+                for _ in range(n_samples_to_measure)
             ]
+        )
 
         return measurements
 
@@ -64,13 +65,14 @@ class MockQuantumSimulator(QuantumSimulator):
         self, circuit: Circuit, n_samples=None, **kwargs
     ) -> Measurements:
         super(MockQuantumSimulator, self).run_circuit_and_measure(circuit)
-        measurements = Measurements()
         if n_samples is None:
             n_samples = self.n_samples
-        for _ in range(n_samples):
-            measurements.bitstrings += [
+        measurements = Measurements(
+            [
                 tuple(random.randint(0, 1) for j in range(circuit.n_qubits))
+                for _ in range(n_samples)
             ]
+        )
 
         return measurements
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import copy
 import json
+import os
 from collections import Counter
+from functools import lru_cache
 from typing import (
     Any,
     Dict,
@@ -22,12 +23,15 @@ from pyquil.wavefunction import Wavefunction
 from zquantum.core.typing import AnyPath, LoadSource
 
 from .bitstring_distribution import BitstringDistribution
+from .bitstring_distribution._bitstring_distribution import (
+    _MAX_N_QUBITS_FOR_INDICES,
+    _bit_matrix_to_indices,
+)
 from .utils import (
     SCHEMA_VERSION,
     convert_array_to_dict,
     convert_dict_to_array,
-    convert_tuples_to_bitstrings,
-    sample_from_probability_distribution,
+    sample_counts_from_probabilities,
 )
 
 
@@ -180,25 +184,96 @@ class ExpectationValues:
 
 
 def sample_from_wavefunction(
-    wavefunction: Wavefunction, n_samples: int
+    wavefunction: Wavefunction,
+    n_samples: int,
+    seed: Optional[Union[int, np.random.Generator]] = None,
 ) -> List[Tuple[int, ...]]:
     """Sample bitstrings from a wavefunction.
 
     Args:
         wavefunction (Wavefunction): the wavefunction to sample from.
         n_samples (int): the number of samples taken.
+        seed: seed of the random number generator, or the generator itself.
 
     Returns:
         List[Tuple[int]]: A list of tuples where the each tuple is a sampled bitstring.
     """
-    rng = np.random.default_rng()
-    outcomes_str, probabilities_np = zip(*wavefunction.get_outcome_probs().items())
-    probabilities = [
-        x[0] if isinstance(x, (list, np.ndarray)) else x for x in list(probabilities_np)
-    ]
-    samples_ndarray = rng.choice(a=outcomes_str, size=n_samples, p=probabilities)
-    samples = [tuple(int(y) for y in list(x)[::-1]) for x in list(samples_ndarray)]
-    return samples
+    rng = np.random.default_rng(seed)
+    probabilities = np.ravel(wavefunction.probabilities())
+    indices = rng.choice(
+        len(probabilities), size=n_samples, p=probabilities / probabilities.sum()
+    )
+    bits = _basis_state_indices_to_bit_matrix(
+        indices, _get_number_of_qubits(probabilities)
+    )
+    return [tuple(row) for row in bits.tolist()]
+
+
+def sample_measurements_from_wavefunction(
+    wavefunction: Wavefunction,
+    n_samples: int,
+    seed: Optional[Union[int, np.random.Generator]] = None,
+) -> Measurements:
+    """Sample measurements from a wavefunction.
+
+    Samples are drawn directly from the array of probabilities of the wavefunction
+    and returned as a histogram, so neither a dictionary over all basis states nor
+    a list of individual samples is ever built.
+
+    Args:
+        wavefunction: the wavefunction to sample from.
+        n_samples: the number of samples taken.
+        seed: seed of the random number generator, or the generator itself.
+
+    Returns:
+        The sampled measurements, with qubit i of each bitstring being the i-th
+            least significant bit of the index of the sampled basis state.
+    """
+    return sample_measurements_from_probabilities(
+        np.ravel(wavefunction.probabilities()), n_samples, seed
+    )
+
+
+def sample_measurements_from_probabilities(
+    probabilities: np.ndarray,
+    n_samples: int,
+    seed: Optional[Union[int, np.random.Generator]] = None,
+) -> Measurements:
+    """Sample measurements from probabilities of basis states.
+
+    Args:
+        probabilities: array of length 2^n holding probabilities of basis states,
+            ordered as amplitudes of a wavefunction.
+        n_samples: the number of samples taken.
+        seed: seed of the random number generator, or the generator itself.
+
+    Returns:
+        The sampled measurements, see sample_measurements_from_wavefunction.
+    """
+    probabilities = np.ravel(probabilities)
+    counts = sample_counts_from_probabilities(probabilities, n_samples, seed)
+    indices = np.flatnonzero(counts)
+
+    measurements = Measurements()
+    measurements._append_bit_matrix(
+        _basis_state_indices_to_bit_matrix(
+            indices, _get_number_of_qubits(probabilities)
+        ),
+        counts[indices],
+    )
+    return measurements
+
+
+def _get_number_of_qubits(probabilities: np.ndarray) -> int:
+    return int(np.log2(len(probabilities)))
+
+
+def _basis_state_indices_to_bit_matrix(
+    indices: np.ndarray, n_qubits: int
+) -> np.ndarray:
+    """Convert indices of computational basis states into a 2D array of bits, where
+    bit i of a row is the i-th least significant bit of the index."""
+    return ((indices[:, np.newaxis] >> np.arange(n_qubits)) & 1).astype(np.uint8)
 
 
 class Parities:
@@ -324,13 +399,18 @@ def get_expectation_values_from_parities(parities: Parities) -> ExpectationValue
 
 
 def get_parities_from_measurements(
-    measurements: List[Tuple[int]], ising_operator: IsingOperator
+    measurements: List[Tuple[int]],
+    ising_operator: IsingOperator,
+    include_correlations: bool = True,
 ) -> Parities:
     """Get expectation values from bitstrings.
 
     Args:
         measurements (list): the measured bitstrings
         ising_operator (openfermion.ops.IsingOperator): the operator
+        include_correlations: whether to count parities of pairwise products of
+            terms. These are not needed by get_expectation_values_from_parities, and
+            skipping them avoids building an N x N x 2 array for N terms.
 
     Returns:
         zquantum.core.measurement.Parities: the parities of each term in the operator
@@ -340,35 +420,30 @@ def get_parities_from_measurements(
     if not isinstance(ising_operator, IsingOperator):
         raise TypeError("Input operator not openfermion.IsingOperator")
 
-    # Count number of occurrences of bitstrings
-    bitstring_frequencies = Counter(measurements)
+    n_terms = len(ising_operator.terms)
+    bits, counts = Measurements(measurements)._get_unique_bit_matrix_and_counts()
+    n_measurements = counts.sum()
+
+    if n_measurements > 0:
+        # Table of +-1 eigenvalues with one row per distinct bitstring
+        signs = _get_parity_signs(
+            bits, _get_term_mask_matrix(list(ising_operator.terms), bits.shape[1])
+        )
+    else:
+        signs = np.zeros((0, n_terms))
 
     # Count parity occurrences
-    values = []
-    for _, term in enumerate(ising_operator.terms):
-        values.append([0, 0])
-        marked_qubits = [op[0] for op in term]
-        for bitstring, count in bitstring_frequencies.items():
-            if check_parity(bitstring, marked_qubits):
-                values[-1][0] += count
-            else:
-                values[-1][1] += count
-
-    # Count parity occurrences for pairwise products of operators
-    correlations = [np.zeros((len(ising_operator.terms), len(ising_operator.terms), 2))]
-    for term1_index, term1 in enumerate(ising_operator.terms):
-        for term2_index, term2 in enumerate(ising_operator.terms):
-            marked_qubits_term1 = [op[0] for op in term1]
-            marked_qubits_term2 = [op[0] for op in term2]
-            for bitstring, count in bitstring_frequencies.items():
-                parity1 = check_parity(bitstring, marked_qubits_term1)
-                parity2 = check_parity(bitstring, marked_qubits_term2)
-                if parity1 == parity2:
-                    correlations[0][term1_index, term2_index][0] += count
-                else:
-                    correlations[0][term1_index, term2_index][1] += count
-
-    return Parities(np.array(values), correlations)
+    even_counts = np.rint(counts @ (1 + signs) / 2).astype(np.int64)
+    values = np.stack([even_counts, n_measurements - even_counts], axis=1)
+
+    # Count parity occurrences for pairwise products of operators. Terms j and k have
+    # equal parity on a bitstring exactly when their signs multiply to 1.
+    correlations: Optional[List[np.ndarray]] = None
+    if include_correlations:
+        equal_counts = (n_measurements + (signs.T * counts) @ signs) / 2
+        correlations = [np.stack([equal_counts, n_measurements - equal_counts], axis=2)]
+
+    return Parities(values, correlations)
 
 
 def expectation_values_to_real(
@@ -453,22 +528,262 @@ def get_expectation_value_from_frequencies(
     return expectation
 
 
+def _get_term_mask_matrix(
+    terms: Sequence[Tuple[Tuple[int, str], ...]], n_qubits: int
+) -> np.ndarray:
+    """Build a matrix marking the qubits that each product of Z operators acts on.
+
+    Args:
+        terms: terms of an IsingOperator, e.g. ((0, "Z"), (2, "Z")).
+        n_qubits: number of measured qubits.
+
+    Returns:
+        Array of dtype uint8 and shape (len(terms), n_qubits), with entry [i, q]
+            equal to 1 if term i acts on qubit q and 0 otherwise.
+    """
+    masks = np.zeros((len(terms), n_qubits), dtype=np.uint8)
+    for term_index, term in enumerate(terms):
+        for qubit_index, _ in term:
+            if qubit_index >= n_qubits:
+                raise ValueError(
+                    f"Operator acts on qubit {qubit_index}, but only {n_qubits} "
+                    "qubits were measured."
+                )
+            masks[term_index, qubit_index] ^= 1
+    return masks
+
+
+@lru_cache(maxsize=1024)
+def _get_cached_term_mask_matrix(
+    terms: Tuple[Tuple[Tuple[int, str], ...], ...], n_qubits: int
+) -> np.ndarray:
+    """Cached version of _get_term_mask_matrix, for operators which are measured
+    repeatedly, e.g. frames of a cost function. The returned array is read-only."""
+    masks = _get_term_mask_matrix(terms, n_qubits)
+    masks.flags.writeable = False
+    return masks
+
+
+def _get_parity_signs(bits: np.ndarray, term_masks: np.ndarray) -> np.ndarray:
+    """Compute the eigenvalue of each product of Z operators on each bitstring.
+
+    Args:
+        bits: array of shape (number of bitstrings, n_qubits) with measured bits.
+        term_masks: array of shape (number of terms, n_qubits), as returned by
+            _get_term_mask_matrix.
+
+    Returns:
+        Array of shape (number of bitstrings, number of terms) with entry [b, i]
+            equal to 1 if bitstring b has even parity on the qubits of term i and -1
+            otherwise.
+    """
+    # Floating point product is exact here and lets numpy dispatch to BLAS.
+    parities = (bits.astype(np.float64) @ term_masks.T.astype(np.float64)) % 2
+    return 1.0 - 2.0 * parities
+
+
+# Binary measurements files start with this magic string, followed by the length of
+# a JSON header (little endian uint32), the header itself padded with spaces so that
+# the data is aligned, and finally the packed bit matrix stored row by row.
+_BINARY_MEASUREMENTS_MAGIC = b"ZQMEAS01"
+_BINARY_MEASUREMENTS_ALIGNMENT = 64
+
+
+def _bitstrings_to_bit_matrix(bitstrings: Sequence[Sequence[int]]) -> np.ndarray:
+    """Convert a sequence of measured bitstrings into a 2D array of bits.
+
+    Args:
+        bitstrings: the bitstrings, each given as a sequence of 0s and 1s.
+
+    Returns:
+        Array of dtype uint8 and shape (number of bitstrings, number of qubits).
+    """
+    if len(bitstrings) == 0:
+        return np.zeros((0, 0), dtype=np.uint8)
+    try:
+        bits = np.asarray(bitstrings, dtype=np.uint8)
+    except OverflowError:
+        raise ValueError("Measured bits must be 0 or 1.")
+    except ValueError:
+        raise ValueError("All measured bitstrings must have the same length.")
+    if bits.ndim != 2:
+        raise ValueError("All measured bitstrings must have the same length.")
+    return bits
+
+
+def _pack_bits(bits: np.ndarray) -> np.ndarray:
+    """Pack rows of a 2D array of measured bits, see numpy.packbits.
+
+    Raises:
+        ValueError: if any entry is different from 0 and 1.
+    """
+    if bits.size > 0 and bits.max() > 1:
+        raise ValueError("Measured bits must be 0 or 1.")
+    return np.packbits(bits, axis=1)
+
+
+def _strings_to_bit_matrix(bitstrings: Sequence[str], n_qubits: int) -> np.ndarray:
+    """Convert same-length strings of 0s and 1s into a 2D array of bits.
+
+    Args:
+        bitstrings: the bitstrings, e.g. ["001", "110"].
+        n_qubits: length of each bitstring.
+
+    Returns:
+        Array of dtype uint8 and shape (number of bitstrings, n_qubits).
+    """
+    if any(len(bitstring) != n_qubits for bitstring in bitstrings):
+        raise ValueError("All measured bitstrings must have the same length.")
+    characters = np.frombuffer("".join(bitstrings).encode("ascii"), dtype=np.uint8)
+    return (characters - ord("0")).reshape(len(bitstrings), n_qubits)
+
+
+def _bit_matrix_to_strings(bits: np.ndarray) -> List[str]:
+    """Convert a 2D array of bits into strings of 0s and 1s, one per row."""
+    n_rows, n_qubits = bits.shape
+    if n_qubits == 0:
+        return [""] * n_rows
+    characters = (bits + ord("0")).astype(np.uint8).tobytes().decode("ascii")
+    return [
+        characters[start : start + n_qubits]
+        for start in range(0, n_rows * n_qubits, n_qubits)
+    ]
+
+
 class Measurements:
-    """A class representing measurements from a quantum circuit. The bitstrings variable
-    represents the internal data structure of the Measurements class. It is expressed as
-    a list of tuples wherein each tuple is a measurement and the value of the tuple at a
-    given index is the measured bit-value of the qubit (indexed from 0 -> N-1)"""
-
-    def __init__(self, bitstrings: Optional[List[Tuple[int, ...]]] = None):
-        if bitstrings is None:
-            self.bitstrings = []
+    """A class representing measurements from a quantum circuit.
+
+    Measured bitstrings are stored as a packed bit matrix, where bit i of a row is
+    the value measured on qubit i, together with an optional array of counts. When
+    measurements are created from a list of bitstrings, every row is a single
+    measurement. When they are created from a histogram (see from_counts and
+    add_counts), every row is a bitstring with its number of occurrences, and
+    individual measurements are never expanded unless requested through
+    get_bit_matrix or the bitstrings attribute.
+
+    The bitstrings attribute is a list of tuples wherein each tuple is a
+    measurement and the value of the tuple at a given index is the measured
+    bit-value of the qubit (indexed from 0 -> N-1). This list is built on access,
+    so array-based methods (get_counts, get_distribution, etc.) should be preferred
+    for large numbers of measurements. Modifying the returned list in place, e.g.
+    with append, does not change the measurements. Assign a new list to the
+    attribute or use add_counts instead.
+    """
+
+    def __init__(self, bitstrings: Optional[Sequence[Sequence[int]]] = None):
+        self._set_bit_matrix(
+            _bitstrings_to_bit_matrix([] if bitstrings is None else bitstrings)
+        )
+
+    @property
+    def bitstrings(self) -> List[Tuple[int, ...]]:
+        """Copy of the measured bitstrings, see the class docstring."""
+        return [tuple(row) for row in self.get_bit_matrix().tolist()]
+
+    @bitstrings.setter
+    def bitstrings(self, bitstrings: Sequence[Sequence[int]]):
+        self._set_bit_matrix(_bitstrings_to_bit_matrix(bitstrings))
+
+    @property
+    def n_samples(self) -> int:
+        """Number of measurements."""
+        if self._counts is None:
+            return self._packed_bits.shape[0]
+        return int(self._counts.sum())
+
+    @property
+    def n_qubits(self) -> Optional[int]:
+        """Number of measured qubits, or None if there are no measurements yet."""
+        return self._n_qubits
+
+    def get_bit_matrix(self) -> np.ndarray:
+        """Get the measurements as a 2D array of bits.
+
+        Returns:
+            Array of dtype uint8 and shape (n_samples, n_qubits).
+        """
+        packed_bits = self._packed_bits
+        if self._counts is not None:
+            packed_bits = np.repeat(packed_bits, self._counts, axis=0)
+        return np.unpackbits(packed_bits, axis=1, count=self._n_qubits or 0)
+
+    def _set_bit_matrix(self, bits: np.ndarray):
+        self._set_packed_bit_matrix(
+            _pack_bits(bits), bits.shape[1] if bits.shape[0] > 0 else None
+        )
+
+    def _set_packed_bit_matrix(
+        self,
+        packed_bits: np.ndarray,
+        n_qubits: Optional[int],
+        counts: Optional[np.ndarray] = None,
+    ):
+        self._n_qubits = n_qubits if packed_bits.shape[0] > 0 else None
+        self._packed_bits = packed_bits
+        self._counts = counts
+
+    def _append_bit_matrix(self, bits: np.ndarray, counts: Optional[np.ndarray] = None):
+        """Append rows of bits, either as single measurements (if counts is None) or
+        as bitstrings measured the given number of times."""
+        if bits.shape[0] == 0:
+            return
+        if self._n_qubits is not None and bits.shape[1] != self._n_qubits:
+            raise ValueError(
+                f"Cannot add measurements of {bits.shape[1]} qubits to measurements "
+                f"of {self._n_qubits} qubits."
+            )
+        packed_bits = _pack_bits(bits)
+        if self._n_qubits is None:
+            self._set_packed_bit_matrix(packed_bits, bits.shape[1], counts)
         else:
-            self.bitstrings = bitstrings
+            if self._counts is not None or counts is not None:
+                if counts is None:
+                    counts = np.ones(bits.shape[0], dtype=np.int64)
+                self._counts = np.concatenate([self._get_row_counts(), counts])
+            self._packed_bits = np.concatenate([self._packed_bits, packed_bits])
+
+    def _get_row_counts(self) -> np.ndarray:
+        if self._counts is None:
+            return np.ones(self._packed_bits.shape[0], dtype=np.int64)
+        return self._counts
+
+    def _get_unique_bit_matrix_and_counts(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the distinct measured bitstrings together with their number of
+        occurrences.
+
+        Returns:
+            Tuple (bits, counts), where bits is an array of shape
+            (number of distinct bitstrings, n_qubits) sorted lexicographically and
+            counts is an int64 array of the matching number of occurrences.
+        """
+        if self.n_samples == 0:
+            return np.zeros((0, 0), dtype=np.uint8), np.zeros(0, dtype=np.int64)
+        if self._counts is None:
+            unique_packed_bits, counts = np.unique(
+                self._packed_bits, axis=0, return_counts=True
+            )
+        else:
+            unique_packed_bits, inverse = np.unique(
+                self._packed_bits, axis=0, return_inverse=True
+            )
+            counts = np.bincount(
+                inverse.ravel(),
+                weights=self._counts,
+                minlength=unique_packed_bits.shape[0],
+            )
+            observed = counts > 0
+            unique_packed_bits, counts = unique_packed_bits[observed], counts[observed]
+        return (
+            np.unpackbits(unique_packed_bits, axis=1, count=self._n_qubits),
+            counts.astype(np.int64),
+        )
 
     @classmethod
     def from_counts(cls, counts: Dict[str, int]):
         """Create an instance of the Measurements class from a dictionary
 
+        The measurements are kept as a histogram, see add_counts.
+
         Args:
             counts: mapping of bitstrings to integers representing the number of times
                 the bitstring was measured
@@ -479,95 +794,196 @@ class Measurements:
 
     @classmethod
     def get_measurements_representing_distribution(
-        cls, bitstring_distribution: BitstringDistribution, number_of_samples: int
+        cls,
+        bitstring_distribution: BitstringDistribution,
+        number_of_samples: int,
+        seed: Optional[int] = None,
     ):
         """Create an instance of the Measurements class that exactly (or as closely as
         possible) resembles the input bitstring distribution.
 
+        The number of samples of each bitstring is obtained by largest remainder
+        rounding: every bitstring first gets the integer part of its expected
+        number of samples, and the samples left over go to the bitstrings with the
+        largest fractional parts. Ties between equal fractional parts are broken at
+        random. The returned measurements are kept as a histogram.
+
         Args:
             bitstring_distribution: the bitstring distribution to be sampled
             number_of_samples: the number of measurements
+            seed: seed of the random number generator used to break ties.
         """
-        distribution = copy.deepcopy(bitstring_distribution.distribution_dict)
+        distribution = bitstring_distribution.distribution_dict
+        if not distribution:
+            return cls()
+        bitstrings = list(distribution.keys())
+        probabilities = np.fromiter(distribution.values(), dtype=float)
+
+        expected_counts = probabilities / probabilities.sum() * number_of_samples
+        counts = np.floor(expected_counts).astype(np.int64)
+        remainders = expected_counts - counts
+
+        n_leftover_samples = min(number_of_samples - int(counts.sum()), len(counts))
+        if n_leftover_samples > 0:
+            # Stable sort of a random permutation gives random order among ties
+            permutation = np.random.default_rng(seed).permutation(len(counts))
+            order = permutation[np.argsort(-remainders[permutation], kind="stable")]
+            counts[order[:n_leftover_samples]] += 1
 
-        bitstring_samples = []
-        # Rounding gives the closest integer to the observed frequency
-        for state in distribution:
-            bitstring = tuple([int(measurement_value) for measurement_value in state])
-
-            bitstring_samples += [bitstring] * int(
-                round(distribution[state] * number_of_samples)
-            )
-
-        # If frequencies are inconsistent with number of samples, we may need to
-        # add or delete samples. The bitstrings to correct are chosen at random,
-        # giving more weight to those with non-integer part closest to 0.5
-        if len(bitstring_samples) != number_of_samples:
-            leftover_distribution = BitstringDistribution(
-                {
-                    states: 0.5
-                    - abs(0.5 - (distribution[states] * number_of_samples) % 1)
-                    for states in distribution
-                },
-                True,
-            )
-
-            samples = sample_from_probability_distribution(
-                leftover_distribution.distribution_dict,
-                abs(number_of_samples - len(bitstring_samples)),
-            )
-            if number_of_samples - len(bitstring_samples) > 0:
-                for sample in samples:
-                    bitstring_samples += [
-                        tuple([int(measurement_value) for measurement_value in sample])
-                    ] * samples[sample]
-            else:
-                for sample in samples:
-                    for _ in range(samples[sample]):
-                        bitstring_samples.remove(
-                            tuple(
-                                [int(measurement_value) for measurement_value in sample]
-                            )
-                        )
-
-        return cls(bitstring_samples)
+        measurements = cls()
+        observed = counts > 0
+        measurements._append_bit_matrix(
+            _strings_to_bit_matrix(bitstrings, len(bitstrings[0]))[observed],
+            counts[observed],
+        )
+        return measurements
 
     @classmethod
-    def load_from_file(cls, file: TextIO):
+    def load_from_file(cls, file: Union[TextIO, AnyPath]):
         """Load a set of measurements from file
 
+        Both the JSON formats written by save and the binary format written by
+        save_binary are supported when the name of the file is given.
+
         Args:
             file (str or file-like object): the name of the file, or a file-like object
         """
-        if isinstance(file, str):
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "rb") as binary_file:
+                is_binary = (
+                    binary_file.read(len(_BINARY_MEASUREMENTS_MAGIC))
+                    == _BINARY_MEASUREMENTS_MAGIC
+                )
+            if is_binary:
+                return cls.load_from_binary_file(file)
             with open(file, "r") as f:
                 data = json.load(f)
         else:
             data = json.load(file)
 
-        bitstrings = []
-        for bitstring in data["bitstrings"]:
-            bitstrings.append(tuple(bitstring))
+        if data.get("schema") == SCHEMA_VERSION + "-measurements-histogram":
+            return cls.from_counts(data["counts"])
+        return cls(bitstrings=data["bitstrings"])
+
+    @classmethod
+    def load_from_binary_file(cls, filename: AnyPath, mmap: bool = True):
+        """Load a set of measurements saved with save_binary.
+
+        Args:
+            filename: the name of the file.
+            mmap: if True, the measured bits are memory-mapped instead of read into
+                memory, so that only the parts of the file that are used get loaded.
+
+        Returns:
+            The loaded measurements.
+        """
+        with open(filename, "rb") as f:
+            if f.read(len(_BINARY_MEASUREMENTS_MAGIC)) != _BINARY_MEASUREMENTS_MAGIC:
+                raise ValueError(f"{filename} is not a binary measurements file.")
+            header_length = int.from_bytes(f.read(4), "little")
+            header = json.loads(f.read(header_length).decode("ascii"))
+            data_offset = f.tell()
+
+        if header.get("schema") != SCHEMA_VERSION + "-measurements-binary":
+            raise ValueError(
+                f"Unsupported schema of {filename}: {header.get('schema')}"
+            )
+
+        n_rows = header.get("n_rows", header["n_samples"])
+        n_qubits = header["n_qubits"]
+        shape = (n_rows, (n_qubits + 7) // 8)
+        counts_offset = data_offset + shape[0] * shape[1]
+        counts_dtype = np.dtype("<i8")
+
+        packed_bits = np.zeros(shape, dtype=np.uint8)
+        counts = (
+            np.zeros(n_rows, dtype=counts_dtype) if header.get("has_counts") else None
+        )
+        if n_rows > 0 and mmap:
+            if shape[1] > 0:
+                packed_bits = np.memmap(
+                    filename, dtype=np.uint8, mode="r", offset=data_offset, shape=shape
+                )
+            if counts is not None:
+                counts = np.memmap(
+                    filename,
+                    dtype=counts_dtype,
+                    mode="r",
+                    offset=counts_offset,
+                    shape=(n_rows,),
+                )
+        elif n_rows > 0:
+            with open(filename, "rb") as f:
+                f.seek(data_offset)
+                packed_bits = np.fromfile(
+                    f, dtype=np.uint8, count=shape[0] * shape[1]
+                ).reshape(shape)
+                if counts is not None:
+                    counts = np.fromfile(f, dtype=counts_dtype, count=n_rows)
 
-        return cls(bitstrings=bitstrings)
+        measurements = cls()
+        measurements._set_packed_bit_matrix(packed_bits, n_qubits, counts)
+        return measurements
 
-    def save(self, filename: AnyPath):
+    def save(self, filename: AnyPath, counts_only: bool = False):
         """Serialize the Measurements object into a file in JSON format.
 
         Args:
             filename (string): filename to save the data to
+            counts_only: if True, only the histogram of measurements is saved, with
+                the "measurements-histogram" schema. This keeps files of many
+                measurements small, but readers have to support this schema, e.g.
+                load_from_file. Otherwise, the list of individual measurements is
+                saved as well.
         """
-        data = {
-            "schema": SCHEMA_VERSION + "-measurements",
-            "counts": self.get_counts(),
-            # This step is required if bistrings contain np.int8 instead of regular int.
-            "bitstrings": [
-                list(map(int, list(bitstring))) for bitstring in self.bitstrings
-            ],
-        }
+        data: Dict[str, Any]
+        if counts_only:
+            data = {
+                "schema": SCHEMA_VERSION + "-measurements-histogram",
+                "counts": self.get_counts(),
+            }
+        else:
+            data = {
+                "schema": SCHEMA_VERSION + "-measurements",
+                "counts": self.get_counts(),
+                "bitstrings": self.get_bit_matrix().tolist(),
+            }
         with open(filename, "w") as f:
             f.write(json.dumps(data, indent=2))
 
+    def save_binary(self, filename: AnyPath):
+        """Serialize the Measurements object into a file in a compact binary format.
+
+        The file holds a short JSON header followed by the measured bits packed
+        eight to a byte (see numpy.packbits), one row per measurement or, for
+        measurements created from a histogram, one row per bitstring followed by
+        the counts of all rows as little endian int64. It can be loaded with
+        load_from_binary_file or load_from_file.
+
+        Args:
+            filename: filename to save the data to
+        """
+        header = json.dumps(
+            {
+                "schema": SCHEMA_VERSION + "-measurements-binary",
+                "n_qubits": self.n_qubits or 0,
+                "n_samples": self.n_samples,
+                "n_rows": self._packed_bits.shape[0],
+                "has_counts": self._counts is not None,
+                "bit_order": "big",
+            }
+        ).encode("ascii")
+        unpadded_length = len(_BINARY_MEASUREMENTS_MAGIC) + 4 + len(header)
+        header += b" " * (-unpadded_length % _BINARY_MEASUREMENTS_ALIGNMENT)
+
+        with open(filename, "wb") as f:
+            f.write(_BINARY_MEASUREMENTS_MAGIC)
+            f.write(len(header).to_bytes(4, "little"))
+            f.write(header)
+            f.write(np.ascontiguousarray(self._packed_bits).data)
+            if self._counts is not None:
+                f.write(np.ascontiguousarray(self._counts, dtype="<i8").data)
+
     def get_counts(self):
         """Get the measurements as a histogram
 
@@ -575,8 +991,8 @@ class Measurements:
             A dictionary mapping bitstrings to integers representing the number of times
             the bitstring was measured
         """
-        bitstrings = convert_tuples_to_bitstrings(self.bitstrings)
-        return dict(Counter(bitstrings))
+        bits, counts = self._get_unique_bit_matrix_and_counts()
+        return dict(zip(_bit_matrix_to_strings(bits), counts.tolist()))
 
     def add_counts(self, counts: Dict[str, int]):
         """Add measurements from a histogram
@@ -586,13 +1002,19 @@ class Measurements:
                 the bitstring was measured
                 NOTE: bitstrings are also indexed from 0 -> N-1, where the "001"
                 bitstring represents a measurement of qubit 2 in the 1 state
-        """
-        for bitstring in counts.keys():
-            measurement = []
-            for bitvalue in bitstring:
-                measurement.append(int(bitvalue))
 
-            self.bitstrings += [tuple(measurement)] * counts[bitstring]
+        The histogram is stored as is, without expanding it into individual
+        measurements.
+        """
+        if not counts:
+            return
+        bitstrings = list(counts.keys())
+        bitstring_counts = np.fromiter(counts.values(), dtype=np.int64)
+        if np.any(bitstring_counts < 0):
+            raise ValueError("Counts of measured bitstrings must be non-negative.")
+        self._append_bit_matrix(
+            _strings_to_bit_matrix(bitstrings, len(bitstrings[0])), bitstring_counts
+        )
 
     def get_distribution(self) -> BitstringDistribution:
         """Get the normalized probability distribution representing the measurements
@@ -600,14 +1022,20 @@ class Measurements:
         Returns:
             distribution: bitstring distribution based on the frequency of measurements
         """
-        counts = self.get_counts()
-        num_measurements = len(self.bitstrings)
+        bits, counts = self._get_unique_bit_matrix_and_counts()
+        probabilities = counts / self.n_samples
+        n_qubits = bits.shape[1]
 
-        distribution = {}
-        for bitstring in counts.keys():
-            distribution[bitstring] = counts[bitstring] / num_measurements
+        if n_qubits > _MAX_N_QUBITS_FOR_INDICES:
+            return BitstringDistribution(
+                dict(zip(_bit_matrix_to_strings(bits), probabilities.tolist()))
+            )
 
-        return BitstringDistribution(distribution)
+        indices = _bit_matrix_to_indices(bits)
+        order = np.argsort(indices)
+        return BitstringDistribution.from_sparse_arrays(
+            indices[order], probabilities[order], n_qubits
+        )
 
     def get_expectation_values(
         self, ising_operator: IsingOperator, use_bessel_correction: bool = True
@@ -631,53 +1059,176 @@ class Measurements:
         if not isinstance(ising_operator, IsingOperator):
             raise TypeError("Input operator is not openfermion.IsingOperator")
 
-        # Count number of occurrences of bitstrings
-        bitstring_frequencies = self.get_counts()
-        num_measurements = len(self.bitstrings)
+        num_measurements = self.n_samples
+        if num_measurements == 0:
+            raise ValueError("Cannot estimate expectation values without measurements")
 
-        # Perform weighted average
-        expectation_values_list = [
-            coefficient
-            * get_expectation_value_from_frequencies(
-                [cast(int, op[0]) for op in term], bitstring_frequencies
-            )
-            for term, coefficient in ising_operator.terms.items()
-        ]
-        expectation_values = np.array(expectation_values_list)
-
-        correlations = np.zeros((len(ising_operator.terms),) * 2)
-        for i, first_term in enumerate(ising_operator.terms):
-            correlations[i, i] = ising_operator.terms[first_term] ** 2
-            for j in range(i):
-                second_term = list(ising_operator.terms.keys())[j]
-                first_term_qubits = set(op[0] for op in first_term)
-                second_term_qubits = set(op[0] for op in second_term)
-                marked_qubits = first_term_qubits.symmetric_difference(
-                    second_term_qubits
-                )
-                correlations[i, j] = (
-                    ising_operator.terms[first_term]
-                    * ising_operator.terms[second_term]
-                    * get_expectation_value_from_frequencies(
-                        marked_qubits, bitstring_frequencies
-                    )
-                )
-                correlations[j, i] = correlations[i, j]
+        terms = tuple(ising_operator.terms.keys())
+        coefficients = np.array(list(ising_operator.terms.values()))
+        bits, counts = self._get_unique_bit_matrix_and_counts()
+        signs = _get_parity_signs(
+            bits, _get_cached_term_mask_matrix(terms, cast(int, self.n_qubits))
+        )
 
-        denominator = (
-            num_measurements - 1 if use_bessel_correction else num_measurements
+        return _get_expectation_values_from_sign_sums(
+            coefficients,
+            counts @ signs,
+            (signs.T * counts) @ signs,
+            num_measurements,
+            use_bessel_correction,
         )
 
-        estimator_covariances = (
-            correlations
-            - expectation_values[:, np.newaxis] * expectation_values[np.newaxis, :]
-        ) / denominator
 
-        return ExpectationValues(
-            expectation_values, [correlations], [estimator_covariances]
+class MeasurementsAccumulator:
+    """Running estimate of the expectation values of a fixed Ising operator.
+
+    Instead of keeping every measured bitstring, the accumulator keeps the counts
+    of measured bitstrings together with the sums of eigenvalues of every term of
+    the operator and of every pairwise product of terms. Reading the current
+    expectation values and their covariances therefore takes O(N^2) time for N
+    terms, no matter how many measurements were added, which makes it possible to
+    stop sampling as soon as the required precision is reached.
+
+    Args:
+        ising_operator: the operator whose expectation values are estimated.
+
+    Attributes:
+        ising_operator: See Args.
+    """
+
+    def __init__(self, ising_operator: IsingOperator):
+        if not isinstance(ising_operator, IsingOperator):
+            raise TypeError("Input operator is not openfermion.IsingOperator")
+        self.ising_operator = ising_operator
+        self._terms = list(ising_operator.terms.keys())
+        self._coefficients = np.array(list(ising_operator.terms.values()))
+        self._counts: Counter = Counter()
+        self._n_samples = 0
+        self._n_qubits: Optional[int] = None
+        self._term_masks: Optional[np.ndarray] = None
+        self._sign_sums = np.zeros(len(self._terms))
+        self._sign_product_sums = np.zeros((len(self._terms),) * 2)
+
+    @property
+    def n_samples(self) -> int:
+        """Number of measurements added so far."""
+        return self._n_samples
+
+    def add_counts(self, counts: Dict[str, int]):
+        """Add measurements from a histogram
+
+        Args:
+            counts: mapping of bitstrings to integers representing the number of times
+                the bitstring was measured, in the format used by
+                Measurements.add_counts.
+        """
+        if not counts:
+            return
+        bitstrings = list(counts.keys())
+        # The state is only updated once the counts are validated, so that the
+        # accumulator stays usable if they are rejected.
+        if self._term_masks is None:
+            n_qubits = len(bitstrings[0])
+            term_masks = _get_term_mask_matrix(self._terms, n_qubits)
+        else:
+            n_qubits = cast(int, self._n_qubits)
+            term_masks = self._term_masks
+
+        bits = _strings_to_bit_matrix(bitstrings, n_qubits)
+        bitstring_counts = np.fromiter(counts.values(), dtype=np.int64)
+        signs = _get_parity_signs(bits, term_masks)
+
+        self._n_qubits = n_qubits
+        self._term_masks = term_masks
+        self._sign_sums += bitstring_counts @ signs
+        self._sign_product_sums += (signs.T * bitstring_counts) @ signs
+        self._counts.update(counts)
+        self._n_samples += int(bitstring_counts.sum())
+
+    def add_measurements(self, measurements: Measurements):
+        """Add measurements, e.g. the ones returned by a single backend call.
+
+        Args:
+            measurements: the measurements to add.
+        """
+        self.add_counts(measurements.get_counts())
+
+    def get_counts(self) -> Dict[str, int]:
+        """Get all measurements added so far as a histogram
+
+        Returns:
+            A dictionary mapping bitstrings to integers representing the number of times
+            the bitstring was measured
+        """
+        return dict(self._counts)
+
+    def get_expectation_values(
+        self, use_bessel_correction: bool = True
+    ) -> ExpectationValues:
+        """Get the current estimate of the expectation values of the operator.
+
+        Args:
+            use_bessel_correction: Whether to use Bessel's correction when
+                when estimating the covariance of operators. See
+                Measurements.get_expectation_values.
+
+        Returns:
+            expectation values of each term in the operator
+        """
+        num_measurements = self.n_samples
+        if num_measurements == 0:
+            raise ValueError("Cannot estimate expectation values without measurements")
+
+        return _get_expectation_values_from_sign_sums(
+            self._coefficients,
+            self._sign_sums,
+            self._sign_product_sums,
+            num_measurements,
+            use_bessel_correction,
         )
 
 
+def _get_expectation_values_from_sign_sums(
+    coefficients: np.ndarray,
+    sign_sums: np.ndarray,
+    sign_product_sums: np.ndarray,
+    num_measurements: int,
+    use_bessel_correction: bool,
+) -> ExpectationValues:
+    """Estimate expectation values of terms of an operator from sums of their
+    eigenvalues over all measurements.
+
+    Args:
+        coefficients: coefficients of the terms of the operator.
+        sign_sums: sum of the +-1 eigenvalues of each term over all measurements.
+        sign_product_sums: sum of the products of eigenvalues of each pair of terms
+            over all measurements.
+        num_measurements: the number of measurements.
+        use_bessel_correction: see Measurements.get_expectation_values.
+
+    Returns:
+        expectation values of each term, with correlations and covariances.
+    """
+    expectation_values = coefficients * sign_sums / num_measurements
+
+    # Eigenvalue of a product of two terms is the product of their eigenvalues.
+    correlations = (
+        np.outer(coefficients, coefficients) * sign_product_sums / num_measurements
+    )
+    np.fill_diagonal(correlations, coefficients ** 2)
+
+    denominator = num_measurements - 1 if use_bessel_correction else num_measurements
+
+    estimator_covariances = (
+        correlations
+        - expectation_values[:, np.newaxis] * expectation_values[np.newaxis, :]
+    ) / denominator
+
+    return ExpectationValues(
+        expectation_values, [correlations], [estimator_covariances]
+    )
+
+
 def concatenate_expectation_values(
     expectation_values_set: Iterable[ExpectationValues],
 ) -> ExpectationValues:
@@ -0,0 +1,11 @@
+"""Simulators of quantum circuits implemented with NumPy."""
+from ._density_matrix_simulator import DensityMatrixSimulator
+from ._noise import (
+    AmplitudeDampingChannel,
+    DephasingChannel,
+    DepolarizingChannel,
+    NoiseModel,
+    ReadoutError,
+    create_noise_model,
+)
+from ._statevector_simulator import StatevectorSimulator
@@ -0,0 +1,215 @@
+from typing import Optional
+
+import numpy as np
+from openfermion import SymbolicOperator
+from pyquil.wavefunction import Wavefunction
+
+from ..bitstring_distribution import BitstringDistribution
+from ..circuits import Circuit, GateOperation, numeric_gate_matrix
+from ..circuits.layouts import CircuitConnectivity
+from ..interfaces.backend import QuantumSimulator
+from ..measurement import (
+    ExpectationValues,
+    Measurements,
+    expectation_values_to_real,
+    sample_measurements_from_probabilities,
+)
+from ._noise import NoiseModel, get_superoperator
+from ._statevector_simulator import (
+    _apply_matrix,
+    _apply_pauli_term,
+    _simulate_statevector,
+)
+
+
+class DensityMatrixSimulator(QuantumSimulator):
+    """Simulator evolving the density matrix of a circuit under a noise model.
+
+    The density matrix of n qubits is stored as a tensor with 2n axes of size 2:
+    row qubits are treated as qubits n, ..., 2n-1 and column qubits as qubits
+    0, ..., n-1 of a 2n-qubit state. Gates and noise channels are applied as
+    small matrices contracted with axes of qubits they act on, the same way as in
+    StatevectorSimulator.
+
+    Density matrices and sampled measurements follow the convention of pyquil,
+    i.e. qubit i corresponds to the i-th least significant bit of an index.
+
+    Args:
+        n_samples: deprecated, number of samples taken if not passed explicitly.
+        noise_model: noise model used in simulation, no noise is applied if None.
+        device_connectivity: ignored, all qubits are connected.
+        seed: seed of the random number generator used for sampling.
+    """
+
+    supports_batching = False
+
+    def __init__(
+        self,
+        n_samples: Optional[int] = None,
+        noise_model: Optional[NoiseModel] = None,
+        device_connectivity: Optional[CircuitConnectivity] = None,
+        seed: Optional[int] = None,
+    ):
+        super().__init__(n_samples)
+        self.noise_model = NoiseModel() if noise_model is None else noise_model
+        self._rng = np.random.default_rng(seed)
+
+    def run_circuit_and_measure(
+        self, circuit: Circuit, n_samples: Optional[int] = None, **kwargs
+    ) -> Measurements:
+        """Simulate the circuit and sample bitstrings from the final state, with
+        readout error of the noise model applied.
+
+        Args:
+            circuit: the circuit to simulate.
+            n_samples: the number of samples to collect. If None, the n_samples
+                attribute is used.
+        """
+        super().run_circuit_and_measure(circuit)
+        if n_samples is None:
+            n_samples = self.n_samples
+        if n_samples is None:
+            raise ValueError(
+                "At least one of n_samples and self.n_samples must be an integer."
+            )
+        return sample_measurements_from_probabilities(
+            self._get_outcome_probabilities(circuit), n_samples, self._rng
+        )
+
+    def get_bitstring_distribution(
+        self, circuit: Circuit, **kwargs
+    ) -> BitstringDistribution:
+        """Calculates a bitstring distribution, with readout error of the noise model
+        applied.
+
+        If n_samples attribute is None, the exact distribution is computed from the
+        density matrix. Otherwise, it is estimated from sampled measurements.
+
+        Args:
+            circuit: quantum circuit to be executed.
+
+        Returns:
+            Probability distribution of getting specific bistrings.
+        """
+        if self.n_samples is not None:
+            return super().get_bitstring_distribution(circuit, **kwargs)
+        self.number_of_circuits_run += 1
+        self.number_of_jobs_run += 1
+        return BitstringDistribution.from_probability_vector(
+            self._get_outcome_probabilities(circuit)
+        )
+
+    def _get_outcome_probabilities(self, circuit: Circuit) -> np.ndarray:
+        """Probabilities of measured outcomes, in the order of basis states of the
+        density matrix, including readout error."""
+        density_matrix = _simulate_density_matrix(circuit, self.noise_model)
+        probabilities = np.clip(np.real(np.diagonal(density_matrix)), 0, None)
+
+        readout_error = self.noise_model.readout_error
+        if readout_error is not None:
+            probabilities = probabilities.reshape((2,) * circuit.n_qubits)
+            for qubit in range(circuit.n_qubits):
+                probabilities = _apply_matrix(
+                    probabilities, readout_error.confusion_matrix, [qubit]
+                )
+
+        return probabilities.ravel()
+
+    def get_density_matrix(self, circuit: Circuit) -> np.ndarray:
+        """Returns the 2^n x 2^n density matrix of the state produced by a circuit.
+
+        Args:
+            circuit: quantum circuit to be executed.
+        """
+        self.number_of_circuits_run += 1
+        self.number_of_jobs_run += 1
+        return _simulate_density_matrix(circuit, self.noise_model)
+
+    def get_wavefunction(self, circuit: Circuit, **kwargs) -> Wavefunction:
+        """Returns a wavefunction representing quantum state produced by a circuit.
+
+        Only available if the noise model has no gate channels, as otherwise
+        the circuit produces a mixed state.
+        """
+        if self.noise_model.gate_channels:
+            raise ValueError(
+                "Noisy circuits produce mixed states, use get_density_matrix instead."
+            )
+        super().get_wavefunction(circuit)
+        return Wavefunction(_simulate_statevector(circuit))
+
+    def get_exact_expectation_values(
+        self, circuit: Circuit, operator: SymbolicOperator, **kwargs
+    ) -> ExpectationValues:
+        """Calculate expectation values of Pauli terms of the operator with respect
+        to the density matrix produced by the circuit.
+
+        Readout error is not taken into account."""
+        n_qubits = circuit.n_qubits
+        density_matrix = self.get_density_matrix(circuit)
+        state = density_matrix.reshape((2,) * (2 * n_qubits))
+        values = np.array(
+            [
+                coefficient
+                * np.trace(
+                    _apply_pauli_term(
+                        state, [(qubit + n_qubits, pauli) for qubit, pauli in term]
+                    ).reshape(density_matrix.shape)
+                )
+                for term, coefficient in operator.terms.items()
+            ]
+        )
+        return expectation_values_to_real(ExpectationValues(values))
+
+
+def _simulate_density_matrix(circuit: Circuit, noise_model: NoiseModel) -> np.ndarray:
+    """Compute the density matrix produced by a circuit.
+
+    Args:
+        circuit: the circuit to simulate; it can't have free symbols.
+        noise_model: noise model applied during the simulation.
+
+    Returns:
+        The final density matrix, in the convention described in
+        DensityMatrixSimulator.
+    """
+    if circuit.free_symbols:
+        raise ValueError(
+            "Circuit has free symbols: "
+            f"{', '.join(map(str, circuit.free_symbols))}. Bind them before "
+            "simulating the circuit."
+        )
+
+    n_qubits = circuit.n_qubits
+    superoperators = [
+        get_superoperator(channel) for channel in noise_model.gate_channels
+    ]
+    state = np.zeros((2 ** n_qubits, 2 ** n_qubits), dtype=complex)
+    state[0, 0] = 1
+    state = state.reshape((2,) * (2 * n_qubits))
+
+    for operation in circuit.operations:
+        if isinstance(operation, GateOperation):
+            matrix = numeric_gate_matrix(operation.gate)
+            qubits = list(operation.qubit_indices)
+            state = _apply_matrix(state, matrix, [qubit + n_qubits for qubit in qubits])
+            state = _apply_matrix(state, matrix.conj(), qubits)
+            for superoperator in superoperators:
+                for qubit in qubits:
+                    state = _apply_matrix(
+                        state, superoperator, [qubit + n_qubits, qubit]
+                    )
+        else:
+            # Operations are only defined through their action on wavefunctions,
+            # so U rho U^dagger is computed as (U (U rho)^dagger)^dagger.
+            density_matrix = state.reshape(2 ** n_qubits, 2 ** n_qubits)
+            for _ in range(2):
+                density_matrix = np.array(
+                    [
+                        np.asarray(operation.apply(column), dtype=complex)
+                        for column in density_matrix.T
+                    ]
+                ).conj()
+            state = density_matrix.reshape(state.shape)
+
+    return np.ascontiguousarray(state).reshape(2 ** n_qubits, 2 ** n_qubits)
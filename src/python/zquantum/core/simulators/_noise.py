@@ -0,0 +1,187 @@
+"""Noise channels and noise models used by DensityMatrixSimulator.
+
+Noise models can be stored with `zquantum.core.utils.save_noise_model` and read
+with `zquantum.core.utils.load_noise_model`, e.g.:
+
+    save_noise_model(
+        noise_model.to_dict(),
+        "zquantum.core.simulators",
+        "create_noise_model",
+        "noise_model.json",
+    )
+    noise_model = load_noise_model("noise_model.json")
+"""
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+import numpy as np
+
+_PAULI_MATRICES = {
+    "I": np.eye(2, dtype=complex),
+    "X": np.array([[0, 1], [1, 0]], dtype=complex),
+    "Y": np.array([[0, -1j], [1j, 0]], dtype=complex),
+    "Z": np.array([[1, 0], [0, -1]], dtype=complex),
+}
+
+
+def _validate_probability(name: str, value: float) -> None:
+    if not 0 <= value <= 1:
+        raise ValueError(f"{name} has to be between 0 and 1, got {value}.")
+
+
+@dataclass(frozen=True)
+class DepolarizingChannel:
+    """Single-qubit channel replacing the state with the maximally mixed one with
+    given probability."""
+
+    probability: float
+
+    def __post_init__(self):
+        _validate_probability("probability", self.probability)
+
+    @property
+    def kraus_operators(self) -> List[np.ndarray]:
+        return [np.sqrt(1 - 3 * self.probability / 4) * _PAULI_MATRICES["I"]] + [
+            np.sqrt(self.probability / 4) * _PAULI_MATRICES[pauli] for pauli in "XYZ"
+        ]
+
+
+@dataclass(frozen=True)
+class AmplitudeDampingChannel:
+    """Single-qubit channel decaying |1> into |0> with given probability."""
+
+    gamma: float
+
+    def __post_init__(self):
+        _validate_probability("gamma", self.gamma)
+
+    @property
+    def kraus_operators(self) -> List[np.ndarray]:
+        return [
+            np.array([[1, 0], [0, np.sqrt(1 - self.gamma)]], dtype=complex),
+            np.array([[0, np.sqrt(self.gamma)], [0, 0]], dtype=complex),
+        ]
+
+
+@dataclass(frozen=True)
+class DephasingChannel:
+    """Single-qubit channel flipping the phase of |1> with given probability."""
+
+    probability: float
+
+    def __post_init__(self):
+        _validate_probability("probability", self.probability)
+
+    @property
+    def kraus_operators(self) -> List[np.ndarray]:
+        return [
+            np.sqrt(1 - self.probability) * _PAULI_MATRICES["I"],
+            np.sqrt(self.probability) * _PAULI_MATRICES["Z"],
+        ]
+
+
+KrausChannel = Union[DepolarizingChannel, AmplitudeDampingChannel, DephasingChannel]
+
+_CHANNEL_TYPES: Dict[str, Type[KrausChannel]] = {
+    "depolarizing": DepolarizingChannel,
+    "amplitude_damping": AmplitudeDampingChannel,
+    "dephasing": DephasingChannel,
+}
+
+
+def get_superoperator(channel: KrausChannel) -> np.ndarray:
+    """Superoperator of a single-qubit channel acting on a density matrix.
+
+    The returned 4x4 matrix acts on the pair (row qubit, column qubit) of the
+    density matrix, the row qubit being the most significant one.
+    """
+    return np.sum(
+        np.stack(
+            [np.kron(operator, operator.conj()) for operator in channel.kraus_operators]
+        ),
+        axis=0,
+    )
+
+
+def _channel_to_dict(channel: KrausChannel) -> Dict[str, Any]:
+    (name,) = [
+        name
+        for name, channel_type in _CHANNEL_TYPES.items()
+        if isinstance(channel, channel_type)
+    ]
+    return {"name": name, **asdict(channel)}
+
+
+def _channel_from_dict(data: Dict[str, Any]) -> KrausChannel:
+    data = dict(data)
+    name = data.pop("name")
+    try:
+        return _CHANNEL_TYPES[name](**data)
+    except KeyError:
+        raise ValueError(
+            f"Unknown channel {name}, supported channels are: "
+            f"{', '.join(_CHANNEL_TYPES)}."
+        )
+
+
+@dataclass(frozen=True)
+class ReadoutError:
+    """Classical error flipping measured bits of each qubit.
+
+    Args:
+        p_1_given_0: probability of measuring 1 if the qubit is in state |0>.
+        p_0_given_1: probability of measuring 0 if the qubit is in state |1>.
+    """
+
+    p_1_given_0: float
+    p_0_given_1: float
+
+    def __post_init__(self):
+        _validate_probability("p_1_given_0", self.p_1_given_0)
+        _validate_probability("p_0_given_1", self.p_0_given_1)
+
+    @property
+    def confusion_matrix(self) -> np.ndarray:
+        """Matrix mapping probabilities of states to probabilities of outcomes."""
+        return np.array(
+            [
+                [1 - self.p_1_given_0, self.p_0_given_1],
+                [self.p_1_given_0, 1 - self.p_0_given_1],
+            ]
+        )
+
+
+@dataclass(frozen=True)
+class NoiseModel:
+    """Noise model of DensityMatrixSimulator.
+
+    Args:
+        gate_channels: channels applied, in order, to every qubit a gate acts on
+            after the gate is applied.
+        readout_error: error applied to every qubit when sampling measurements.
+    """
+
+    gate_channels: Tuple[KrausChannel, ...] = ()
+    readout_error: Optional[ReadoutError] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        readout_error = self.readout_error
+        return {
+            "gate_channels": [
+                _channel_to_dict(channel) for channel in self.gate_channels
+            ],
+            "readout_error": None if readout_error is None else asdict(readout_error),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "NoiseModel":
+        readout_error = data.get("readout_error")
+        return cls(
+            tuple(_channel_from_dict(channel) for channel in data["gate_channels"]),
+            None if readout_error is None else ReadoutError(**readout_error),
+        )
+
+
+def create_noise_model(noise_model_data: Dict[str, Any]) -> NoiseModel:
+    """Create noise model from data stored with save_noise_model."""
+    return NoiseModel.from_dict(noise_model_data)
@@ -0,0 +1,350 @@
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+import sympy
+from openfermion import SymbolicOperator
+from pyquil.wavefunction import Wavefunction
+
+from ..circuits import Circuit, GateOperation, numeric_gate_matrix
+from ..circuits.layouts import CircuitConnectivity
+from ..interfaces.backend import QuantumSimulator
+from ..measurement import (
+    ExpectationValues,
+    Measurements,
+    expectation_values_to_real,
+    sample_measurements_from_wavefunction,
+)
+from ..utils import create_symbols_map
+
+# Action of Pauli operators on the amplitudes of |0> and |1>: after flipping the
+# qubit (for Y), amplitudes are multiplied by these factors.
+_PAULI_FACTORS = {
+    "Y": np.array([-1j, 1j]),
+    "Z": np.array([1, -1]),
+}
+
+
+class StatevectorSimulator(QuantumSimulator):
+    """Noiseless simulator evolving the statevector of a circuit with NumPy.
+
+    The statevector of n qubits is stored as a tensor with n axes of size 2 and
+    every k-qubit gate is applied by contracting its 2^k x 2^k matrix with the axes
+    of its target qubits, so matrices acting on the whole system are never built.
+    Any gate with a numeric matrix is supported (built-in, controlled, daggered and
+    custom gates), as well as wavefunction operations like MultiPhaseOperation.
+
+    Wavefunctions follow the convention of pyquil, i.e. qubit i corresponds to the
+    i-th least significant bit of the index of a basis state.
+
+    Args:
+        n_samples: deprecated, number of samples taken if not passed explicitly.
+        noise_model: not supported, has to be None.
+        device_connectivity: ignored, all qubits are connected.
+        seed: seed of the random number generator used for sampling.
+    """
+
+    supports_batching = False
+
+    def __init__(
+        self,
+        n_samples: Optional[int] = None,
+        noise_model: Optional[Any] = None,
+        device_connectivity: Optional[CircuitConnectivity] = None,
+        seed: Optional[int] = None,
+    ):
+        if noise_model is not None:
+            raise ValueError("StatevectorSimulator does not support noise models.")
+        super().__init__(n_samples)
+        self._rng = np.random.default_rng(seed)
+
+    def run_circuit_and_measure(
+        self, circuit: Circuit, n_samples: Optional[int] = None, **kwargs
+    ) -> Measurements:
+        """Simulate the circuit and sample bitstrings from the final state.
+
+        Args:
+            circuit: the circuit to simulate.
+            n_samples: the number of samples to collect. If None, the n_samples
+                attribute is used.
+        """
+        super().run_circuit_and_measure(circuit)
+        if n_samples is None:
+            n_samples = self.n_samples
+        if n_samples is None:
+            raise ValueError(
+                "At least one of n_samples and self.n_samples must be an integer."
+            )
+        return sample_measurements_from_wavefunction(
+            Wavefunction(_simulate_statevector(circuit)), n_samples, self._rng
+        )
+
+    def get_wavefunction(self, circuit: Circuit, **kwargs) -> Wavefunction:
+        super().get_wavefunction(circuit)
+        return Wavefunction(_simulate_statevector(circuit))
+
+    def get_exact_expectation_values(
+        self, circuit: Circuit, operator: SymbolicOperator, **kwargs
+    ) -> ExpectationValues:
+        """Calculate expectation values of Pauli terms of the operator with respect
+        to the state produced by the circuit, without building matrices of terms."""
+        amplitudes = self.get_wavefunction(circuit).amplitudes
+        state = amplitudes.reshape((2,) * circuit.n_qubits)
+        values = np.array(
+            [
+                coefficient * np.vdot(state, _apply_pauli_term(state, term))
+                for term, coefficient in operator.terms.items()
+            ]
+        )
+        return expectation_values_to_real(ExpectationValues(values))
+
+    def get_wavefunctions_for_parameter_matrix(
+        self,
+        circuit: Circuit,
+        symbols: Sequence[sympy.Symbol],
+        parameter_matrix: np.ndarray,
+    ) -> List[Wavefunction]:
+        """Simulate a parametrized circuit for many bindings of its parameters.
+
+        All bindings are evolved together as a single (batch, 2^n) array, with
+        matrices of parametrized gates evaluated for the whole batch at once.
+
+        Args:
+            circuit: the parametrized circuit to simulate.
+            symbols: the symbols bound to columns of the parameter matrix; they have
+                to include all free symbols of the circuit.
+            parameter_matrix: array of shape (batch_size, len(symbols)), each row
+                holding values of symbols for one binding.
+
+        Returns:
+            Wavefunctions produced by the circuit, one for each row of
+            the parameter matrix.
+        """
+        states = _simulate_statevectors(circuit, symbols, parameter_matrix)
+        self.number_of_circuits_run += len(states)
+        self.number_of_jobs_run += 1
+        return [Wavefunction(amplitudes) for amplitudes in states]
+
+    def get_exact_expectation_values_for_parameter_matrix(
+        self,
+        circuit: Circuit,
+        operator: SymbolicOperator,
+        symbols: Sequence[sympy.Symbol],
+        parameter_matrix: np.ndarray,
+    ) -> List[ExpectationValues]:
+        """Calculate expectation values of Pauli terms of the operator for many
+        bindings of parameters of the circuit.
+
+        See get_wavefunctions_for_parameter_matrix for description of arguments.
+        """
+        states = _simulate_statevectors(circuit, symbols, parameter_matrix)
+        self.number_of_circuits_run += len(states)
+        self.number_of_jobs_run += 1
+        states = states.reshape((len(states),) + (2,) * circuit.n_qubits)
+        values = np.array(
+            [
+                coefficient
+                * np.einsum(
+                    "bi,bi->b",
+                    np.conj(states).reshape(len(states), -1),
+                    _apply_pauli_term(states, term).reshape(len(states), -1),
+                )
+                for term, coefficient in operator.terms.items()
+            ]
+        ).reshape(-1, len(states))
+        return [
+            expectation_values_to_real(ExpectationValues(column)) for column in values.T
+        ]
+
+
+def _simulate_statevector(
+    circuit: Circuit, initial_state: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Compute the statevector produced by a circuit.
+
+    Args:
+        circuit: the circuit to simulate; it can't have free symbols.
+        initial_state: the statevector the circuit acts on, |0...0> by default.
+
+    Returns:
+        The final statevector, in the convention described in StatevectorSimulator.
+    """
+    if circuit.free_symbols:
+        raise ValueError(
+            "Circuit has free symbols: "
+            f"{', '.join(map(str, circuit.free_symbols))}. Bind them before "
+            "simulating the circuit."
+        )
+
+    if initial_state is None:
+        state = np.zeros(2 ** circuit.n_qubits, dtype=complex)
+        state[0] = 1
+    else:
+        state = np.asarray(initial_state, dtype=complex)
+    state = state.reshape((2,) * circuit.n_qubits)
+
+    for operation in circuit.operations:
+        if isinstance(operation, GateOperation):
+            state = _apply_matrix(
+                state,
+                numeric_gate_matrix(operation.gate),
+                operation.qubit_indices,
+            )
+        else:
+            state = np.asarray(operation.apply(state.reshape(-1))).reshape(state.shape)
+
+    return np.ascontiguousarray(state).reshape(-1)
+
+
+def _simulate_statevectors(
+    circuit: Circuit, symbols: Sequence[sympy.Symbol], parameter_matrix: np.ndarray
+) -> np.ndarray:
+    """Compute statevectors produced by a circuit for many bindings of symbols.
+
+    Args:
+        circuit: the circuit to simulate.
+        symbols: the symbols bound to columns of the parameter matrix.
+        parameter_matrix: array of shape (batch_size, len(symbols)).
+
+    Returns:
+        Array of shape (batch_size, 2^n) whose rows are the final statevectors.
+    """
+    parameter_matrix = np.atleast_2d(np.asarray(parameter_matrix, dtype=float))
+    if parameter_matrix.shape[1] != len(symbols):
+        raise ValueError(
+            f"Parameter matrix has {parameter_matrix.shape[1]} columns, but "
+            f"{len(symbols)} symbols were given."
+        )
+    unbound_symbols = set(circuit.free_symbols) - set(symbols)
+    if unbound_symbols:
+        raise ValueError(
+            "Circuit has free symbols which are not bound by the parameter matrix: "
+            f"{', '.join(map(str, unbound_symbols))}."
+        )
+
+    batch_size = len(parameter_matrix)
+    states = np.zeros((batch_size, 2 ** circuit.n_qubits), dtype=complex)
+    states[:, 0] = 1
+    states = states.reshape((batch_size,) + (2,) * circuit.n_qubits)
+
+    for operation in circuit.operations:
+        if not operation.free_symbols:
+            if isinstance(operation, GateOperation):
+                states = _apply_matrix(
+                    states,
+                    numeric_gate_matrix(operation.gate),
+                    operation.qubit_indices,
+                )
+            else:
+                states = np.stack(
+                    [np.asarray(operation.apply(state.reshape(-1))) for state in states]
+                ).reshape(states.shape)
+        elif isinstance(operation, GateOperation):
+            states = _apply_batched_matrices(
+                states,
+                _get_batched_matrices(operation.gate.matrix, symbols, parameter_matrix),
+                operation.qubit_indices,
+            )
+        else:
+            states = np.stack(
+                [
+                    np.asarray(
+                        operation.bind(
+                            create_symbols_map(list(symbols), parameters)
+                        ).apply(state.reshape(-1))
+                    )
+                    for state, parameters in zip(states, parameter_matrix)
+                ]
+            ).reshape(states.shape)
+
+    return np.ascontiguousarray(states).reshape(batch_size, -1)
+
+
+def _get_batched_matrices(
+    matrix: sympy.Matrix, symbols: Sequence[sympy.Symbol], parameter_matrix: np.ndarray
+) -> np.ndarray:
+    """Evaluate a symbolic matrix for every row of the parameter matrix.
+
+    The matrix is converted to a NumPy function once, which is then called with
+    whole columns of the parameter matrix.
+
+    Returns:
+        Array of shape (batch_size, *matrix.shape).
+    """
+    batch_size = len(parameter_matrix)
+    entries = sympy.lambdify(
+        list(symbols), list(matrix), modules="numpy", dummify=True
+    )(*parameter_matrix.T)
+    return np.stack(
+        [
+            np.broadcast_to(np.asarray(entry, dtype=complex), batch_size)
+            for entry in entries
+        ],
+        axis=-1,
+    ).reshape((batch_size,) + matrix.shape)
+
+
+def _apply_batched_matrices(
+    states: np.ndarray, matrices: np.ndarray, qubit_indices: Sequence[int]
+) -> np.ndarray:
+    """Apply a distinct k-qubit matrix to target qubits of each state in a batch.
+
+    Args:
+        states: tensor of shape (batch_size, 2, 2, ..., 2), see _apply_matrix.
+        matrices: array of shape (batch_size, 2^k, 2^k).
+        qubit_indices: the k qubits the matrices act on.
+
+    Returns:
+        The transformed tensor, of the same shape as states.
+    """
+    n_targets = len(qubit_indices)
+    axes = _get_qubit_axes(states.ndim, qubit_indices)
+    targets = list(range(states.ndim - n_targets, states.ndim))
+    moved_states = np.moveaxis(states, axes, targets)
+    new_states = np.einsum(
+        "bij,bkj->bki",
+        matrices,
+        moved_states.reshape(len(states), -1, 2 ** n_targets),
+    )
+    return np.moveaxis(new_states.reshape(moved_states.shape), targets, axes)
+
+
+def _apply_matrix(
+    state: np.ndarray, matrix: np.ndarray, qubit_indices: Sequence[int]
+) -> np.ndarray:
+    """Apply a k-qubit matrix to target qubits of a state tensor.
+
+    Args:
+        state: tensor of shape (..., 2, 2, ..., 2) whose last n axes correspond to
+            qubits n-1, ..., 1, 0 (the convention of pyquil for flattened states).
+            Leading axes, e.g. of a batch of states, are left untouched.
+        matrix: 2^k x 2^k matrix, whose first qubit is the most significant one.
+        qubit_indices: the k qubits the matrix acts on.
+
+    Returns:
+        The transformed tensor, of the same shape as state.
+    """
+    n_targets = len(qubit_indices)
+    axes = _get_qubit_axes(state.ndim, qubit_indices)
+    gate_tensor = matrix.reshape((2,) * (2 * n_targets))
+    new_state = np.tensordot(
+        gate_tensor, state, axes=(list(range(n_targets, 2 * n_targets)), axes)
+    )
+    return np.moveaxis(new_state, list(range(n_targets)), axes)
+
+
+def _get_qubit_axes(ndim: int, qubit_indices: Sequence[int]) -> List[int]:
+    return [ndim - 1 - qubit for qubit in qubit_indices]
+
+
+def _apply_pauli_term(state: np.ndarray, term: Sequence[Any]) -> np.ndarray:
+    """Apply a Pauli term, given as in SymbolicOperator.terms, to a state tensor."""
+    result = state
+    for qubit, pauli in term:
+        (axis,) = _get_qubit_axes(state.ndim, [qubit])
+        if pauli != "Z":
+            result = np.flip(result, axis)
+        if pauli != "X":
+            factors_shape = [1] * state.ndim
+            factors_shape[axis] = 2
+            result = result * _PAULI_FACTORS[pauli].reshape(factors_shape)
+    return result
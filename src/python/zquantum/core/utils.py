@@ -8,9 +8,8 @@ import sys
 import warnings
 from functools import partial
 from types import FunctionType
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
-import lea
 import numpy as np
 import sympy
 from openfermion import InteractionRDM, hermitian_conjugated
@@ -173,8 +172,39 @@ def compare_unitary(u1: np.ndarray, u2: np.ndarray, tol: float = 1e-15) -> bool:
     return is_identity(phase * test_matrix, tol)
 
 
+def sample_counts_from_probabilities(
+    probabilities: np.ndarray,
+    n_samples: int,
+    seed: Optional[Union[int, np.random.Generator]] = None,
+) -> np.ndarray:
+    """Samples events from a discrete probability distribution given as an array.
+
+    All samples are drawn at once from a multinomial distribution, so the cost
+    depends only on the number of events and not on the number of samples.
+
+    Args:
+        probabilities: probabilities of the events. They are normalized before
+            sampling.
+        n_samples: The number of samples desired
+        seed: seed of the random number generator, or the generator itself.
+
+    Returns:
+        Array of the same length as probabilities, holding the number of times each
+            event was sampled.
+    """
+    probabilities = np.asarray(probabilities, dtype=float).ravel()
+    if np.any(probabilities < 0) or not probabilities.sum() > 0:
+        raise ValueError(
+            "Probabilities should be non-negative and have a positive sum."
+        )
+    rng = np.random.default_rng(seed)
+    return rng.multinomial(n_samples, probabilities / probabilities.sum())
+
+
 def sample_from_probability_distribution(
-    probability_distribution: dict, n_samples: int
+    probability_distribution: dict,
+    n_samples: int,
+    seed: Optional[Union[int, np.random.Generator]] = None,
 ) -> collections.Counter:
     """
     Samples events from a discrete probability distribution
@@ -184,15 +214,21 @@ def sample_from_probability_distribution(
         for sampling. This should be a dictionary
 
         n_samples (int): The number of samples desired
+        seed: seed of the random number generator, or the generator itself.
 
     Returns:
         A dictionary of the outcomes sampled. The key values are the things be sampled
         and values are how many times those things appeared in the sampling
     """
     if isinstance(probability_distribution, dict):
-        prob_pmf = lea.pmf(probability_distribution)
+        events = list(probability_distribution.keys())
+        counts = sample_counts_from_probabilities(
+            np.fromiter(probability_distribution.values(), dtype=float),
+            n_samples,
+            seed,
+        )
         sampled_dict: collections.Counter = collections.Counter(
-            prob_pmf.random(n_samples)
+            {events[index]: int(counts[index]) for index in np.flatnonzero(counts)}
         )
         return sampled_dict
     else:
@@ -312,3 +312,69 @@ def test_number_of_qubits_in_bitstring_distribution_equals_length_of_keys(
     distribution, num_qubits
 ):
     assert distribution.get_qubits_number() == num_qubits
+
+
+def test_distribution_from_probability_vector_has_same_dict_as_from_dict():
+    distribution = BitstringDistribution.from_probability_vector(
+        np.array([0.25, 0, 0.5, 0.25])
+    )
+
+    assert distribution.get_qubits_number() == 2
+    assert distribution.distribution_dict == {
+        "00": 0.25,
+        "10": 0.0,
+        "01": 0.5,
+        "11": 0.25,
+    }
+
+
+def test_distribution_from_sparse_arrays_has_same_dict_as_from_dict():
+    distribution = BitstringDistribution.from_sparse_arrays(
+        np.array([1, 6]), np.array([0.2, 0.6]), 4
+    )
+
+    assert distribution.get_qubits_number() == 4
+    assert distribution.distribution_dict == pytest.approx({"1000": 0.25, "0110": 0.75})
+
+
+def test_sparse_arrays_of_distribution_created_from_dict_are_sorted_by_index():
+    distribution = BitstringDistribution({"011": 0.5, "100": 0.25, "000": 0.25})
+
+    indices, probabilities = distribution.get_sparse_arrays()
+
+    np.testing.assert_array_equal(indices, [0, 1, 6])
+    np.testing.assert_array_equal(probabilities, [0.25, 0.25, 0.5])
+
+
+def test_array_backed_distribution_is_not_normalized_if_normalization_isnt_requested():
+    with pytest.warns(UserWarning):
+        distribution = BitstringDistribution.from_probability_vector(
+            np.array([0.5, 1.5]), normalize=False
+        )
+
+    assert distribution.distribution_dict == {"0": 0.5, "1": 1.5}
+
+
+@pytest.mark.parametrize(
+    "probabilities",
+    [np.array([0.5, 0.25, 0.25]), np.array([]), np.array([1.5, -0.5])],
+)
+def test_invalid_probability_vector_is_not_bitstring_distribution(probabilities):
+    with pytest.raises(RuntimeError):
+        BitstringDistribution.from_probability_vector(probabilities)
+
+
+@pytest.mark.parametrize(
+    "indices,probabilities,n_qubits",
+    [
+        (np.array([2, 1]), np.array([0.5, 0.5]), 2),
+        (np.array([1, 1]), np.array([0.5, 0.5]), 2),
+        (np.array([0, 4]), np.array([0.5, 0.5]), 2),
+        (np.array([0, 1]), np.array([0.5]), 2),
+    ],
+)
+def test_invalid_sparse_arrays_are_not_bitstring_distribution(
+    indices, probabilities, n_qubits
+):
+    with pytest.raises(RuntimeError):
+        BitstringDistribution.from_sparse_arrays(indices, probabilities, n_qubits)
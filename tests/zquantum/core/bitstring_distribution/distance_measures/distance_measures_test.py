@@ -1,10 +1,14 @@
 import math
-from unittest import mock
 
+import numpy as np
 import pytest
 from zquantum.core.bitstring_distribution._bitstring_distribution import (
     BitstringDistribution,
     evaluate_distribution_distance,
+    evaluate_distribution_distances,
+)
+from zquantum.core.bitstring_distribution.distance_measures._alignment import (
+    align_distributions,
 )
 from zquantum.core.bitstring_distribution.distance_measures.clipped_negative_log_likelihood import (  # noqa: E501
     compute_clipped_negative_log_likelihood,
@@ -12,7 +16,12 @@ from zquantum.core.bitstring_distribution.distance_measures.clipped_negative_log
 from zquantum.core.bitstring_distribution.distance_measures.jensen_shannon_divergence import (  # noqa: E501
     compute_jensen_shannon_divergence,
 )
-from zquantum.core.bitstring_distribution.distance_measures.mmd import compute_mmd
+from zquantum.core.bitstring_distribution.distance_measures.mmd import (
+    _compute_kernel_quadratic_forms,
+    compute_mmd,
+    compute_multi_rbf_kernel,
+    estimate_mmd_with_random_features,
+)
 
 
 def test_clipped_negative_log_likelihood_is_computed_correctly():
@@ -26,19 +35,28 @@ def test_clipped_negative_log_likelihood_is_computed_correctly():
     assert clipped_log_likelihood == 1.203972804325936
 
 
-def test_uses_epsilon_instead_of_zero_in_target_distribution():
-    log_spy = mock.Mock(wraps=math.log)
-    with mock.patch("zquantum.core.bitstring_distribution.math.log", log_spy):
-        target_distr = BitstringDistribution({"000": 0.5, "111": 0.4, "010": 0.0})
-        measured_dist = BitstringDistribution({"000": 0.1, "111": 0.9, "010": 0.0})
-        distance_measure_params = {"epsilon": 0.01}
-        compute_clipped_negative_log_likelihood(
-            target_distr, measured_dist, distance_measure_params
-        )
+def test_uses_epsilon_instead_of_zero_in_measured_distribution():
+    target_distr = BitstringDistribution({"000": 0.5, "111": 0.4, "010": 0.1})
+    measured_dist = BitstringDistribution({"000": 0.1, "111": 0.9, "010": 0.0})
+    distance_measure_params = {"epsilon": 0.01}
+    clipped_log_likelihood = compute_clipped_negative_log_likelihood(
+        target_distr, measured_dist, distance_measure_params
+    )
 
-        log_spy.assert_has_calls(
-            [mock.call(0.1), mock.call(0.9), mock.call(0.01)], any_order=True
-        )
+    assert clipped_log_likelihood == pytest.approx(
+        -(0.5 * math.log(0.1) + 0.4 * math.log(0.9) + 0.1 * math.log(0.01))
+    )
+
+
+def test_bitstrings_missing_from_measured_distribution_have_zero_probability():
+    target_distr = BitstringDistribution({"000": 0.5, "111": 0.5})
+    measured_dist = BitstringDistribution({"000": 1.0})
+    distance_measure_params = {"epsilon": 0.01}
+    clipped_log_likelihood = compute_clipped_negative_log_likelihood(
+        target_distr, measured_dist, distance_measure_params
+    )
+
+    assert clipped_log_likelihood == pytest.approx(-0.5 * math.log(0.01))
 
 
 @pytest.mark.parametrize(
@@ -169,3 +187,173 @@ def test_jensen_shannon_divergence_is_computed_correctly():
     )
 
     assert jensen_shannon_divergence == 0.9485599924429406
+
+
+def test_mmd_does_not_depend_on_distribution_representation():
+    probabilities = np.array([0.1, 0.2, 0.3, 0.4])
+    target_distr = BitstringDistribution({"00": 0.5, "11": 0.5})
+    measured_dict = BitstringDistribution({"00": 0.1, "10": 0.2, "01": 0.3, "11": 0.4})
+    measured_vector = BitstringDistribution.from_probability_vector(probabilities)
+
+    assert compute_mmd(target_distr, measured_vector, {"sigma": 0.5}) == pytest.approx(
+        compute_mmd(target_distr, measured_dict, {"sigma": 0.5})
+    )
+
+
+def test_aligned_basis_matches_integer_values_of_bitstrings():
+    target_distr = BitstringDistribution({"001": 0.5, "110": 0.5})
+    measured_distributions = [
+        BitstringDistribution({"001": 0.25, "100": 0.75}),
+        BitstringDistribution({"011": 1.0}),
+    ]
+
+    basis, target_values, measured_values = align_distributions(
+        target_distr, measured_distributions
+    )
+
+    expected_values = {
+        int(bitstring, 2): (
+            target_distr.distribution_dict.get(bitstring, 0),
+            measured_distributions[0].distribution_dict.get(bitstring, 0),
+            measured_distributions[1].distribution_dict.get(bitstring, 0),
+        )
+        for bitstring in ["001", "110", "100", "011"]
+    }
+    assert sorted(basis.tolist()) == sorted(expected_values)
+    for column, integer_value in enumerate(basis):
+        assert (
+            target_values[column],
+            measured_values[0, column],
+            measured_values[1, column],
+        ) == expected_values[integer_value]
+
+
+@pytest.mark.parametrize(
+    "distance_measure,distance_measure_params",
+    [
+        (compute_clipped_negative_log_likelihood, {"epsilon": 0.1}),
+        (compute_jensen_shannon_divergence, {"epsilon": 0.1}),
+        (compute_mmd, {"sigma": 0.5}),
+        (compute_mmd, {"sigma": [1, 0.5, 2]}),
+    ],
+)
+def test_batched_distances_match_distances_of_individual_distributions(
+    distance_measure, distance_measure_params
+):
+    target_distr = BitstringDistribution({"000": 0.5, "111": 0.5})
+    measured_distributions = [
+        BitstringDistribution({"000": 0.1, "111": 0.9}),
+        BitstringDistribution({"000": 0.5, "011": 0.25, "101": 0.25}),
+        BitstringDistribution.from_probability_vector(np.full(8, 1 / 8)),
+    ]
+
+    distances = evaluate_distribution_distances(
+        target_distr,
+        measured_distributions,
+        distance_measure,
+        distance_measure_parameters=distance_measure_params,
+    )
+
+    np.testing.assert_allclose(
+        distances,
+        [
+            distance_measure(target_distr, measured_distr, distance_measure_params)
+            for measured_distr in measured_distributions
+        ],
+    )
+
+
+def test_batched_distances_can_be_computed_with_custom_distance_measure():
+    target_distr = BitstringDistribution({"0": 0.5, "1": 0.5})
+    measured_distributions = [
+        BitstringDistribution({"0": 0.1, "1": 0.9}),
+        BitstringDistribution({"0": 1.0}),
+    ]
+
+    def compute_distance(target_distribution, measured_distribution):
+        return abs(
+            target_distribution.distribution_dict["0"]
+            - measured_distribution.distribution_dict["0"]
+        )
+
+    distances = evaluate_distribution_distances(
+        target_distr, measured_distributions, compute_distance
+    )
+
+    np.testing.assert_allclose(distances, [0.4, 0.5])
+
+
+def test_batched_distances_cannot_be_evaluated_if_supports_are_incompatible():
+    target = BitstringDistribution({"0": 10, "1": 5})
+    measured_distributions = [
+        BitstringDistribution({"1": 1.0}),
+        BitstringDistribution({"00": 10, "10": 5}),
+    ]
+
+    with pytest.raises(RuntimeError):
+        evaluate_distribution_distances(target, measured_distributions, compute_mmd)
+
+
+@pytest.mark.parametrize("sigmas", [[0.5], [100.0], [1.0, 1000.0, 1e6]])
+def test_blockwise_kernel_quadratic_forms_match_dense_kernel_matrix(sigmas):
+    rng = np.random.default_rng(1234)
+    basis = rng.choice(2 ** 12, size=700, replace=False)
+    vectors = rng.normal(size=(2, 700))
+    kernel_matrix = compute_multi_rbf_kernel(basis, basis, sigmas)
+
+    quadratic_forms = _compute_kernel_quadratic_forms(
+        basis, vectors, [1 / (2 * sigma) for sigma in sigmas], block_size=64
+    )
+
+    np.testing.assert_allclose(
+        quadratic_forms,
+        np.einsum("ij,jk,ik->i", vectors, kernel_matrix, vectors),
+    )
+
+
+def test_mmd_can_be_computed_for_bitstrings_longer_than_63_bits():
+    target_distr = BitstringDistribution({"0" * 70: 0.5, "1" * 70: 0.5})
+    measured_distr = BitstringDistribution({"0" * 70: 1.0})
+
+    assert compute_mmd(target_distr, measured_distr, {}) == pytest.approx(0.5)
+
+
+@pytest.mark.parametrize("sigma", [1.0, [10.0, 100.0]])
+def test_random_features_mmd_estimate_is_within_error_bound(sigma):
+    rng = np.random.default_rng(5)
+    target_distr = BitstringDistribution.from_probability_vector(rng.random(2 ** 6))
+    measured_distr = BitstringDistribution.from_probability_vector(rng.random(2 ** 6))
+
+    estimate, error_bound = estimate_mmd_with_random_features(
+        target_distr, measured_distr, sigma, n_random_features=2000, seed=7
+    )
+
+    exact_mmd = compute_mmd(target_distr, measured_distr, {"sigma": sigma})
+    assert abs(estimate - exact_mmd) <= error_bound
+
+
+def test_mmd_uses_random_features_if_their_number_is_given():
+    target_distr = BitstringDistribution({"000": 0.5, "111": 0.5})
+    measured_distr = BitstringDistribution({"000": 0.1, "111": 0.9})
+    distance_measure_params = {"sigma": 2.0, "n_random_features": 500, "seed": 3}
+
+    mmd = compute_mmd(target_distr, measured_distr, distance_measure_params)
+
+    estimate, _ = estimate_mmd_with_random_features(
+        target_distr, measured_distr, 2.0, n_random_features=500, seed=3
+    )
+    assert mmd == pytest.approx(estimate)
+
+
+def test_error_bound_of_random_features_mmd_decreases_with_number_of_features():
+    target_distr = BitstringDistribution({"000": 0.5, "111": 0.5})
+    measured_distr = BitstringDistribution({"000": 0.1, "111": 0.9})
+
+    _, small_sample_bound = estimate_mmd_with_random_features(
+        target_distr, measured_distr, n_random_features=100
+    )
+    _, large_sample_bound = estimate_mmd_with_random_features(
+        target_distr, measured_distr, n_random_features=10000
+    )
+
+    assert large_sample_bound == pytest.approx(small_sample_bound / 10)
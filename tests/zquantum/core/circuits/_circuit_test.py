@@ -22,6 +22,7 @@ from zquantum.core.circuits._builtin_gates import (
     Z,
 )
 from zquantum.core.circuits._circuit import Circuit
+from zquantum.core.circuits._wavefunction_operations import MultiPhaseOperation
 
 RNG = np.random.default_rng(42)
 
@@ -162,3 +163,15 @@ class TestBindingParams:
 
         bound_circuit = circuit.bind({theta1: -np.pi, other_param: 42})
         assert bound_circuit.free_symbols == [theta2, theta3]
+
+    def test_binding_params_of_wavefunction_operations(self):
+        theta1, theta2 = sympy.symbols("theta1:3")
+        circuit = Circuit(
+            [RX(theta1)(0), MultiPhaseOperation((theta1, theta2)), RY(theta2)(0)]
+        )
+
+        bound_circuit = circuit.bind({theta1: 0.5, theta2: -1.0})
+
+        assert bound_circuit == Circuit(
+            [RX(0.5)(0), MultiPhaseOperation((0.5, -1.0)), RY(-1.0)(0)]
+        )
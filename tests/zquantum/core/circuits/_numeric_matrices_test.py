@@ -0,0 +1,101 @@
+"""Test cases for _numeric_matrices module and numeric_gate_matrix."""
+import numpy as np
+import pytest
+import sympy
+from zquantum.core.circuits import (
+    CustomGateDefinition,
+    MatrixFactoryGate,
+    _builtin_gates,
+    _matrices,
+    numeric_gate_matrix,
+)
+from zquantum.core.circuits._numeric_matrices import builtin_gate_matrix
+
+BUILTIN_GATES = [
+    _builtin_gates.X,
+    _builtin_gates.Y,
+    _builtin_gates.Z,
+    _builtin_gates.H,
+    _builtin_gates.I,
+    _builtin_gates.S,
+    _builtin_gates.T,
+    _builtin_gates.RX(0.5),
+    _builtin_gates.RY(-1.2),
+    _builtin_gates.RZ(2.5),
+    _builtin_gates.RH(1.5),
+    _builtin_gates.PHASE(1),
+    _builtin_gates.U3(0.5, -3.14, 7),
+    _builtin_gates.CNOT,
+    _builtin_gates.CZ,
+    _builtin_gates.SWAP,
+    _builtin_gates.ISWAP,
+    _builtin_gates.CPHASE(0.1),
+    _builtin_gates.XX(0.7),
+    _builtin_gates.YY(-0.2),
+    _builtin_gates.ZZ(0.3),
+    _builtin_gates.XY(2.1),
+]
+
+
+@pytest.mark.parametrize("gate", BUILTIN_GATES)
+class TestNumericMatricesOfBuiltinGates:
+    def test_are_equal_to_sympy_matrices(self, gate):
+        np.testing.assert_allclose(
+            numeric_gate_matrix(gate), np.array(gate.matrix, dtype=complex), atol=1e-14
+        )
+
+    def test_are_equal_to_sympy_matrices_for_controlled_gates(self, gate):
+        controlled_gate = gate.controlled(2)
+
+        np.testing.assert_allclose(
+            numeric_gate_matrix(controlled_gate),
+            np.array(controlled_gate.matrix, dtype=complex),
+            atol=1e-14,
+        )
+
+    def test_are_equal_to_sympy_matrices_for_daggers(self, gate):
+        np.testing.assert_allclose(
+            numeric_gate_matrix(gate.dagger),
+            np.array(gate.dagger.matrix, dtype=complex),
+            atol=1e-14,
+        )
+
+
+def test_parameters_bound_to_sympy_numbers_are_supported():
+    theta = sympy.Symbol("theta")
+    gate = _builtin_gates.RX(2 * theta).bind({theta: 0.3})
+
+    np.testing.assert_allclose(
+        numeric_gate_matrix(gate), np.array(gate.matrix, dtype=complex), atol=1e-14
+    )
+
+
+def test_matrices_of_builtin_gates_are_cached_and_read_only():
+    first_matrix = numeric_gate_matrix(_builtin_gates.RY(0.25))
+    second_matrix = numeric_gate_matrix(_builtin_gates.RY(0.25))
+
+    assert first_matrix is second_matrix
+    assert not first_matrix.flags.writeable
+    assert builtin_gate_matrix.cache_info().hits > 0
+
+
+def test_gates_reusing_builtin_names_with_other_factories_use_their_factories():
+    gate = MatrixFactoryGate("RX", _matrices.ry_matrix, (0.5,), 1)
+
+    np.testing.assert_allclose(
+        numeric_gate_matrix(gate), np.array(gate.matrix, dtype=complex)
+    )
+
+
+def test_matrices_of_custom_gates_are_converted_from_sympy_matrices():
+    alpha = sympy.Symbol("alpha")
+    gate = CustomGateDefinition(
+        "custom",
+        sympy.Matrix([[sympy.cos(alpha), sympy.sin(alpha)], [-sympy.sin(alpha), 1]]),
+        (alpha,),
+    )(0.4)
+
+    np.testing.assert_allclose(
+        numeric_gate_matrix(gate),
+        [[np.cos(0.4), np.sin(0.4)], [-np.sin(0.4), 1]],
+    )
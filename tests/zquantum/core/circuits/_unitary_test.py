@@ -3,6 +3,7 @@ import numpy as np
 import pytest
 import sympy
 from zquantum.core.circuits import (
+    CNOT,
     RX,
     RY,
     RZ,
@@ -17,6 +18,10 @@ from zquantum.core.circuits import (
     Z,
     export_to_cirq,
 )
+from zquantum.core.circuits._unitary_tools import (
+    _lift_matrix_numpy,
+    _lift_matrix_sympy,
+)
 
 
 class TestCreatingUnitaryFromCircuit:
@@ -60,3 +65,37 @@ class TestCreatingUnitaryFromCircuit:
         np.testing.assert_array_almost_equal(
             np.array(parameterized_unitary.subs(symbols_map), dtype=complex), unitary
         )
+
+    def test_of_many_qubit_circuit_can_be_constructed(self):
+        n_qubits = 12
+        circuit = Circuit([H(0)] + [CNOT(0, qubit) for qubit in range(1, n_qubits)])
+
+        unitary = circuit.to_unitary()
+
+        assert unitary.shape == (2 ** n_qubits, 2 ** n_qubits)
+        np.testing.assert_allclose(
+            unitary[[0, -1], 0], [1 / np.sqrt(2), 1 / np.sqrt(2)]
+        )
+        assert np.count_nonzero(np.abs(unitary[:, 0]) > 1e-12) == 2
+
+
+class TestLiftingMatrices:
+    @pytest.mark.parametrize(
+        "matrix,qubit_indices,num_qubits",
+        [
+            (RX(0.3).matrix, (2,), 4),
+            (XX(0.7).matrix, (0, 3), 4),
+            (XY(1.2).matrix, (3, 1), 5),
+            (YY(0.4).controlled(1).matrix, (4, 0, 2), 5),
+        ],
+    )
+    def test_numpy_and_sympy_versions_give_the_same_matrix(
+        self, matrix, qubit_indices, num_qubits
+    ):
+        np.testing.assert_allclose(
+            _lift_matrix_numpy(matrix, qubit_indices, num_qubits),
+            np.array(
+                _lift_matrix_sympy(matrix, qubit_indices, num_qubits), dtype=complex
+            ),
+            atol=1e-14,
+        )
@@ -123,3 +123,9 @@ class TestMultiPhaseOperation:
         operation = MultiPhaseOperation(params)
         with pytest.raises(RuntimeError):
             operation.apply(wavefunction)
+
+    def test_free_symbols_are_sorted_by_name(self):
+        alpha, beta = sympy.symbols("alpha beta")
+        operation = MultiPhaseOperation((beta, 0.5, alpha + beta, 1))
+
+        assert operation.free_symbols == [alpha, beta]
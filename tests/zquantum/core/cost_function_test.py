@@ -14,7 +14,10 @@ from zquantum.core.estimation import (
     allocate_shots_proportionally,
     allocate_shots_uniformly,
     calculate_exact_expectation_values,
+    estimate_expectation_values_adaptively,
     estimate_expectation_values_by_averaging,
+    group_individually,
+    perform_context_selection,
 )
 from zquantum.core.interfaces.mock_objects import MockAnsatz, MockQuantumSimulator
 from zquantum.core.measurement import ExpectationValues
@@ -23,6 +26,23 @@ from zquantum.core.utils import create_symbols_map
 RNGSEED = 1234
 
 
+def _sum_of_parameters_estimation_method(backend, estimation_tasks):
+    """Deterministic estimation method returning the sum of circuit parameters."""
+    return [
+        ExpectationValues(
+            np.array(
+                [
+                    sum(
+                        float(operation.gate.params[0])
+                        for operation in estimation_task.circuit.operations
+                    )
+                ]
+            )
+        )
+        for estimation_task in estimation_tasks
+    ]
+
+
 @pytest.fixture(
     params=[
         {
@@ -98,6 +118,65 @@ def test_ground_state_cost_function_returns_value_between_plus_and_minus_one(
     assert -1 <= value <= 1
 
 
+def test_ground_state_cost_function_evaluates_batch_with_single_backend_call():
+    backend = MockQuantumSimulator()
+    backend.run_circuitset_and_measure = mock.Mock(
+        wraps=backend.run_circuitset_and_measure
+    )
+    cost_function = get_ground_state_cost_function(
+        QubitOperator("Z0") + QubitOperator("X1") + 0.5 * QubitOperator(""),
+        MockAnsatz(number_of_layers=2, problem_size=2).parametrized_circuit,
+        backend,
+        estimation_preprocessors=[
+            group_individually,
+            perform_context_selection,
+            partial(allocate_shots_uniformly, number_of_shots=10),
+        ],
+    )
+    parameter_matrix = np.array([[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]])
+
+    values = cost_function.function.evaluate_batch(parameter_matrix)
+
+    backend.run_circuitset_and_measure.assert_called_once()
+    circuits = backend.run_circuitset_and_measure.call_args[0][0]
+    assert len(circuits) == 2 * len(parameter_matrix)
+    assert len(values) == len(parameter_matrix)
+    for value in values:
+        assert -1.5 <= value <= 2.5
+
+
+def test_ground_state_cost_function_evaluates_batch_like_single_calls():
+    cost_function = get_ground_state_cost_function(
+        QubitOperator("Z0"),
+        MockAnsatz(number_of_layers=2, problem_size=1).parametrized_circuit,
+        MockQuantumSimulator(),
+        estimation_method=_sum_of_parameters_estimation_method,
+        fixed_parameters=[1.2],
+    )
+    parameter_matrix = np.array([[0.1], [0.3], [-0.5]])
+
+    values = cost_function.function.evaluate_batch(parameter_matrix)
+
+    np.testing.assert_allclose(
+        values, [cost_function(parameters) for parameters in parameter_matrix]
+    )
+
+
+def test_ground_state_cost_function_gradient_evaluates_batch():
+    estimation_method = mock.Mock(wraps=_sum_of_parameters_estimation_method)
+    cost_function = get_ground_state_cost_function(
+        QubitOperator("Z0"),
+        MockAnsatz(number_of_layers=2, problem_size=1).parametrized_circuit,
+        MockQuantumSimulator(),
+        estimation_method=estimation_method,
+    )
+
+    gradient = cost_function.gradient(np.array([0.1, 0.2]))
+
+    estimation_method.assert_called_once()
+    np.testing.assert_allclose(gradient, [1.0, 1.0])
+
+
 def test_noisy_ground_state_cost_function_adds_noise_to_parameters():
     target_operator = QubitOperator("Z0")
     parametrized_circuit = MockAnsatz(
@@ -191,6 +270,24 @@ def test_ansatz_based_cost_function_returns_value_between_plus_and_minus_one(
     assert -1 <= value <= 1
 
 
+def test_ansatz_based_cost_function_with_adaptive_estimation_reports_precision():
+    cost_function = AnsatzBasedCostFunction(
+        QubitOperator("Z0") + 3 * QubitOperator("X1"),
+        MockAnsatz(number_of_layers=1, problem_size=2),
+        MockQuantumSimulator(),
+        estimation_method=partial(
+            estimate_expectation_values_adaptively,
+            target_precision=0.2,
+            total_n_shots=10000,
+        ),
+        estimation_preprocessors=[group_individually, perform_context_selection],
+    )
+
+    value = cost_function(np.array([0.5]))
+
+    assert value.precision <= 0.2
+
+
 @pytest.fixture
 def noisy_ansatz_cost_function_with_ansatz():
     target_operator = QubitOperator("Z0")
@@ -239,3 +336,26 @@ def test_ansatz_based_cost_function_adds_noise_to_parameters(
         noisy_ansatz_cost_function.estimation_method.call_args[0][1][0].circuit
         == expected_noisy_circuit
     )
+
+
+def test_ansatz_based_cost_function_evaluates_batch_with_single_estimation_call(
+    noisy_ansatz_cost_function_with_ansatz,
+):
+    noisy_ansatz_cost_function, ansatz = noisy_ansatz_cost_function_with_ansatz
+    generator = np.random.default_rng(RNGSEED)
+    noise = generator.normal(0, 1e-4, 2)
+    parameter_matrix = np.array([[0.1, 2.3], [-1.0, 0.5]])
+
+    values = noisy_ansatz_cost_function.evaluate_batch(parameter_matrix)
+
+    noisy_ansatz_cost_function.estimation_method.assert_called_once()
+    estimation_tasks = noisy_ansatz_cost_function.estimation_method.call_args[0][1]
+    assert len(values) == len(parameter_matrix)
+    assert len(estimation_tasks) == len(parameter_matrix)
+    for estimation_task, params in zip(estimation_tasks, parameter_matrix):
+        noisy_symbols_map = create_symbols_map(
+            ansatz.parametrized_circuit.free_symbols, noise + params
+        )
+        assert estimation_task.circuit == ansatz.parametrized_circuit.bind(
+            noisy_symbols_map
+        )
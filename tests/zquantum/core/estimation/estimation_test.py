@@ -1,4 +1,5 @@
 from functools import partial
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -6,13 +7,19 @@ import sympy
 from openfermion import IsingOperator, QubitOperator, qubit_operator_sparse
 from zquantum.core.circuits import RX, RY, RZ, Circuit, X
 from zquantum.core.estimation import (
+    EstimationPlan,
     allocate_shots_proportionally,
     allocate_shots_uniformly,
     calculate_exact_expectation_values,
+    estimate_expectation_values_adaptively,
     estimate_expectation_values_by_averaging,
+    estimate_expectation_values_for_batch,
     evaluate_constant_estimation_tasks,
     evaluate_estimation_circuits,
     get_context_selection_circuit_for_group,
+    get_diagonalization_circuit_for_commuting_group,
+    group_by_coloring,
+    group_by_commutation,
     group_greedily,
     group_individually,
     perform_context_selection,
@@ -23,7 +30,10 @@ from zquantum.core.interfaces.mock_objects import (
     MockQuantumBackend,
     MockQuantumSimulator,
 )
-from zquantum.core.measurement import ExpectationValues
+from zquantum.core.measurement import (
+    ExpectationValues,
+    concatenate_expectation_values,
+)
 from zquantum.core.openfermion._utils import change_operator_type
 
 
@@ -44,6 +54,75 @@ class TestEstimatorUtils:
 
         assert np.allclose(target_unitary.todense(), transformed_unitary)
 
+    @pytest.mark.parametrize(
+        "group",
+        [
+            QubitOperator("X0 X1") + QubitOperator("Y0 Y1") - QubitOperator("Z0 Z1"),
+            QubitOperator("X0 Y1 Z2")
+            + 2 * QubitOperator("Y0 X1 Z2")
+            - 0.5 * QubitOperator("Z2"),
+            QubitOperator("X0 X1 X2")
+            - QubitOperator("Z0 Z1")
+            + QubitOperator("Z1 Z2")
+            + 2 * QubitOperator("Y0 Y1 X2")
+            + 3 * QubitOperator(""),
+            QubitOperator("X0") + QubitOperator("X1"),
+        ],
+    )
+    def test_get_diagonalization_circuit_for_commuting_group(self, group):
+        circuit, ising_operator = get_diagonalization_circuit_for_commuting_group(group)
+
+        # Need to convert to QubitOperator in order to get matrix representation
+        qubit_operator = change_operator_type(ising_operator, QubitOperator)
+
+        target_unitary = qubit_operator_sparse(group)
+        transformed_unitary = (
+            circuit.to_unitary().conj().T
+            @ qubit_operator_sparse(qubit_operator, circuit.n_qubits)
+            @ circuit.to_unitary()
+        )
+
+        assert np.allclose(target_unitary.todense(), transformed_unitary)
+        assert len(ising_operator.terms) == len(group.terms)
+
+    def test_get_diagonalization_circuit_fails_for_anticommuting_terms(self):
+        group = QubitOperator("X0 Z1") + QubitOperator("Z0")
+
+        with pytest.raises(ValueError):
+            get_diagonalization_circuit_for_commuting_group(group)
+
+    def test_perform_context_selection_for_commuting_group(self):
+        group = QubitOperator("X0 X1") - 0.5 * QubitOperator("Y0 Y1")
+        base_circuit = Circuit([X(0)])
+
+        (output_task,) = perform_context_selection(
+            [EstimationTask(group, base_circuit, 10)], diagonalize_commuting_groups=True
+        )
+
+        (
+            diagonalization_circuit,
+            expected_operator,
+        ) = get_diagonalization_circuit_for_commuting_group(group)
+        assert output_task.circuit == base_circuit + diagonalization_circuit
+        assert output_task.operator == expected_operator
+        assert output_task.number_of_shots == 10
+
+    def test_perform_context_selection_rejects_commuting_group_by_default(self):
+        group = QubitOperator("X0 X1") - 0.5 * QubitOperator("Y0 Y1")
+
+        with pytest.raises(ValueError):
+            perform_context_selection([EstimationTask(group, Circuit([X(0)]), 10)])
+
+    def test_perform_context_selection_rotates_comeasureable_groups_if_diagonalizing(
+        self,
+    ):
+        group = QubitOperator("X0 Z1") + QubitOperator("X0")
+        estimation_tasks = [EstimationTask(group, Circuit([X(0)]), 10)]
+
+        assert perform_context_selection(
+            estimation_tasks, diagonalize_commuting_groups=True
+        ) == perform_context_selection(estimation_tasks)
+
     def test_perform_context_selection(self):
         target_operators = []
         target_operators.append(10.0 * QubitOperator("Z0"))
@@ -235,6 +314,44 @@ class TestEstimatorUtils:
         for new_task in new_estimation_tasks:
             assert len(new_task.circuit.free_symbols) == 0
 
+    def test_estimation_plan_evaluates_circuits_like_evaluate_estimation_circuits(
+        self,
+    ):
+        theta_0, theta_1 = sympy.symbols("theta_0 theta_1")
+        circuit = Circuit([RX(theta_0)(0), RY(theta_1)(1), X(1)])
+        operator = QubitOperator("X0 Z1") + QubitOperator("Z0") - QubitOperator("Y1")
+        estimation_tasks = perform_context_selection(
+            group_greedily([EstimationTask(operator, circuit, 10)])
+        )
+        estimation_tasks.append(EstimationTask(IsingOperator("Z1"), Circuit([X(2)]), 5))
+        symbols_map = {theta_0: 0.5, theta_1: -1.2}
+
+        estimation_plan = EstimationPlan(estimation_tasks)
+
+        assert estimation_plan.circuit_symbols == [theta_0, theta_1]
+        assert estimation_plan.evaluate(symbols_map) == evaluate_estimation_circuits(
+            estimation_tasks, [symbols_map for _ in estimation_tasks]
+        )
+
+    def test_estimation_plan_binds_shared_parametrized_circuit_once(self):
+        theta = sympy.Symbol("theta")
+        circuit = Circuit([RX(theta)(0), RZ(2 * theta)(1)])
+        operator = QubitOperator("X0") + QubitOperator("Y0 Z1") + QubitOperator("Z0")
+        estimation_tasks = perform_context_selection(
+            group_individually([EstimationTask(operator, circuit, 10)])
+        )
+        estimation_plan = EstimationPlan(estimation_tasks)
+
+        with mock.patch.object(
+            Circuit, "bind", autospec=True, side_effect=Circuit.bind
+        ) as bind_spy:
+            evaluated_tasks = estimation_plan.evaluate({theta: 0.1})
+
+        assert bind_spy.call_count == 1
+        assert [task.circuit for task in evaluated_tasks] == [
+            task.circuit.bind({theta: 0.1}) for task in estimation_tasks
+        ]
+
     def test_group_greedily_all_different_groups(self):
         target_operator = 10.0 * QubitOperator("Z0")
         target_operator -= 3.0 * QubitOperator("Y0")
@@ -280,6 +397,49 @@ class TestEstimatorUtils:
             assert modified_task.circuit == initial_task.circuit
             assert modified_task.number_of_shots == initial_task.number_of_shots
 
+    @pytest.mark.parametrize("coloring_strategy", ["largest-first", "dsatur", "rlf"])
+    def test_group_by_coloring(self, coloring_strategy):
+        target_operator = 10.0 * QubitOperator("Z1")
+        target_operator += 5.0 * QubitOperator("X1")
+        target_operator -= 3.0 * QubitOperator("Z0")
+        target_operator += 1.0 * QubitOperator("X0 Z1")
+        target_operator += 20.0 * QubitOperator("")
+
+        circuit = Circuit([X(0), X(1)])
+
+        estimation_tasks = [EstimationTask(target_operator, circuit, 100)]
+
+        grouped_tasks = group_by_coloring(estimation_tasks, coloring_strategy)
+
+        assert len(grouped_tasks) == 3
+        assert (
+            sum((task.operator for task in grouped_tasks), QubitOperator())
+            == target_operator
+        )
+        for task in grouped_tasks:
+            assert task.circuit == circuit
+            assert task.number_of_shots == 100
+
+    def test_group_by_commutation(self):
+        target_operator = 10.0 * QubitOperator("X0 X1")
+        target_operator += 5.0 * QubitOperator("Y0 Y1")
+        target_operator -= 3.0 * QubitOperator("Z0 Z1")
+        target_operator += 20.0 * QubitOperator("")
+
+        circuit = Circuit([X(0), X(1)])
+
+        estimation_tasks = [EstimationTask(target_operator, circuit, 100)]
+
+        grouped_tasks = group_by_commutation(estimation_tasks)
+
+        assert [task.operator for task in grouped_tasks] == [
+            target_operator - 20.0 * QubitOperator(""),
+            20.0 * QubitOperator(""),
+        ]
+        for task in grouped_tasks:
+            assert task.circuit == circuit
+            assert task.number_of_shots == 100
+
     def test_group_individually(self):
         target_operator = 10.0 * QubitOperator("Z0")
         target_operator += 5.0 * QubitOperator("Z1")
@@ -609,3 +769,150 @@ class TestBasicEstimationMethods:
         backend = MockQuantumBackend()
         with pytest.raises(AttributeError):
             _ = calculate_exact_expectation_values(backend, estimation_tasks)
+
+    def test_estimate_expectation_values_for_batch_runs_all_circuits_at_once(
+        self, backend, estimation_tasks
+    ):
+        backend.run_circuitset_and_measure = mock.Mock(
+            wraps=backend.run_circuitset_and_measure
+        )
+        estimation_tasks_batch = [estimation_tasks, estimation_tasks[:1], []]
+
+        expectation_values_batch = estimate_expectation_values_for_batch(
+            backend, estimation_tasks_batch
+        )
+
+        backend.run_circuitset_and_measure.assert_called_once()
+        circuits = backend.run_circuitset_and_measure.call_args[0][0]
+        assert len(circuits) == 3
+        assert [
+            len(expectation_values_list)
+            for expectation_values_list in expectation_values_batch
+        ] == [3, 1, 0]
+        for expectation_values_list, tasks in zip(
+            expectation_values_batch, estimation_tasks_batch
+        ):
+            for expectation_values, task in zip(expectation_values_list, tasks):
+                assert len(expectation_values.values) == len(task.operator.terms)
+        assert expectation_values_batch[0][2].values[0] == 2.0
+
+    def test_estimate_expectation_values_for_batch_uses_estimation_method(
+        self, simulator, estimation_tasks
+    ):
+        estimation_method = mock.Mock(wraps=calculate_exact_expectation_values)
+
+        expectation_values_batch = estimate_expectation_values_for_batch(
+            simulator,
+            [estimation_tasks[:2], estimation_tasks[2:]],
+            estimation_method,
+        )
+
+        estimation_method.assert_called_once_with(simulator, estimation_tasks)
+        assert [
+            len(expectation_values_list)
+            for expectation_values_list in expectation_values_batch
+        ] == [2, 1]
+
+
+class TestAdaptiveEstimation:
+    @pytest.fixture()
+    def backend(self):
+        backend = MockQuantumBackend()
+        backend.run_circuitset_and_measure = mock.Mock(
+            wraps=backend.run_circuitset_and_measure
+        )
+        return backend
+
+    @pytest.fixture()
+    def estimation_tasks(self):
+        return [
+            EstimationTask(IsingOperator("Z0"), Circuit([X(0)]), None),
+            EstimationTask(IsingOperator((), 2.0), Circuit([X(0)]), None),
+            EstimationTask(
+                5 * IsingOperator("Z0")
+                + 5 * IsingOperator("Z1")
+                + IsingOperator((), 0.5),
+                Circuit([X(0), X(1)]),
+                None,
+            ),
+        ]
+
+    @staticmethod
+    def _get_precision(expectation_values_list):
+        estimator_covariances = concatenate_expectation_values(
+            expectation_values_list
+        ).estimator_covariances
+        return np.sqrt(sum(np.sum(covariance) for covariance in estimator_covariances))
+
+    @staticmethod
+    def _get_shots_per_task(backend, estimation_tasks):
+        circuits = [task.circuit for task in estimation_tasks]
+        shots_per_task = np.zeros(len(estimation_tasks), dtype=int)
+        for call in backend.run_circuitset_and_measure.call_args_list:
+            for circuit, n_shots in zip(*call[0]):
+                shots_per_task[circuits.index(circuit)] += n_shots
+        return shots_per_task
+
+    def test_returns_expectation_values_for_each_task(self, backend, estimation_tasks):
+        expectation_values_list = estimate_expectation_values_adaptively(
+            backend, estimation_tasks, target_precision=0.5, total_n_shots=10000
+        )
+
+        assert len(expectation_values_list) == len(estimation_tasks)
+        for expectation_values, task in zip(expectation_values_list, estimation_tasks):
+            assert len(expectation_values.values) == len(task.operator.terms)
+        assert expectation_values_list[1].values[0] == 2.0
+        assert expectation_values_list[2].values[2] == 0.5
+
+    def test_stops_when_target_precision_is_reached(self, backend, estimation_tasks):
+        expectation_values_list = estimate_expectation_values_adaptively(
+            backend, estimation_tasks, target_precision=0.5, total_n_shots=100000
+        )
+
+        assert self._get_precision(expectation_values_list) <= 0.5
+        shots_per_task = self._get_shots_per_task(
+            backend, [estimation_tasks[0], estimation_tasks[2]]
+        )
+        # Variances of tasks are roughly 1 and 50, so about 260 shots are needed.
+        assert shots_per_task.sum() < 1000
+        # Shots are allocated proportionally to standard deviations, so the pilot
+        # round already gave the first task more shots than it needs.
+        assert shots_per_task[0] == 100
+        assert shots_per_task[1] > 100
+
+    def test_does_not_exceed_total_number_of_shots(self, backend, estimation_tasks):
+        estimate_expectation_values_adaptively(
+            backend,
+            estimation_tasks,
+            target_precision=1e-3,
+            total_n_shots=1000,
+            n_pilot_shots=50,
+            max_n_shots_per_round=300,
+        )
+
+        shots_per_task = self._get_shots_per_task(
+            backend, [estimation_tasks[0], estimation_tasks[2]]
+        )
+        assert shots_per_task.sum() == 1000
+        for call in backend.run_circuitset_and_measure.call_args_list[1:]:
+            assert sum(call[0][1]) <= 300
+
+    def test_each_round_is_a_single_backend_call(self, backend, estimation_tasks):
+        estimate_expectation_values_adaptively(
+            backend, estimation_tasks, target_precision=1e-3, total_n_shots=500
+        )
+
+        # pilot round, then rounds with the remaining budget
+        assert backend.run_circuitset_and_measure.call_count >= 2
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"target_precision": 0.0, "total_n_shots": 1000},
+            {"target_precision": 0.1, "total_n_shots": 100},
+            {"target_precision": 0.1, "total_n_shots": 1000, "n_pilot_shots": 1},
+        ],
+    )
+    def test_raises_for_invalid_arguments(self, backend, estimation_tasks, kwargs):
+        with pytest.raises(ValueError):
+            estimate_expectation_values_adaptively(backend, estimation_tasks, **kwargs)
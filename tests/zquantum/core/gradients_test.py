@@ -1,7 +1,42 @@
 """Tests for core.gradients module."""
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from unittest import mock
+
 import numpy as np
 import pytest
-from zquantum.core.gradients import finite_differences_gradient
+import sympy
+from openfermion import QubitOperator, get_sparse_operator
+from zquantum.core.circuits import (
+    CNOT,
+    CPHASE,
+    PHASE,
+    RX,
+    RY,
+    RZ,
+    U3,
+    XX,
+    YY,
+    ZZ,
+    Circuit,
+    H,
+    MultiPhaseOperation,
+)
+from zquantum.core.cost_function import (
+    AnsatzBasedCostFunction,
+    get_ground_state_cost_function,
+)
+from zquantum.core.estimation import (
+    allocate_shots_uniformly,
+    group_individually,
+    perform_context_selection,
+)
+from zquantum.core.gradients import (
+    finite_differences_gradient,
+    parameter_shift_gradient,
+)
+from zquantum.core.interfaces.mock_objects import MockAnsatz, MockQuantumSimulator
+from zquantum.core.measurement import ExpectationValues
 
 
 def sum_x_squared(parameters: np.ndarray) -> float:
@@ -39,3 +74,236 @@ def test_finite_differences_gradient_uses_supplied_epsilon_to_compute_gradient_e
     ) / (2 * epsilon)
 
     assert np.array_equal(expected_gradient_value, gradient(parameters))
+
+
+@pytest.mark.parametrize(
+    "epsilon,parameters",
+    [
+        (0.1, np.array([0, 0, 0])),
+        (0.001, np.array([-0.5, 0.25, 1])),
+    ],
+)
+def test_forward_differences_gradient_uses_supplied_epsilon_to_compute_gradient(
+    epsilon, parameters
+):
+    gradient = finite_differences_gradient(sum_x_squared, epsilon, method="forward")
+    eps_vectors = np.eye(len(parameters)) * epsilon
+
+    expected_gradient_value = np.array(
+        [
+            sum_x_squared(parameters + vector) - sum_x_squared(parameters)
+            for vector in eps_vectors
+        ]
+    ) / epsilon
+
+    np.testing.assert_allclose(gradient(parameters), expected_gradient_value)
+
+
+def test_finite_differences_gradient_raises_for_unknown_method():
+    with pytest.raises(ValueError):
+        finite_differences_gradient(sum_x_squared, method="backward")
+
+
+@pytest.mark.parametrize("executor_cls", [ThreadPoolExecutor, ProcessPoolExecutor])
+@pytest.mark.parametrize("method", ["central", "forward"])
+def test_finite_differences_gradient_evaluates_function_with_executor(
+    executor_cls, method
+):
+    parameters = np.array([-0.5, 0.25, 1, 2])
+    with executor_cls(max_workers=2) as executor:
+        gradient = finite_differences_gradient(
+            sum_x_squared, 0.001, method=method, executor=executor
+        )
+        gradient_value = gradient(parameters)
+
+    np.testing.assert_array_equal(
+        gradient_value,
+        finite_differences_gradient(sum_x_squared, 0.001, method=method)(parameters),
+    )
+
+
+def test_finite_differences_gradient_prefers_executor_over_batches():
+    function = SumXSquaredWithBatches()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        finite_differences_gradient(function, executor=executor)(np.array([1.0, 2.0]))
+
+    assert function.evaluate_batch_calls == 0
+
+
+class SumXSquaredWithBatches:
+    def __init__(self):
+        self.evaluate_batch_calls = 0
+
+    def __call__(self, parameters: np.ndarray) -> float:
+        return sum_x_squared(parameters)
+
+    def evaluate_batch(self, parameter_matrix: np.ndarray) -> np.ndarray:
+        self.evaluate_batch_calls += 1
+        return np.array([sum_x_squared(parameters) for parameters in parameter_matrix])
+
+
+@pytest.mark.parametrize(
+    "epsilon,parameters",
+    [
+        (0.1, np.array([0, 0, 0])),
+        (0.001, np.array([0, 1, 0])),
+        (0.001, np.array([-0.5, 0.25, 1])),
+    ],
+)
+def test_finite_differences_gradient_evaluates_function_in_a_single_batch(
+    epsilon, parameters
+):
+    function = SumXSquaredWithBatches()
+    gradient = finite_differences_gradient(function, epsilon)
+
+    gradient_value = gradient(parameters)
+
+    assert function.evaluate_batch_calls == 1
+    np.testing.assert_allclose(
+        gradient_value, finite_differences_gradient(sum_x_squared, epsilon)(parameters)
+    )
+
+
+def _exact_estimation_method(backend, estimation_tasks):
+    expectation_values_list = []
+    for estimation_task in estimation_tasks:
+        circuit = estimation_task.circuit
+        n_qubits = circuit.n_qubits
+        wavefunction = np.asarray(circuit.to_unitary(), dtype=complex)[:, 0]
+        values = [
+            np.vdot(
+                wavefunction,
+                get_sparse_operator(
+                    QubitOperator(term, coefficient), n_qubits
+                ).toarray()
+                @ wavefunction,
+            ).real
+            for term, coefficient in estimation_task.operator.terms.items()
+        ]
+        expectation_values_list.append(ExpectationValues(np.array(values)))
+    return expectation_values_list
+
+
+ALPHA, BETA, GAMMA = sympy.symbols("alpha beta gamma")
+
+
+class TestParameterShiftGradient:
+    @pytest.mark.parametrize(
+        "circuit",
+        [
+            Circuit([RX(ALPHA)(0), RY(BETA)(1), CNOT(0, 1), RZ(GAMMA)(1), H(1)]),
+            Circuit(
+                [
+                    H(0),
+                    H(1),
+                    XX(ALPHA)(0, 1),
+                    YY(2 * BETA - 0.3)(0, 1),
+                    ZZ(GAMMA)(0, 1),
+                    RX(ALPHA + BETA)(1),
+                    CPHASE(GAMMA)(0, 1),
+                    PHASE(-ALPHA)(0),
+                    H(0),
+                    RY(0.5 * ALPHA)(1),
+                ]
+            ),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "parameters", [np.array([0.1, 0.2, 0.3]), np.array([-1.2, 2.5, 0.7])]
+    )
+    def test_gradient_matches_finite_differences(self, circuit, parameters):
+        cost_function = get_ground_state_cost_function(
+            QubitOperator("Z0") + 0.5 * QubitOperator("X0 Y1") + QubitOperator(""),
+            circuit,
+            MockQuantumSimulator(),
+            estimation_method=_exact_estimation_method,
+            gradient_function=parameter_shift_gradient,
+        )
+
+        np.testing.assert_allclose(
+            cost_function.gradient(parameters),
+            finite_differences_gradient(cost_function)(parameters),
+            atol=1e-7,
+        )
+
+    def test_gradient_is_computed_with_fixed_parameters_and_preprocessors(self):
+        circuit = Circuit([RX(ALPHA)(0), RY(BETA)(1), CNOT(0, 1), RZ(GAMMA)(1)])
+        cost_function = get_ground_state_cost_function(
+            QubitOperator("Z0 Z1") + QubitOperator("X1") + QubitOperator("Y0"),
+            circuit,
+            MockQuantumSimulator(),
+            estimation_method=_exact_estimation_method,
+            estimation_preprocessors=[group_individually, perform_context_selection],
+            fixed_parameters=np.array([0.4]),
+            gradient_function=parameter_shift_gradient,
+        )
+        parameters = np.array([0.9, -0.3])
+
+        np.testing.assert_allclose(
+            cost_function.gradient(parameters),
+            finite_differences_gradient(cost_function)(parameters),
+            atol=1e-7,
+        )
+
+    def test_all_shifted_circuits_are_estimated_with_single_call(self):
+        circuit = Circuit([RX(ALPHA)(0), RY(ALPHA)(1), RZ(BETA)(0)])
+        estimation_method = mock.Mock(wraps=_exact_estimation_method)
+        cost_function = get_ground_state_cost_function(
+            QubitOperator("Z0") + QubitOperator("Z1"),
+            circuit,
+            MockQuantumSimulator(),
+            estimation_method=estimation_method,
+            gradient_function=parameter_shift_gradient,
+        )
+
+        cost_function.gradient(np.array([0.1, 0.2]))
+
+        estimation_method.assert_called_once()
+        assert len(estimation_method.call_args[0][1]) == 6
+
+    def test_gradient_can_be_used_with_sampling_estimation(self):
+        cost_function = get_ground_state_cost_function(
+            QubitOperator("Z0"),
+            MockAnsatz(number_of_layers=2, problem_size=2).parametrized_circuit,
+            MockQuantumSimulator(),
+            estimation_preprocessors=[
+                partial(allocate_shots_uniformly, number_of_shots=10)
+            ],
+            gradient_function=parameter_shift_gradient,
+        )
+
+        assert len(cost_function.gradient(np.array([0.1, 0.2]))) == 2
+
+    def test_gradient_of_ansatz_based_cost_function(self):
+        cost_function = AnsatzBasedCostFunction(
+            QubitOperator("Z0") + QubitOperator("Z1"),
+            MockAnsatz(number_of_layers=2, problem_size=2),
+            MockQuantumSimulator(),
+            estimation_method=_exact_estimation_method,
+            fixed_parameters=np.array([0.3]),
+        )
+        # <Z> = cos(theta_0 + theta_1) for each qubit
+        np.testing.assert_allclose(
+            parameter_shift_gradient(cost_function)(np.array([0.5])),
+            [-2 * np.sin(0.8)],
+        )
+
+    @pytest.mark.parametrize(
+        "circuit",
+        [
+            Circuit([U3(ALPHA, 0.1, 0.2)(0)]),
+            Circuit([RX(ALPHA).controlled(1)(0, 1)]),
+            Circuit([RX(ALPHA ** 2)(0)]),
+            Circuit([RX(ALPHA * BETA)(0)]),
+            Circuit([H(0), MultiPhaseOperation((ALPHA, 0.0))]),
+        ],
+    )
+    def test_raises_for_unsupported_circuits(self, circuit):
+        with pytest.raises(ValueError):
+            get_ground_state_cost_function(
+                QubitOperator("Z0"),
+                circuit,
+                MockQuantumSimulator(),
+                estimation_method=_exact_estimation_method,
+                gradient_function=parameter_shift_gradient,
+            )
@@ -6,6 +6,7 @@ from openfermion import (
     FermionOperator,
     InteractionRDM,
     QubitOperator,
+    commutator,
     eigenspectrum,
     get_interaction_operator,
     jordan_wigner,
@@ -13,9 +14,12 @@ from openfermion import (
 from zquantum.core.hamiltonian import (
     compute_group_variances,
     estimate_nmeas_for_frames,
+    get_decomposition_function,
     get_expectation_values_from_rdms,
     get_expectation_values_from_rdms_for_qubitoperator_list,
+    group_comeasureable_terms_by_coloring,
     group_comeasureable_terms_greedy,
+    group_commuting_terms_by_coloring,
     is_comeasureable,
     reorder_fermionic_modes,
 )
@@ -245,6 +249,145 @@ def test_group_comeasureable_terms_greedy_sorted(
     assert groups == expected_groups
 
 
+@pytest.mark.parametrize(
+    "qubit_operator,expected_groups",
+    [
+        (
+            QubitOperator("[Z0 X70] + [Z0 Y70] + [X1 X70] + [Z0 Z1]"),
+            [QubitOperator("[Z0 X70] + [X1 X70]"), QubitOperator("[Z0 Y70] + [Z0 Z1]")],
+        ),
+        (
+            QubitOperator("[X63] + [Y64] + [Z63 Z64]"),
+            [QubitOperator("[X63] + [Y64]"), QubitOperator("[Z63 Z64]")],
+        ),
+    ],
+)
+def test_group_comeasureable_terms_greedy_with_more_than_64_qubits(
+    qubit_operator, expected_groups
+):
+    groups = group_comeasureable_terms_greedy(qubit_operator)
+    assert groups == expected_groups
+
+
+@pytest.mark.parametrize("sort_terms", [False, True])
+def test_group_comeasureable_terms_greedy_assigns_terms_to_first_compatible_group(
+    sort_terms,
+):
+    rng = np.random.default_rng(1)
+    qubit_operator = QubitOperator()
+    for _ in range(200):
+        qubits = sorted(rng.choice(8, size=rng.integers(1, 4), replace=False))
+        term = tuple((int(qubit), str(rng.choice(["X", "Y", "Z"]))) for qubit in qubits)
+        qubit_operator.terms[term] = rng.uniform(-1, 1)
+
+    groups = group_comeasureable_terms_greedy(qubit_operator, sort_terms=sort_terms)
+
+    assert sum(len(group.terms) for group in groups) == len(qubit_operator.terms)
+    for group_index, group in enumerate(groups):
+        for term_index, term in enumerate(group.terms):
+            assert all(
+                is_comeasureable(term, other_term)
+                for other_term in list(group.terms)[:term_index]
+            )
+            # Earlier groups already contained an incompatible term.
+            for earlier_group in groups[:group_index]:
+                assert not all(
+                    is_comeasureable(term, other_term)
+                    for other_term in earlier_group.terms
+                )
+
+
+@pytest.mark.parametrize("coloring_strategy", ["largest-first", "dsatur", "rlf"])
+class TestGroupComeasureableTermsByColoring:
+    def test_groups_contain_all_terms_and_are_comeasureable(self, coloring_strategy):
+        rng = np.random.default_rng(2)
+        qubit_operator = QubitOperator("-0.5 []")
+        for _ in range(200):
+            qubits = sorted(rng.choice(8, size=rng.integers(1, 4), replace=False))
+            term = tuple(
+                (int(qubit), str(rng.choice(["X", "Y", "Z"]))) for qubit in qubits
+            )
+            qubit_operator.terms[term] = rng.uniform(-1, 1)
+
+        groups = group_comeasureable_terms_by_coloring(
+            qubit_operator, coloring_strategy
+        )
+
+        assert sum(groups, QubitOperator()) == qubit_operator
+        assert sum(len(group.terms) for group in groups) == len(qubit_operator.terms)
+        assert groups[-1] == QubitOperator("-0.5 []")
+        for group in groups:
+            assert all(
+                is_comeasureable(term, other_term)
+                for term in group.terms
+                for other_term in group.terms
+            )
+
+    def test_finds_fewer_groups_than_greedy_grouping(self, coloring_strategy):
+        qubit_operator = QubitOperator("[Z1] + [X1] + [Z0] + [X0 Z1]")
+
+        groups = group_comeasureable_terms_by_coloring(
+            qubit_operator, coloring_strategy
+        )
+
+        assert len(group_comeasureable_terms_greedy(qubit_operator)) == 3
+        assert sorted(groups, key=lambda group: len(group.terms)) in [
+            [QubitOperator("[Z1] + [X0 Z1]"), QubitOperator("[X1] + [Z0]")],
+            [QubitOperator("[X1] + [Z0]"), QubitOperator("[Z1] + [X0 Z1]")],
+        ]
+
+    def test_is_available_as_decomposition_method(self, coloring_strategy):
+        qubit_operator = QubitOperator("[Z0 Z1] + [X0 X1] + [Z0] + [X0] + 2 []")
+
+        groups = get_decomposition_function(coloring_strategy)(qubit_operator)
+
+        assert groups == group_comeasureable_terms_by_coloring(
+            qubit_operator, coloring_strategy
+        )
+        assert len(groups) == 3
+
+
+@pytest.mark.parametrize("coloring_strategy", ["largest-first", "dsatur", "rlf"])
+def test_group_commuting_terms_by_coloring_produces_commuting_groups(
+    coloring_strategy,
+):
+    rng = np.random.default_rng(3)
+    qubit_operator = QubitOperator("2 []")
+    for _ in range(100):
+        qubits = sorted(rng.choice(6, size=rng.integers(1, 5), replace=False))
+        term = tuple((int(qubit), str(rng.choice(["X", "Y", "Z"]))) for qubit in qubits)
+        qubit_operator.terms[term] = rng.uniform(-1, 1)
+
+    groups = group_commuting_terms_by_coloring(qubit_operator, coloring_strategy)
+
+    assert sum(groups, QubitOperator()) == qubit_operator
+    assert groups[-1] == QubitOperator("2 []")
+    for group in groups:
+        for term in group.terms:
+            for other_term in group.terms:
+                assert (
+                    commutator(QubitOperator(term), QubitOperator(other_term))
+                    == QubitOperator()
+                )
+    assert len(groups) < len(
+        group_comeasureable_terms_by_coloring(qubit_operator, coloring_strategy)
+    )
+
+
+def test_group_commuting_terms_by_coloring_groups_bell_basis_terms_together():
+    qubit_operator = QubitOperator("[X0 X1] + [Y0 Y1] + [Z0 Z1]")
+
+    groups = group_commuting_terms_by_coloring(qubit_operator)
+
+    assert groups == [qubit_operator]
+    assert len(group_comeasureable_terms_by_coloring(qubit_operator)) == 3
+
+
+def test_group_comeasureable_terms_by_coloring_fails_for_unknown_strategy():
+    with pytest.raises(ValueError):
+        group_comeasureable_terms_by_coloring(QubitOperator("[Z0]"), "random")
+
+
 @pytest.mark.parametrize(
     "interactionrdm, qubitoperator, sort_terms",
     [
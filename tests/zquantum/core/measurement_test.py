@@ -5,12 +5,13 @@ from collections import Counter
 
 import numpy as np
 import pytest
-from openfermion.ops import IsingOperator
+from openfermion.ops import IsingOperator, QubitOperator
 from pyquil.wavefunction import Wavefunction
 from zquantum.core.bitstring_distribution import BitstringDistribution
 from zquantum.core.measurement import (
     ExpectationValues,
     Measurements,
+    MeasurementsAccumulator,
     Parities,
     check_parity,
     concatenate_expectation_values,
@@ -23,6 +24,8 @@ from zquantum.core.measurement import (
     load_parities,
     load_wavefunction,
     sample_from_wavefunction,
+    sample_measurements_from_probabilities,
+    sample_measurements_from_wavefunction,
     save_expectation_values,
     save_parities,
     save_wavefunction,
@@ -158,6 +161,43 @@ def test_sample_from_wavefunction_list():
     assert sample.pop() == expected_bitstring
 
 
+def test_sample_measurements_from_wavefunction_uses_little_endian_qubit_order():
+    n_qubits = 4
+    amplitudes = np.zeros(2 ** n_qubits)
+    amplitudes[1] = amplitudes[6] = 1 / np.sqrt(2)
+    wavefunction = Wavefunction(amplitudes)
+
+    measurements = sample_measurements_from_wavefunction(wavefunction, 1000)
+
+    assert measurements.n_samples == 1000
+    assert set(measurements.get_counts()) == {"1000", "0110"}
+
+
+def test_sample_measurements_from_wavefunction_is_reproducible_with_seed():
+    wavefunction = create_random_wavefunction(5, seed=RNDSEED)
+
+    first_measurements = sample_measurements_from_wavefunction(
+        wavefunction, 100, seed=RNDSEED
+    )
+    second_measurements = sample_measurements_from_wavefunction(
+        wavefunction, 100, seed=RNDSEED
+    )
+
+    assert first_measurements.get_counts() == second_measurements.get_counts()
+
+
+def test_sample_measurements_from_probabilities_follows_probabilities():
+    probabilities = np.array([0.0, 0.75, 0.0, 0.25])
+
+    measurements = sample_measurements_from_probabilities(
+        probabilities, 10000, seed=RNDSEED
+    )
+
+    counts = measurements.get_counts()
+    assert set(counts) == {"10", "11"}
+    assert counts["10"] / 10000 == pytest.approx(0.75, abs=0.02)
+
+
 def test_parities_io():
     measurements = [(1, 0), (1, 0), (0, 1), (0, 0)]
     op = IsingOperator("[Z0] + [Z1] + [Z0 Z1]")
@@ -171,6 +211,42 @@ def test_parities_io():
     remove_file_if_exists("parities.json")
 
 
+def test_get_parities_from_measurements():
+    # Given
+    measurements = [(1, 0), (1, 0), (0, 1), (0, 0)]
+    op = IsingOperator("[Z0] + [Z1] + [Z0 Z1]")
+
+    # When
+    parities = get_parities_from_measurements(measurements, op)
+
+    # Then
+    np.testing.assert_array_equal(parities.values, [[2, 2], [3, 1], [1, 3]])
+    assert len(parities.correlations) == 1
+    np.testing.assert_array_equal(
+        parities.correlations[0],
+        [
+            [[4, 0], [1, 3], [3, 1]],
+            [[1, 3], [4, 0], [2, 2]],
+            [[3, 1], [2, 2], [4, 0]],
+        ],
+    )
+
+
+def test_get_parities_from_measurements_without_correlations():
+    # Given
+    measurements = [(1, 0), (1, 0), (0, 1), (0, 0)]
+    op = IsingOperator("[Z0] + [Z1] + [Z0 Z1]")
+
+    # When
+    parities = get_parities_from_measurements(
+        measurements, op, include_correlations=False
+    )
+
+    # Then
+    np.testing.assert_array_equal(parities.values, [[2, 2], [3, 1], [1, 3]])
+    assert parities.correlations is None
+
+
 def test_get_expectation_values_from_parities():
     parities = Parities(values=np.array([[18, 50], [120, 113], [75, 26]]))
     expectation_values = get_expectation_values_from_parities(parities)
@@ -356,6 +432,59 @@ class TestMeasurements:
         assert target_measurements.bitstrings == recreated_measurements.bitstrings
         remove_file_if_exists("measurementstest.json")
 
+    @pytest.mark.parametrize("mmap", [True, False])
+    def test_binary_io(self, mmap):
+        # Given
+        bitstrings = [tuple(int(bit) for bit in f"{i:011b}") for i in range(0, 2048, 7)]
+        measurements = Measurements(bitstrings)
+        filename = "measurements_binary_test.bin"
+
+        # When
+        measurements.save_binary(filename)
+        loaded_measurements = Measurements.load_from_binary_file(filename, mmap=mmap)
+
+        # Then
+        assert loaded_measurements.n_qubits == 11
+        assert loaded_measurements.bitstrings == bitstrings
+        assert loaded_measurements.get_counts() == measurements.get_counts()
+
+        del loaded_measurements
+        remove_file_if_exists(filename)
+
+    def test_load_from_file_recognizes_binary_format(self):
+        # Given
+        measurements = Measurements([(0, 1, 1), (1, 0, 0), (0, 1, 1)])
+        filename = "measurements_binary_test.bin"
+        measurements.save_binary(filename)
+
+        # When
+        loaded_measurements = Measurements.load_from_file(filename)
+
+        # Then
+        assert loaded_measurements.bitstrings == measurements.bitstrings
+
+        del loaded_measurements
+        remove_file_if_exists(filename)
+
+    def test_binary_io_of_empty_measurements(self):
+        filename = "measurements_binary_test.bin"
+        Measurements().save_binary(filename)
+
+        loaded_measurements = Measurements.load_from_binary_file(filename)
+
+        assert loaded_measurements.n_samples == 0
+        assert loaded_measurements.bitstrings == []
+        remove_file_if_exists(filename)
+
+    def test_loading_json_file_as_binary_raises_error(self):
+        filename = "measurements_output_test.json"
+        Measurements([(0, 1)]).save(filename)
+
+        with pytest.raises(ValueError):
+            Measurements.load_from_binary_file(filename)
+
+        remove_file_if_exists(filename)
+
     def test_intialize_with_bitstrings(self):
         # Given
         bitstrings = [
@@ -415,6 +544,91 @@ class TestMeasurements:
             (1, 1, 1),
         ]
 
+    def test_counts_are_merged_without_expanding_measurements(self):
+        # Given
+        measurements = Measurements.from_counts({"00": 10 ** 9, "11": 5})
+
+        # When
+        measurements.add_counts({"11": 3, "01": 0})
+
+        # Then
+        assert measurements.n_samples == 10 ** 9 + 8
+        assert measurements.get_counts() == {"00": 10 ** 9, "11": 8}
+
+    def test_adding_counts_to_bitstrings_preserves_order_of_measurements(self):
+        # Given
+        measurements = Measurements([(1, 1), (0, 0)])
+
+        # When
+        measurements.add_counts({"10": 2})
+
+        # Then
+        assert measurements.bitstrings == [(1, 1), (0, 0), (1, 0), (1, 0)]
+
+    def test_adding_negative_counts_raises_error(self):
+        with pytest.raises(ValueError):
+            Measurements.from_counts({"00": -1})
+
+    def test_io_of_measurements_created_from_counts(self):
+        # Given
+        counts = {"000": 3, "101": 2}
+        measurements = Measurements.from_counts(counts)
+        filename = "measurements_output_test.json"
+
+        # When
+        measurements.save(filename)
+        with open(filename, "r") as f:
+            data = json.load(f)
+        loaded_measurements = Measurements.load_from_file(filename)
+
+        # Then
+        assert data == {
+            "schema": SCHEMA_VERSION + "-measurements",
+            "counts": counts,
+            "bitstrings": [[0, 0, 0]] * 3 + [[1, 0, 1]] * 2,
+        }
+        assert loaded_measurements.get_counts() == counts
+        remove_file_if_exists(filename)
+
+    def test_io_of_counts_only(self):
+        # Given
+        counts = {"000": 3, "101": 2}
+        measurements = Measurements.from_counts(counts)
+        filename = "measurements_output_test.json"
+
+        # When
+        measurements.save(filename, counts_only=True)
+        with open(filename, "r") as f:
+            data = json.load(f)
+        loaded_measurements = Measurements.load_from_file(filename)
+
+        # Then
+        assert data == {
+            "schema": SCHEMA_VERSION + "-measurements-histogram",
+            "counts": counts,
+        }
+        assert loaded_measurements.get_counts() == counts
+        remove_file_if_exists(filename)
+
+    @pytest.mark.parametrize("mmap", [True, False])
+    def test_binary_io_of_measurements_created_from_counts(self, mmap):
+        # Given
+        measurements = Measurements.from_counts({"0001": 3, "1100": 2})
+        measurements.add_counts({"0001": 4})
+        filename = "measurements_binary_test.bin"
+
+        # When
+        measurements.save_binary(filename)
+        loaded_measurements = Measurements.load_from_binary_file(filename, mmap=mmap)
+
+        # Then
+        assert loaded_measurements.n_samples == 9
+        assert loaded_measurements.get_counts() == {"0001": 7, "1100": 2}
+        assert loaded_measurements.bitstrings == measurements.bitstrings
+
+        del loaded_measurements
+        remove_file_if_exists(filename)
+
     def test_bitstrings(self):
         # Given
         measurements_data = {
@@ -647,6 +861,68 @@ class TestMeasurements:
             (1, 1, 1),
         ]
 
+    def test_bit_matrix_matches_bitstrings(self):
+        # Given
+        bitstrings = [(0, 1, 0), (1, 1, 1), (0, 0, 1)]
+
+        # When
+        measurements = Measurements(bitstrings)
+
+        # Then
+        assert measurements.n_samples == 3
+        assert measurements.n_qubits == 3
+        np.testing.assert_array_equal(
+            measurements.get_bit_matrix(), np.array(bitstrings, dtype=np.uint8)
+        )
+
+    def test_bitstrings_wider_than_one_byte_are_preserved(self):
+        # Given
+        bitstrings = [tuple(int(bit) for bit in f"{i:011b}") for i in range(0, 2048, 7)]
+
+        # When
+        measurements = Measurements(bitstrings)
+
+        # Then
+        assert measurements.bitstrings == bitstrings
+        assert sum(measurements.get_counts().values()) == len(bitstrings)
+
+    def test_empty_measurements_have_no_counts(self):
+        measurements = Measurements()
+
+        assert measurements.n_samples == 0
+        assert measurements.n_qubits is None
+        assert measurements.bitstrings == []
+        assert measurements.get_counts() == {}
+
+    def test_adding_counts_with_different_number_of_qubits_raises_error(self):
+        measurements = Measurements.from_counts({"00": 1, "11": 2})
+
+        with pytest.raises(ValueError):
+            measurements.add_counts({"000": 1})
+
+    @pytest.mark.parametrize("bitstrings", [[(0, 1), (0, 2)], [(0, -1)]])
+    def test_non_binary_bitstrings_raise_error(self, bitstrings):
+        with pytest.raises(ValueError):
+            Measurements(bitstrings)
+
+        measurements = Measurements([(0, 1)])
+        with pytest.raises(ValueError):
+            measurements.bitstrings = bitstrings
+
+    def test_adding_non_binary_counts_raises_error(self):
+        measurements = Measurements.from_counts({"00": 1})
+
+        with pytest.raises(ValueError):
+            measurements.add_counts({"02": 1})
+        assert measurements.get_counts() == {"00": 1}
+
+    def test_modifying_bitstrings_list_does_not_change_measurements(self):
+        measurements = Measurements([(0, 1)])
+
+        measurements.bitstrings.append((1, 1))
+
+        assert measurements.bitstrings == [(0, 1)]
+
     def test_get_expectation_values_from_measurements(self):
         # Given
         measurements = Measurements(
@@ -729,6 +1005,64 @@ class TestMeasurements:
             expectation_values.estimator_covariances[0], target_covariances
         )
 
+    def test_get_expectation_values_agrees_with_frequency_based_computation(self):
+        # Given
+        rng = np.random.default_rng(RNDSEED)
+        n_qubits = 5
+        measurements = Measurements(
+            [tuple(row) for row in rng.integers(0, 2, size=(200, n_qubits))]
+        )
+        ising_operator = IsingOperator("0.5[] + 2[Z0 Z3] - [Z1] + 0.3[Z2 Z3 Z4]")
+        terms = list(ising_operator.terms.items())
+        frequencies = measurements.get_counts()
+
+        # When
+        expectation_values = measurements.get_expectation_values(ising_operator)
+
+        # Then
+        for i, (term_i, coefficient_i) in enumerate(terms):
+            qubits_i = set(qubit for qubit, _ in term_i)
+            assert expectation_values.values[i] == pytest.approx(
+                coefficient_i
+                * get_expectation_value_from_frequencies(qubits_i, frequencies)
+            )
+            for j, (term_j, coefficient_j) in enumerate(terms):
+                qubits_j = set(qubit for qubit, _ in term_j)
+                assert expectation_values.correlations[0][i, j] == pytest.approx(
+                    coefficient_i
+                    * coefficient_j
+                    * get_expectation_value_from_frequencies(
+                        qubits_i.symmetric_difference(qubits_j), frequencies
+                    )
+                )
+
+    def test_get_expectation_values_raises_error_for_operator_on_unmeasured_qubit(
+        self,
+    ):
+        measurements = Measurements([(0, 1), (1, 1)])
+
+        with pytest.raises(ValueError):
+            measurements.get_expectation_values(IsingOperator("[Z2]"))
+
+    def test_operator_can_be_measured_repeatedly_with_different_numbers_of_qubits(
+        self,
+    ):
+        ising_operator = IsingOperator("[Z0 Z1] + 2[Z1]")
+
+        for _ in range(2):
+            two_qubit_values = Measurements([(0, 1), (1, 1)]).get_expectation_values(
+                ising_operator
+            )
+            three_qubit_values = Measurements([(0, 1, 0)]).get_expectation_values(
+                ising_operator
+            )
+
+            np.testing.assert_allclose(two_qubit_values.values, [0, -2])
+            np.testing.assert_allclose(three_qubit_values.values, [-1, -2])
+
+        with pytest.raises(ValueError):
+            Measurements([(0,)]).get_expectation_values(ising_operator)
+
     @pytest.mark.parametrize(
         "bitstring_distribution, number_of_samples",
         [
@@ -777,6 +1111,27 @@ class TestMeasurements:
         )
         assert len(measurements.bitstrings) == number_of_samples
 
+    def test_get_measurements_representing_empty_distribution_is_empty(self):
+        bitstring_distribution = BitstringDistribution({"0": 1.0})
+        bitstring_distribution.distribution_dict = {}
+
+        measurements = Measurements.get_measurements_representing_distribution(
+            bitstring_distribution, 10
+        )
+
+        assert measurements.n_samples == 0
+        assert measurements.get_counts() == {}
+
+    def test_get_measurements_representing_distribution_with_no_samples_is_empty(
+        self,
+    ):
+        measurements = Measurements.get_measurements_representing_distribution(
+            BitstringDistribution({"01": 0.3, "11": 0.7}), 0
+        )
+
+        assert measurements.n_samples == 0
+        assert measurements.bitstrings == []
+
     @pytest.mark.parametrize(
         "bitstring_distribution, number_of_samples, expected_counts",
         [
@@ -835,6 +1190,36 @@ class TestMeasurements:
                 break
         assert got_different_measurements
 
+    def test_get_measurements_representing_distribution_is_deterministic_with_seed(
+        self,
+    ):
+        bitstring_distribution = BitstringDistribution(
+            {"00": 0.25, "01": 0.25, "10": 0.25, "11": 0.25}
+        )
+
+        counts = [
+            Measurements.get_measurements_representing_distribution(
+                bitstring_distribution, 10, seed=RNDSEED
+            ).get_counts()
+            for _ in range(5)
+        ]
+
+        assert all(counts[0] == other_counts for other_counts in counts[1:])
+        assert sorted(counts[0].values()) == [2, 2, 3, 3]
+
+    def test_get_measurements_representing_distribution_gives_largest_remainders(
+        self,
+    ):
+        bitstring_distribution = BitstringDistribution(
+            {"00": 0.48, "01": 0.27, "10": 0.14, "11": 0.11}
+        )
+
+        measurements = Measurements.get_measurements_representing_distribution(
+            bitstring_distribution, 10
+        )
+
+        assert measurements.get_counts() == {"00": 5, "01": 3, "10": 1, "11": 1}
+
     @pytest.mark.parametrize(
         "bitstring_distribution",
         [
@@ -857,3 +1242,74 @@ class TestMeasurements:
         counts = measurements.get_counts()
         for bitstring, probability in bitstring_distribution.distribution_dict.items():
             assert probability * number_of_samples == counts[bitstring]
+
+
+class TestMeasurementsAccumulator:
+    def test_expectation_values_match_measurements_after_adding_batches(self):
+        # Given
+        rng = np.random.default_rng(RNDSEED)
+        ising_operator = IsingOperator("10[] + [Z0 Z1] - 15[Z1 Z2] + 0.5[Z0]")
+        batches = [
+            Measurements([tuple(row) for row in rng.integers(0, 2, size=(n, 3))])
+            for n in (7, 20, 13)
+        ]
+        all_measurements = Measurements(
+            sum((batch.bitstrings for batch in batches), [])
+        )
+        accumulator = MeasurementsAccumulator(ising_operator)
+
+        # When
+        for batch in batches:
+            accumulator.add_measurements(batch)
+        expectation_values = accumulator.get_expectation_values()
+
+        # Then
+        target = all_measurements.get_expectation_values(ising_operator)
+        assert accumulator.n_samples == 40
+        assert accumulator.get_counts() == all_measurements.get_counts()
+        np.testing.assert_allclose(expectation_values.values, target.values)
+        np.testing.assert_allclose(
+            expectation_values.correlations[0], target.correlations[0]
+        )
+        np.testing.assert_allclose(
+            expectation_values.estimator_covariances[0],
+            target.estimator_covariances[0],
+        )
+
+    def test_add_counts_updates_expectation_values(self):
+        # Given
+        accumulator = MeasurementsAccumulator(IsingOperator("[Z0] + 2[Z1]"))
+
+        # When
+        accumulator.add_counts({"00": 3})
+        accumulator.add_counts({"01": 1})
+
+        # Then
+        np.testing.assert_allclose(
+            accumulator.get_expectation_values().values, [1.0, 1.0]
+        )
+
+    def test_rejected_counts_do_not_change_the_accumulator(self):
+        # Given
+        accumulator = MeasurementsAccumulator(IsingOperator("[Z0] + 2[Z2]"))
+
+        # When
+        with pytest.raises(ValueError):
+            accumulator.add_counts({"00": 3})
+        accumulator.add_counts({"001": 1})
+
+        # Then
+        assert accumulator.n_samples == 1
+        np.testing.assert_allclose(
+            accumulator.get_expectation_values().values, [1.0, -2.0]
+        )
+
+    def test_getting_expectation_values_without_measurements_raises_error(self):
+        accumulator = MeasurementsAccumulator(IsingOperator("[Z0]"))
+
+        with pytest.raises(ValueError):
+            accumulator.get_expectation_values()
+
+    def test_non_ising_operator_raises_type_error(self):
+        with pytest.raises(TypeError):
+            MeasurementsAccumulator(QubitOperator("X0"))
@@ -0,0 +1,182 @@
+import numpy as np
+import pytest
+from openfermion import QubitOperator
+from zquantum.core.circuits import (
+    CNOT,
+    RX,
+    RY,
+    RZ,
+    XX,
+    Circuit,
+    H,
+    MultiPhaseOperation,
+    X,
+)
+from zquantum.core.interfaces.backend_test import (
+    QuantumSimulatorGatesTest,
+    QuantumSimulatorTests,
+)
+from zquantum.core.simulators import (
+    AmplitudeDampingChannel,
+    DensityMatrixSimulator,
+    DephasingChannel,
+    DepolarizingChannel,
+    NoiseModel,
+    ReadoutError,
+    StatevectorSimulator,
+)
+
+
+@pytest.fixture
+def backend():
+    return DensityMatrixSimulator(seed=1234)
+
+
+@pytest.fixture
+def wf_simulator():
+    return DensityMatrixSimulator(seed=1234)
+
+
+class TestDensityMatrixSimulator(QuantumSimulatorTests):
+    pass
+
+
+class TestDensityMatrixSimulatorGates(QuantumSimulatorGatesTest):
+    pass
+
+
+NOISY_SIMULATOR = DensityMatrixSimulator(
+    noise_model=NoiseModel(
+        (
+            DepolarizingChannel(0.05),
+            AmplitudeDampingChannel(0.1),
+            DephasingChannel(0.02),
+        )
+    )
+)
+
+EXAMPLE_CIRCUITS = [
+    Circuit([H(0), CNOT(0, 2), RX(0.3)(1), RY(-0.7)(2)]),
+    Circuit([H(1), XX(0.5)(2, 0), RZ(1.1)(0), CNOT(2, 1)]),
+    Circuit([H(0), H(1), MultiPhaseOperation((0.1, 0.2, 0.3, 0.4)), CNOT(1, 0)]),
+]
+
+
+@pytest.mark.parametrize("circuit", EXAMPLE_CIRCUITS)
+def test_noiseless_density_matrix_is_projector_on_wavefunction(circuit):
+    amplitudes = StatevectorSimulator().get_wavefunction(circuit).amplitudes
+
+    density_matrix = DensityMatrixSimulator().get_density_matrix(circuit)
+
+    np.testing.assert_allclose(
+        density_matrix, np.outer(amplitudes, amplitudes.conj()), atol=1e-12
+    )
+
+
+@pytest.mark.parametrize("circuit", EXAMPLE_CIRCUITS)
+def test_noisy_density_matrix_is_a_valid_state(circuit):
+    density_matrix = NOISY_SIMULATOR.get_density_matrix(circuit)
+
+    assert np.trace(density_matrix) == pytest.approx(1)
+    np.testing.assert_allclose(density_matrix, density_matrix.conj().T, atol=1e-12)
+    assert np.all(np.linalg.eigvalsh(density_matrix) > -1e-12)
+    assert np.real(np.trace(density_matrix @ density_matrix)) < 1
+
+
+@pytest.mark.parametrize(
+    "channel,expected_density_matrix",
+    [
+        (DepolarizingChannel(0.2), [[0.5, 0.4], [0.4, 0.5]]),
+        (DephasingChannel(0.2), [[0.5, 0.3], [0.3, 0.5]]),
+        (
+            AmplitudeDampingChannel(0.36),
+            [[0.5 + 0.18, 0.4], [0.4, 0.5 - 0.18]],
+        ),
+    ],
+)
+def test_channels_are_applied_after_gates(channel, expected_density_matrix):
+    simulator = DensityMatrixSimulator(noise_model=NoiseModel((channel,)))
+
+    density_matrix = simulator.get_density_matrix(Circuit([H(0)]))
+
+    np.testing.assert_allclose(density_matrix, expected_density_matrix, atol=1e-12)
+
+
+def test_channels_act_only_on_qubits_of_gates():
+    simulator = DensityMatrixSimulator(noise_model=NoiseModel((DephasingChannel(0.1),)))
+
+    expectation_values = simulator.get_exact_expectation_values(
+        Circuit([H(0), H(1), CNOT(1, 2)]), QubitOperator("X0")
+    )
+
+    # Qubit 0 is dephased only once, right after the Hadamard gate.
+    assert expectation_values.values[0] == pytest.approx(0.8)
+
+
+def test_exact_expectation_values_include_noise():
+    simulator = DensityMatrixSimulator(
+        noise_model=NoiseModel((DepolarizingChannel(0.2),))
+    )
+    operator = QubitOperator("X0") + 0.5 * QubitOperator("Z1") + QubitOperator("")
+
+    expectation_values = simulator.get_exact_expectation_values(
+        Circuit([H(0), X(1)]), operator
+    )
+
+    np.testing.assert_allclose(expectation_values.values, [0.8, -0.4, 1])
+
+
+def test_noiseless_exact_expectation_values_match_statevector_simulator():
+    circuit = EXAMPLE_CIRCUITS[1]
+    operator = QubitOperator("X0 Y1 Z2") + 0.5 * QubitOperator("Y2 Y0")
+
+    np.testing.assert_allclose(
+        DensityMatrixSimulator().get_exact_expectation_values(circuit, operator).values,
+        StatevectorSimulator().get_exact_expectation_values(circuit, operator).values,
+        atol=1e-12,
+    )
+
+
+def test_readout_error_is_applied_to_sampled_measurements():
+    simulator = DensityMatrixSimulator(
+        noise_model=NoiseModel(readout_error=ReadoutError(0.1, 0.3)), seed=42
+    )
+
+    measurements = simulator.run_circuit_and_measure(
+        Circuit([X(0), RX(0)(1)]), n_samples=10000
+    )
+
+    counts = measurements.get_counts()
+    assert counts["00"] / 10000 == pytest.approx(0.3 * 0.9, abs=0.02)
+    assert counts["10"] / 10000 == pytest.approx(0.7 * 0.9, abs=0.02)
+    assert counts["01"] / 10000 == pytest.approx(0.3 * 0.1, abs=0.02)
+    assert counts["11"] / 10000 == pytest.approx(0.7 * 0.1, abs=0.02)
+
+
+def test_exact_bitstring_distribution_includes_gate_channels():
+    simulator = DensityMatrixSimulator(
+        noise_model=NoiseModel((DepolarizingChannel(0.2),))
+    )
+
+    distribution = simulator.get_bitstring_distribution(Circuit([X(0), RX(0)(1)]))
+
+    assert distribution.distribution_dict == pytest.approx(
+        {"00": 0.09, "10": 0.81, "01": 0.01, "11": 0.09}
+    )
+
+
+def test_exact_bitstring_distribution_includes_readout_error():
+    simulator = DensityMatrixSimulator(
+        noise_model=NoiseModel(readout_error=ReadoutError(0.1, 0.3))
+    )
+
+    distribution = simulator.get_bitstring_distribution(Circuit([X(0), RX(0)(1)]))
+
+    assert distribution.distribution_dict == pytest.approx(
+        {"00": 0.3 * 0.9, "10": 0.7 * 0.9, "01": 0.3 * 0.1, "11": 0.7 * 0.1}
+    )
+
+
+def test_wavefunction_is_not_available_for_noisy_circuits():
+    with pytest.raises(ValueError):
+        NOISY_SIMULATOR.get_wavefunction(Circuit([H(0)]))
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+from zquantum.core.simulators import (
+    AmplitudeDampingChannel,
+    DephasingChannel,
+    DepolarizingChannel,
+    NoiseModel,
+    ReadoutError,
+)
+from zquantum.core.simulators._noise import get_superoperator
+from zquantum.core.utils import load_noise_model, save_noise_model
+
+EXAMPLE_CHANNELS = [
+    DepolarizingChannel(0.1),
+    AmplitudeDampingChannel(0.3),
+    DephasingChannel(0.05),
+]
+
+
+@pytest.mark.parametrize("channel", EXAMPLE_CHANNELS)
+def test_kraus_operators_of_channels_are_trace_preserving(channel):
+    np.testing.assert_allclose(
+        sum(operator.conj().T @ operator for operator in channel.kraus_operators),
+        np.eye(2),
+        atol=1e-12,
+    )
+
+
+@pytest.mark.parametrize("channel", EXAMPLE_CHANNELS)
+def test_superoperator_acts_on_row_and_column_qubits(channel):
+    density_matrix = np.array([[0.3, 0.2 - 0.1j], [0.2 + 0.1j, 0.7]])
+
+    result = get_superoperator(channel) @ density_matrix.reshape(-1)
+
+    np.testing.assert_allclose(
+        result.reshape(2, 2),
+        sum(
+            operator @ density_matrix @ operator.conj().T
+            for operator in channel.kraus_operators
+        ),
+        atol=1e-12,
+    )
+
+
+@pytest.mark.parametrize(
+    "create_invalid_object",
+    [
+        lambda: DepolarizingChannel(1.5),
+        lambda: AmplitudeDampingChannel(-0.1),
+        lambda: DephasingChannel(2),
+        lambda: ReadoutError(0.1, 1.1),
+    ],
+)
+def test_probabilities_outside_of_unit_interval_are_rejected(create_invalid_object):
+    with pytest.raises(ValueError):
+        create_invalid_object()
+
+
+def test_noise_model_can_be_saved_and_loaded(tmp_path):
+    noise_model = NoiseModel(tuple(EXAMPLE_CHANNELS), ReadoutError(0.01, 0.02))
+    filename = tmp_path / "noise_model.json"
+
+    save_noise_model(
+        noise_model.to_dict(),
+        "zquantum.core.simulators",
+        "create_noise_model",
+        str(filename),
+    )
+
+    assert load_noise_model(str(filename)) == noise_model
+
+
+def test_noise_model_without_readout_error_can_be_converted_to_dict_and_back():
+    noise_model = NoiseModel((DepolarizingChannel(0.1),))
+
+    assert NoiseModel.from_dict(noise_model.to_dict()) == noise_model
+
+
+def test_unknown_channels_are_rejected():
+    with pytest.raises(ValueError):
+        NoiseModel.from_dict({"gate_channels": [{"name": "bit_flip", "p": 0.1}]})
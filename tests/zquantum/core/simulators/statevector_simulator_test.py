@@ -0,0 +1,303 @@
+import numpy as np
+import pytest
+import sympy
+from openfermion import IsingOperator, QubitOperator
+from pyquil.wavefunction import Wavefunction
+from zquantum.core.circuits import (
+    CNOT,
+    RX,
+    RY,
+    RZ,
+    SWAP,
+    XX,
+    Circuit,
+    CustomGateDefinition,
+    H,
+    MultiPhaseOperation,
+    T,
+    X,
+)
+from zquantum.core.cost_function import get_ground_state_cost_function
+from zquantum.core.estimation import (
+    calculate_exact_expectation_values,
+    group_individually,
+    perform_context_selection,
+)
+from zquantum.core.gradients import (
+    finite_differences_gradient,
+    parameter_shift_gradient,
+)
+from zquantum.core.interfaces.backend_test import (
+    QuantumSimulatorGatesTest,
+    QuantumSimulatorTests,
+)
+from zquantum.core.openfermion import get_expectation_value
+from zquantum.core.simulators import StatevectorSimulator
+
+
+@pytest.fixture
+def backend():
+    return StatevectorSimulator(seed=1234)
+
+
+@pytest.fixture
+def wf_simulator():
+    return StatevectorSimulator(seed=1234)
+
+
+class TestStatevectorSimulator(QuantumSimulatorTests):
+    pass
+
+
+class TestStatevectorSimulatorGates(QuantumSimulatorGatesTest):
+    pass
+
+
+def _get_wavefunction_from_unitary(circuit):
+    # Circuit.to_unitary treats qubit 0 as the most significant one.
+    amplitudes = np.asarray(circuit.to_unitary(), dtype=complex)[:, 0]
+    return amplitudes.reshape((2,) * circuit.n_qubits).T.reshape(-1)
+
+
+CUSTOM_GATE = CustomGateDefinition(
+    "custom_gate",
+    sympy.Matrix(
+        [
+            [sympy.cos(0.3), 0, 0, -1j * sympy.sin(0.3)],
+            [0, 1, 0, 0],
+            [0, 0, 1, 0],
+            [-1j * sympy.sin(0.3), 0, 0, sympy.cos(0.3)],
+        ]
+    ),
+    tuple(),
+)
+
+
+@pytest.mark.parametrize(
+    "circuit",
+    [
+        Circuit([H(0), CNOT(0, 2), RX(0.3)(1), RY(-0.7)(2), SWAP(0, 1)]),
+        Circuit([H(1), XX(0.5)(2, 0), RZ(1.1)(0), T.dagger(2), CNOT(2, 1)]),
+        Circuit([H(0), H(2), RY(0.4).controlled(2)(0, 2, 1), X.controlled(1)(1, 3)]),
+        Circuit([H(0), RX(0.2)(3), CUSTOM_GATE()(3, 1), CUSTOM_GATE().dagger(0, 2)]),
+    ],
+)
+def test_wavefunction_matches_unitary_of_circuit(circuit):
+    wavefunction = StatevectorSimulator().get_wavefunction(circuit)
+
+    np.testing.assert_allclose(
+        wavefunction.amplitudes, _get_wavefunction_from_unitary(circuit), atol=1e-12
+    )
+
+
+def test_multi_phase_operation_is_applied_to_wavefunction():
+    phases = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8)
+    circuit = Circuit([H(0), H(1), H(2), MultiPhaseOperation(phases), H(1)])
+
+    wavefunction = StatevectorSimulator().get_wavefunction(circuit)
+
+    # Phases are applied in the order of amplitudes of the wavefunction, the final
+    # H(1) is applied through the unitary, which uses the reversed order of qubits.
+    phased_amplitudes = np.exp(1j * np.array(phases)) / np.sqrt(8)
+    unitary = np.asarray(Circuit([H(1)], n_qubits=3).to_unitary(), dtype=complex)
+    expected_amplitudes = unitary @ phased_amplitudes.reshape(2, 2, 2).T.reshape(-1)
+    np.testing.assert_allclose(
+        wavefunction.amplitudes,
+        expected_amplitudes.reshape(2, 2, 2).T.reshape(-1),
+        atol=1e-12,
+    )
+
+
+@pytest.mark.parametrize(
+    "operator",
+    [
+        QubitOperator("X0 Y1 Z3") + 0.5 * QubitOperator("Y2 Y0") + QubitOperator(""),
+        IsingOperator("[Z0 Z1] + 2[Z2] - [Z3 Z0]"),
+    ],
+)
+def test_exact_expectation_values_match_expectation_values_from_wavefunction(
+    operator,
+):
+    circuit = Circuit(
+        [H(0), RY(0.3)(1), CNOT(0, 2), RX(-0.4)(3), XX(0.7)(1, 3), RZ(0.2)(2)]
+    )
+    simulator = StatevectorSimulator()
+    wavefunction = simulator.get_wavefunction(circuit)
+
+    expectation_values = simulator.get_exact_expectation_values(circuit, operator)
+
+    np.testing.assert_allclose(
+        expectation_values.values,
+        [np.real(get_expectation_value(term, wavefunction)) for term in operator],
+        atol=1e-12,
+    )
+
+
+def test_sampled_bitstrings_follow_wavefunction():
+    circuit = Circuit([RY(2 * np.arccos(np.sqrt(0.8)))(0), CNOT(0, 1), X(2)])
+
+    measurements = StatevectorSimulator(seed=42).run_circuit_and_measure(
+        circuit, n_samples=10000
+    )
+
+    counts = measurements.get_counts()
+    assert set(counts) == {"001", "111"}
+    assert counts["001"] / 10000 == pytest.approx(0.8, abs=0.02)
+
+
+def test_simulates_many_qubits():
+    n_qubits = 20
+    circuit = Circuit([H(0)] + [CNOT(0, qubit) for qubit in range(1, n_qubits)])
+
+    wavefunction = StatevectorSimulator().get_wavefunction(circuit)
+
+    assert isinstance(wavefunction, Wavefunction)
+    assert wavefunction.amplitudes[0] == pytest.approx(1 / np.sqrt(2))
+    assert wavefunction.amplitudes[-1] == pytest.approx(1 / np.sqrt(2))
+
+
+def test_raises_for_circuits_with_free_symbols():
+    with pytest.raises(ValueError):
+        StatevectorSimulator().get_wavefunction(Circuit([RX(sympy.Symbol("a"))(0)]))
+
+
+def test_raises_for_noise_models():
+    with pytest.raises(ValueError):
+        StatevectorSimulator(noise_model="noise")
+
+
+def test_ground_state_cost_function_can_be_evaluated_with_simulator():
+    alpha, beta = sympy.symbols("alpha beta")
+    circuit = Circuit([RY(alpha)(0), CNOT(0, 1), RX(beta)(1)])
+    operator = QubitOperator("Z0 Z1") + QubitOperator("X0") + 0.5 * QubitOperator("Y1")
+    cost_function = get_ground_state_cost_function(
+        operator,
+        circuit,
+        StatevectorSimulator(),
+        estimation_method=calculate_exact_expectation_values,
+        estimation_preprocessors=[group_individually, perform_context_selection],
+        gradient_function=parameter_shift_gradient,
+    )
+    parameters = np.array([0.3, -0.8])
+
+    wavefunction = Wavefunction(
+        _get_wavefunction_from_unitary(
+            circuit.bind({alpha: parameters[0], beta: parameters[1]})
+        )
+    )
+    assert cost_function(parameters) == pytest.approx(
+        np.real(get_expectation_value(operator, wavefunction))
+    )
+    np.testing.assert_allclose(
+        cost_function.gradient(parameters),
+        finite_differences_gradient(cost_function)(parameters),
+        atol=1e-7,
+    )
+
+
+class TestSimulationForParameterMatrix:
+    @pytest.fixture
+    def symbols(self):
+        return sympy.symbols("alpha beta gamma")
+
+    @pytest.fixture
+    def circuit(self, symbols):
+        alpha, beta, gamma = symbols
+        return Circuit(
+            [
+                H(0),
+                RX(alpha)(1),
+                CNOT(0, 2),
+                RY(2 * beta - alpha)(2),
+                XX(gamma)(2, 0),
+                RZ(0.4)(1),
+                RY(beta).controlled(1)(1, 0),
+                RZ(alpha).dagger(2),
+            ]
+        )
+
+    @pytest.fixture
+    def parameter_matrix(self):
+        return np.random.default_rng(7).uniform(-np.pi, np.pi, size=(5, 3))
+
+    def test_wavefunctions_match_wavefunctions_of_bound_circuits(
+        self, symbols, circuit, parameter_matrix
+    ):
+        simulator = StatevectorSimulator()
+
+        wavefunctions = simulator.get_wavefunctions_for_parameter_matrix(
+            circuit, symbols, parameter_matrix
+        )
+
+        assert len(wavefunctions) == len(parameter_matrix)
+        for wavefunction, parameters in zip(wavefunctions, parameter_matrix):
+            bound_circuit = circuit.bind(dict(zip(symbols, parameters)))
+            np.testing.assert_allclose(
+                wavefunction.amplitudes,
+                simulator.get_wavefunction(bound_circuit).amplitudes,
+                atol=1e-12,
+            )
+
+    def test_exact_expectation_values_match_those_of_bound_circuits(
+        self, symbols, circuit, parameter_matrix
+    ):
+        operator = (
+            QubitOperator("X0 Y1 Z2") + 0.5 * QubitOperator("Z1") + QubitOperator("")
+        )
+        simulator = StatevectorSimulator()
+
+        expectation_values = (
+            simulator.get_exact_expectation_values_for_parameter_matrix(
+                circuit, operator, symbols, parameter_matrix
+            )
+        )
+
+        assert len(expectation_values) == len(parameter_matrix)
+        for values, parameters in zip(expectation_values, parameter_matrix):
+            bound_circuit = circuit.bind(dict(zip(symbols, parameters)))
+            np.testing.assert_allclose(
+                values.values,
+                simulator.get_exact_expectation_values(bound_circuit, operator).values,
+                atol=1e-12,
+            )
+
+    def test_parametrized_multi_phase_operation_is_applied_to_each_binding(self):
+        alpha = sympy.Symbol("alpha")
+        circuit = Circuit([H(0), MultiPhaseOperation((alpha, 2 * alpha)), H(0)])
+        parameter_matrix = np.array([[0.0], [0.5], [np.pi]])
+        simulator = StatevectorSimulator()
+
+        wavefunctions = simulator.get_wavefunctions_for_parameter_matrix(
+            circuit, [alpha], parameter_matrix
+        )
+
+        for wavefunction, (value,) in zip(wavefunctions, parameter_matrix):
+            np.testing.assert_allclose(
+                wavefunction.amplitudes,
+                simulator.get_wavefunction(circuit.bind({alpha: value})).amplitudes,
+                atol=1e-12,
+            )
+
+    def test_counts_each_binding_as_a_circuit_run_in_a_single_job(
+        self, symbols, circuit, parameter_matrix
+    ):
+        simulator = StatevectorSimulator()
+
+        simulator.get_wavefunctions_for_parameter_matrix(
+            circuit, symbols, parameter_matrix
+        )
+
+        assert simulator.number_of_circuits_run == len(parameter_matrix)
+        assert simulator.number_of_jobs_run == 1
+
+    def test_raises_if_free_symbols_are_not_bound(self, symbols, circuit):
+        with pytest.raises(ValueError):
+            StatevectorSimulator().get_wavefunctions_for_parameter_matrix(
+                circuit, symbols[:2], np.zeros((3, 2))
+            )
+
+    def test_raises_if_number_of_columns_does_not_match_symbols(self, symbols, circuit):
+        with pytest.raises(ValueError):
+            StatevectorSimulator().get_wavefunctions_for_parameter_matrix(
+                circuit, symbols, np.zeros((3, 2))
+            )
@@ -28,6 +28,7 @@ from zquantum.core.utils import (
     load_nmeas_estimate,
     load_noise_model,
     load_value_estimate,
+    sample_counts_from_probabilities,
     sample_from_probability_distribution,
     save_generic_dict,
     save_list,
@@ -105,6 +106,29 @@ class TestUtils:
         counts = sample_from_probability_distribution(distribution, number_of_samples)
         assert sum(counts.values()) == number_of_samples
 
+    def test_sample_from_probability_distribution_is_reproducible_with_seed(self):
+        distribution = {"00": 0.1, "01": 0.2, "10": 0.3, "11": 0.4}
+
+        first_counts = sample_from_probability_distribution(distribution, 1000, 42)
+        second_counts = sample_from_probability_distribution(distribution, 1000, 42)
+
+        assert first_counts == second_counts
+
+    def test_sample_counts_from_probabilities_gives_counts_for_every_event(self):
+        probabilities = np.array([0.0, 0.25, 0.0, 0.75])
+
+        counts = sample_counts_from_probabilities(
+            probabilities, 1000, np.random.default_rng(RNDSEED)
+        )
+
+        assert counts.shape == (4,)
+        assert counts.sum() == 1000
+        assert counts[0] == counts[2] == 0
+
+    def test_sample_counts_from_probabilities_raises_error_for_negative_values(self):
+        with pytest.raises(ValueError):
+            sample_counts_from_probabilities(np.array([-0.5, 1.5]), 10)
+
     def test_convert_bitstrings_to_tuples(self):
         pass
 